@@ -15,6 +15,7 @@ import bpy
 
 from . src import panels, preferences
 from . src.keymap import register_keymaps, unregister_keymaps
+from . src.renderer import texture_cache
 
 bl_info = { # type: ignore
     "name": "Navigation Puck Addon",
@@ -40,12 +41,14 @@ def register():
         bpy.utils.register_class(cls)
 
     register_keymaps()
+    texture_cache.register()
     panels.register()
 
 
 def unregister():
     """Unregister all components of the addon."""
     panels.unregister()
+    texture_cache.unregister()
     unregister_keymaps()
 
     for cls in reversed(classes):
@@ -11,6 +11,10 @@ DEFAULT_ACTIVATION_MODE = ACTIVATION_HOTKEY_MENU
 
 OVERLAY_ACTIVATION_MODES = {ACTIVATION_SHORTCUT_BUTTON, ACTIVATION_DIRECT_MENU}
 
+OVERLAY_DRAW_REGION = 'REGION'
+OVERLAY_DRAW_CURSOR = 'CURSOR'
+DEFAULT_OVERLAY_DRAW_MODE = OVERLAY_DRAW_REGION
+
 MODIFIER_KEY_STATE_ATTRS = {
     'LEFT_SHIFT': 'shift',
     'RIGHT_SHIFT': 'shift',
@@ -36,6 +40,11 @@ def get_activation_mode(context: bpy.types.Context) -> str:
     return str(getattr(prefs, "activation_mode", DEFAULT_ACTIVATION_MODE))
 
 
+def uses_cursor_overlay_drawing(context: bpy.types.Context) -> bool:
+    prefs = get_addon_preferences(context)
+    return str(getattr(prefs, "overlay_draw_mode", DEFAULT_OVERLAY_DRAW_MODE)) == OVERLAY_DRAW_CURSOR
+
+
 def uses_overlay_activation(context: bpy.types.Context) -> bool:
     return get_activation_mode(context) in OVERLAY_ACTIVATION_MODES
 
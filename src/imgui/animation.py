@@ -0,0 +1,176 @@
+"""
+Tweens overlay properties from a single `bpy.app.timers` callback.
+
+The timer only runs while a tween is in progress: it is registered by the
+first `animate` call and unregisters itself once every tween has finished, so
+an idle overlay costs nothing between events.
+"""
+import dataclasses
+import time
+import typing
+
+import bpy
+
+DEFAULT_ANIMATION_FPS = 60.0
+
+Easing = typing.Callable[[float], float]
+TweenValue = float | tuple[float, ...]
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1.0 - (1.0 - t) ** 3
+
+
+def _snapshot(value: typing.Any) -> TweenValue:
+    """Copy of an animatable value; vectors become tuples so later in-place edits do not leak in"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return tuple(float(component) for component in value)
+
+
+def _lerp(start: TweenValue, end: TweenValue, t: float) -> TweenValue:
+    if isinstance(start, float) and isinstance(end, float):
+        return start + (end - start) * t
+    return tuple(a + (b - a) * t for a, b in zip(start, end))  # type: ignore
+
+
+def _assign(target: typing.Any, attribute: str, value: TweenValue) -> None:
+    """Set a float attribute, or write a vector attribute in place so shared references stay valid"""
+    if isinstance(value, float):
+        setattr(target, attribute, value)
+    else:
+        getattr(target, attribute)[:] = value
+
+
+@dataclasses.dataclass(slots=True)
+class Tween:
+    target: typing.Any
+    attribute: str
+    start: TweenValue
+    end: TweenValue
+    start_time: float
+    duration: float
+    redraw: typing.Callable[[], None] | None = None
+    easing: Easing = ease_out_cubic
+
+    def value_at(self, now: float) -> tuple[TweenValue, bool]:
+        """Value at time `now`, and whether the tween has reached its end"""
+        t = (now - self.start_time) / self.duration if self.duration > 0.0 else 1.0
+        if t >= 1.0:
+            return self.end, True
+        return _lerp(self.start, self.end, self.easing(max(t, 0.0))), False
+
+
+class AnimationScheduler:
+    """
+    Tweens attributes of overlay objects towards target values
+
+    Every tween can name a `redraw` callback (usually tagging the area that
+    draws the animated object); each tick calls the distinct callbacks of the
+    tweens that advanced, so only the regions with running animations are
+    redrawn. Ticks run at most `fps` times per second.
+    """
+
+    def __init__(self, fps: float = DEFAULT_ANIMATION_FPS) -> None:
+        self.fps = fps
+        self.tweens: dict[tuple[int, str], Tween] = {}
+        self.running = False
+        # `bpy.app.timers` identifies a timer by the callback object, so bind it once
+        self._tick_callback = self._tick
+
+    def animate(
+        self,
+        target: typing.Any,
+        attribute: str,
+        value: typing.Any,
+        duration: float,
+        redraw: typing.Callable[[], None] | None = None,
+        easing: Easing = ease_out_cubic,
+    ) -> None:
+        """
+        Tween `target.attribute` from its current value to `value`
+
+        A tween already heading to `value` keeps its timing; one heading
+        elsewhere restarts from the current value.
+        """
+        key = (id(target), attribute)
+        end = _snapshot(value)
+        tween = self.tweens.get(key)
+        if tween is not None and tween.end == end:
+            return
+
+        start = _snapshot(getattr(target, attribute))
+        if duration <= 0.0 or start == end:
+            self.tweens.pop(key, None)
+            _assign(target, attribute, end)
+            return
+
+        self.tweens[key] = Tween(target, attribute, start, end, time.perf_counter(), duration, redraw, easing)
+        self._start()
+
+    def cancel(self, target: typing.Any, attribute: str | None = None) -> None:
+        """Stop the tweens of `target` where they are; all of them when `attribute` is None"""
+        for key in [key for key, tween in self.tweens.items() if tween.target is target]:
+            if attribute is None or key[1] == attribute:
+                del self.tweens[key]
+
+    def is_animating(self, target: typing.Any, attribute: str | None = None) -> bool:
+        return any(
+            tween.target is target and (attribute is None or tween.attribute == attribute)
+            for tween in self.tweens.values()
+        )
+
+    def stop(self) -> None:
+        """Drop every tween and unregister the timer"""
+        self.tweens.clear()
+        if bpy.app.timers.is_registered(self._tick_callback):
+            bpy.app.timers.unregister(self._tick_callback)
+        self.running = False
+
+    def _start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        bpy.app.timers.register(self._tick_callback, first_interval=0.0, persistent=True)
+
+    def _tick(self) -> float | None:
+        try:
+            self._advance()
+        except Exception as ex:
+            # Blender drops a timer whose callback raised; the next `animate` starts a new one
+            print(f"Animation tick failed: {ex}")
+            self.tweens.clear()
+
+        if not self.tweens:
+            self.running = False
+            return None
+        return 1.0 / self.fps
+
+    def _advance(self) -> None:
+        """Move every tween to the current time; a tween or redraw that fails is dropped alone"""
+        now = time.perf_counter()
+        redraws: list[typing.Callable[[], None]] = []
+        for key, tween in list(self.tweens.items()):
+            value, finished = tween.value_at(now)
+            try:
+                _assign(tween.target, tween.attribute, value)
+            except ReferenceError:
+                finished = True
+            except Exception as ex:
+                print(f"Animation of {tween.attribute!r} stopped: {ex}")
+                finished = True
+            if finished:
+                self.tweens.pop(key, None)
+            if tween.redraw is not None and tween.redraw not in redraws:
+                redraws.append(tween.redraw)
+
+        for redraw in redraws:
+            try:
+                redraw()
+            except ReferenceError:
+                pass
+            except Exception as ex:
+                print(f"Animation redraw failed: {ex}")
+
+
+animations = AnimationScheduler()
@@ -1,6 +1,7 @@
 import typing
 
 from .input_event import PointerEvent
+from .widget_id import WidgetId
 
 class DoubleClickTracker:
     """
@@ -20,38 +21,38 @@ class DoubleClickTracker:
     """
 
     def __init__(self, double_click_time: float = 0.5):
-        self.last_click_time: float | None = None
+        self.last_click_time: int | None = None
         self.last_click_pos: tuple[float, float] | None = None
-        self.last_click_id: typing.Optional[str] = None
+        self.last_click_id: typing.Optional[WidgetId] = None
         self.double_click_time = double_click_time  # seconds
         self.double_click_distance = 5  # pixels
 
     def _has_previous_click(self) -> bool:
         return bool(self.last_click_time and self.last_click_pos and self.last_click_id)
 
-    def _remember_click(self, widget_id: str | None, event: PointerEvent) -> None:
-        self.last_click_time = event.timestamp
-        self.last_click_pos = event.position
+    def _remember_click(self, widget_id: WidgetId | None, event: PointerEvent) -> None:
+        self.last_click_time = event.timestamp_ns
+        self.last_click_pos = (event.x, event.y)
         self.last_click_id = widget_id
 
-    def _matches_previous_click(self, widget_id: str | None, event: PointerEvent) -> bool:
+    def _matches_previous_click(self, widget_id: WidgetId | None, event: PointerEvent) -> bool:
         return (
             self.last_click_id == widget_id
-            and event.timestamp - self.last_click_time < self.double_click_time
+            and event.timestamp_ns - self.last_click_time < self.double_click_time * 1e9
             and (
-                (event.position[0] - self.last_click_pos[0]) ** 2
-                + (event.position[1] - self.last_click_pos[1]) ** 2
+                (event.x - self.last_click_pos[0]) ** 2
+                + (event.y - self.last_click_pos[1]) ** 2
             ) < self.double_click_distance ** 2
         )
 
-    def is_double_click(self, widget_id: str | None, event: PointerEvent) -> bool:
+    def is_double_click(self, widget_id: WidgetId | None, event: PointerEvent) -> bool:
         """Check if the current click is a double click"""
         if not self._has_previous_click():
             self._remember_click(widget_id, event)
             return False
 
         if self._matches_previous_click(widget_id, event):
-            self.last_click_time = event.timestamp
+            self.last_click_time = event.timestamp_ns
             return True
 
         self._remember_click(widget_id, event)
@@ -0,0 +1,89 @@
+"""
+Recognizes fast, straight pointer flicks from recent pointer samples.
+"""
+import collections
+import math
+
+FLICK_SAMPLE_COUNT = 6
+FLICK_WINDOW_NS = 80_000_000
+FLICK_MIN_SPEED = 700.0
+FLICK_MAX_DEVIATION = math.radians(20.0)
+
+
+class FlickRecognizer:
+    """
+    Tracks the last pointer samples of a drag and tells when its direction is settled
+
+    A drag is decisive once the pointer moves faster than `min_speed` pixels
+    per second over the last `window_ns`, and the recent velocity points the
+    same way (within `max_deviation` radians) as the whole drag so far. Until
+    then callers keep waiting for their distance threshold.
+    """
+
+    def __init__(
+        self,
+        min_speed: float = FLICK_MIN_SPEED,
+        max_deviation: float = FLICK_MAX_DEVIATION,
+        window_ns: int = FLICK_WINDOW_NS,
+    ) -> None:
+        self.min_speed = min_speed
+        self.max_deviation = max_deviation
+        self.window_ns = window_ns
+        self.origin = (0.0, 0.0)
+        self.samples: collections.deque[tuple[int, float, float]] = collections.deque(maxlen=FLICK_SAMPLE_COUNT)
+
+    def reset(self, x: float, y: float, timestamp_ns: int) -> None:
+        """Start a new drag at the pointer position"""
+        self.origin = (x, y)
+        self.samples.clear()
+        self.samples.append((timestamp_ns, x, y))
+
+    def add(self, x: float, y: float, timestamp_ns: int) -> None:
+        self.samples.append((timestamp_ns, x, y))
+
+    def velocity(self) -> tuple[float, float]:
+        """Pointer velocity in pixels per second over the recent samples"""
+        if not self.samples:
+            return (0.0, 0.0)
+        last_time, last_x, last_y = self.samples[-1]
+        first_time, first_x, first_y = next(
+            (sample for sample in self.samples if last_time - sample[0] <= self.window_ns),
+            self.samples[-1],
+        )
+        elapsed = (last_time - first_time) / 1e9
+        if elapsed <= 0.0:
+            return (0.0, 0.0)
+        return ((last_x - first_x) / elapsed, (last_y - first_y) / elapsed)
+
+    def speed(self) -> float:
+        return math.hypot(*self.velocity())
+
+    def displacement(self) -> tuple[float, float]:
+        """Pointer offset from the start of the drag"""
+        if not self.samples:
+            return (0.0, 0.0)
+        _, x, y = self.samples[-1]
+        return (x - self.origin[0], y - self.origin[1])
+
+    def is_decisive(self, min_distance: float) -> bool:
+        """Check if the drag moved `min_distance` pixels fast and straight enough to trust its direction"""
+        dx, dy = self.displacement()
+        distance = math.hypot(dx, dy)
+        if distance < min_distance or distance <= 0.0:
+            return False
+
+        vx, vy = self.velocity()
+        speed = math.hypot(vx, vy)
+        if speed < self.min_speed:
+            return False
+
+        cosine = (dx * vx + dy * vy) / (distance * speed)
+        return cosine >= math.cos(self.max_deviation)
+
+    def time_to_reach(self, distance: float) -> float:
+        """Seconds the drag needs, at its current speed, to get `distance` pixels from its origin"""
+        remaining = distance - math.hypot(*self.displacement())
+        speed = self.speed()
+        if remaining <= 0.0 or speed <= 0.0:
+            return 0.0
+        return remaining / speed
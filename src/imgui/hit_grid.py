@@ -0,0 +1,52 @@
+import math
+import typing
+
+from .rect import Rect
+from .widget_id import WidgetId
+
+
+HIT_GRID_CELL_SIZE = 64.0
+
+
+class HitGrid:
+    """
+    Uniform grid over the widget rects declared in one frame
+
+    Widgets are registered with `add` while the frame is built; `build` bins
+    them into square cells so `hits` only tests the rects of the cell under a
+    point instead of every widget.
+    """
+
+    def __init__(self, cell_size: float = HIT_GRID_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.rects: dict[WidgetId, Rect] = {}
+        self.cells: dict[tuple[int, int], list[WidgetId]] = {}
+
+    def clear(self) -> None:
+        self.rects.clear()
+        self.cells.clear()
+
+    def add(self, widget_id: WidgetId, rect: Rect) -> None:
+        """Register the rect of `widget_id`; the last rect registered for an id wins"""
+        self.rects[widget_id] = rect
+
+    def rect(self, widget_id: WidgetId) -> Rect | None:
+        return self.rects.get(widget_id)
+
+    def build(self) -> None:
+        """Bin the registered rects into cells"""
+        self.cells.clear()
+        for widget_id, rect in self.rects.items():
+            left, bottom = self._cell(rect.x, rect.y)
+            right, top = self._cell(rect.x + rect.width, rect.y + rect.height)
+            for cell_x in range(left, right + 1):
+                for cell_y in range(bottom, top + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append(widget_id)
+
+    def hits(self, x: float, y: float) -> tuple[WidgetId, ...]:
+        """Ids of the widgets whose rect contains the point, in registration order"""
+        candidates: typing.Iterable[WidgetId] = self.cells.get(self._cell(x, y), ())
+        return tuple(widget_id for widget_id in candidates if self.rects[widget_id].contains(x, y))
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
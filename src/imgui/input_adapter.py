@@ -4,14 +4,19 @@ import typing
 import bpy
 import mathutils
 
-from ..utils.view_math import event_drag_delta
-from .input_event import EventType, PointerButton, PointerEvent
+from .input_event import EventType, PointerButton, PointerEvent, PointerEventRing
 
 
 class InputEventAdapter:
-    """Adapter to convert Blender events to imgui events."""
+    """
+    Adapter to convert Blender events to imgui events.
+
+    Events are written into the records of `ring`, so converting does not
+    allocate; a returned event is overwritten `ring.capacity` events later.
+    """
 
     def __init__(self):
+        self.ring = PointerEventRing()
         self.mouse_pos = mathutils.Vector((0.0, 0.0))
         self.last_mouse_pos = mathutils.Vector((0.0, 0.0))
         self.mouse_delta = mathutils.Vector((0.0, 0.0))
@@ -27,16 +32,18 @@ class InputEventAdapter:
         if event_type == EventType.NONE:
             return None
 
-        pointer_event = PointerEvent(
-            event_type=event_type,
-            position=mathutils.Vector((event.mouse_region_x, event.mouse_region_y)),
-            button=button,
-            shift=event.shift,
-            ctrl=event.ctrl,
-            alt=event.alt,
-            delta=event_drag_delta(event),
-            timestamp=time.time(),
-        )
+        pointer_event = self.ring.next()
+        pointer_event.event_type = event_type
+        pointer_event.x = float(event.mouse_region_x)
+        pointer_event.y = float(event.mouse_region_y)
+        pointer_event.button = button
+        pointer_event.shift = event.shift
+        pointer_event.ctrl = event.ctrl
+        pointer_event.alt = event.alt
+        # Same convention as `event_drag_delta`, without the Vector
+        pointer_event.dx = float(event.mouse_prev_x - event.mouse_x)
+        pointer_event.dy = float(event.mouse_prev_y - event.mouse_y)
+        pointer_event.timestamp_ns = time.perf_counter_ns()
 
         if event_type == EventType.POINTER_UP and button == self.pointer_down:
             self.pointer_down = None
@@ -1,7 +1,6 @@
 import enum
 import dataclasses
 import typing
-import mathutils
 
 
 class EventType(enum.Enum):
@@ -24,19 +23,75 @@ class PointerButton(enum.Enum):
     MIDDLE_BUTTON = 'MIDDLEMOUSE'
 
 
-@dataclasses.dataclass
+POINTER_EVENT_RING_CAPACITY = 256
+
+
+@dataclasses.dataclass(slots=True)
 class PointerEvent:
-    """Represents an input event"""
-    event_type: EventType
-    position: mathutils.Vector = dataclasses.field(
-        default_factory=lambda: mathutils.Vector((0.0, 0.0))
-    )
+    """
+    Represents an input event
+
+    Plain floats and an integer `perf_counter_ns` timestamp, so a record can
+    be rewritten in place by `PointerEventRing` users without allocating.
+    `delta` follows `event_drag_delta` (previous minus current position).
+    """
+    event_type: EventType = EventType.NONE
+    x: float = 0.0
+    y: float = 0.0
     button: typing.Optional[PointerButton] = None
     key: typing.Optional[str] = None
     shift: bool = False
     ctrl: bool = False
     alt: bool = False
-    delta: mathutils.Vector = dataclasses.field(
-        default_factory=lambda: mathutils.Vector((0.0, 0.0))
-    )
-    timestamp: float = 0.0
+    dx: float = 0.0
+    dy: float = 0.0
+    timestamp_ns: int = 0
+    sequence: int = 0
+
+    def copy_from(self, other: 'PointerEvent') -> None:
+        """Overwrite every field with the fields of `other`"""
+        self.event_type = other.event_type
+        self.x = other.x
+        self.y = other.y
+        self.button = other.button
+        self.key = other.key
+        self.shift = other.shift
+        self.ctrl = other.ctrl
+        self.alt = other.alt
+        self.dx = other.dx
+        self.dy = other.dy
+        self.timestamp_ns = other.timestamp_ns
+        self.sequence = other.sequence
+
+    @property
+    def position(self) -> tuple[float, float]:
+        return (self.x, self.y)
+
+    @property
+    def delta(self) -> tuple[float, float]:
+        return (self.dx, self.dy)
+
+
+class PointerEventRing:
+    """
+    Fixed set of preallocated `PointerEvent` records reused round-robin
+
+    `next()` hands out the oldest record with a new `sequence`; a record is
+    valid until `capacity` further records have been handed out.
+    """
+
+    __slots__ = ('records', 'sequence')
+
+    def __init__(self, capacity: int = POINTER_EVENT_RING_CAPACITY) -> None:
+        self.records = [PointerEvent() for _ in range(capacity)]
+        self.sequence = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.records)
+
+    def next(self) -> PointerEvent:
+        record = self.records[self.sequence % len(self.records)]
+        self.sequence += 1
+        record.sequence = self.sequence
+        return record
@@ -0,0 +1,121 @@
+"""
+Grid button layouts and angular sectors, memoized by their inputs.
+
+A layout is computed once per distinct (center, size, spacing, names) and then
+shared by everything that needs it in a frame: hit tests in the event handler,
+drawing, and the hit tests of the next event. Layouts and their rect dicts are
+shared between callers and must not be modified.
+"""
+import functools
+import math
+import typing
+
+from .rect import Rect
+
+LAYOUT_CACHE_SIZE = 32
+
+
+class Sectors:
+    """
+    Equal angular sectors around a center, clockwise from `start_angle`
+
+    Sector `i` is centered on the direction `start_angle - i * tau / n`, so a
+    direction resolves to a name with one `atan2` and an index instead of
+    testing rects.
+    """
+
+    __slots__ = ("center", "names", "start_angle", "inner_radius")
+
+    def __init__(
+        self,
+        center: tuple[float, float],
+        names: tuple[str, ...],
+        start_angle: float,
+        inner_radius: float = 0.0,
+    ) -> None:
+        self.center = center
+        self.names = names
+        self.start_angle = start_angle
+        self.inner_radius = inner_radius
+
+    def sector_at(self, x: float, y: float) -> str | None:
+        """Name of the sector in the direction of the point; None inside `inner_radius`"""
+        dx = x - self.center[0]
+        dy = y - self.center[1]
+        if not self.names or dx * dx + dy * dy < self.inner_radius * self.inner_radius:
+            return None
+        count = len(self.names)
+        return self.names[int(self._sector_position(dx, dy)) % count]
+
+    def boundary_margin(self, x: float, y: float) -> float:
+        """Angle in radians between the direction of the point and the nearest sector edge"""
+        if not self.names:
+            return 0.0
+        fraction = self._sector_position(x - self.center[0], y - self.center[1]) % 1.0
+        return min(fraction, 1.0 - fraction) * math.tau / len(self.names)
+
+    def _sector_position(self, dx: float, dy: float) -> float:
+        """Direction in sector widths, clockwise from the first sector's leading edge"""
+        count = len(self.names)
+        turns = ((self.start_angle - math.atan2(dy, dx)) / math.tau + 0.5 / count) % 1.0
+        return turns * count
+
+
+class Layout:
+    """Named rects with a bounding rect for cheap misses"""
+
+    __slots__ = ("rects", "bounds")
+
+    def __init__(self, rects: dict[str, Rect]) -> None:
+        self.rects = rects
+        self.bounds = Rect.union(rects.values()) if rects else Rect(0.0, 0.0, 0.0, 0.0)
+
+    def hit(
+        self,
+        x: float,
+        y: float,
+        enabled: typing.Callable[[str], bool] | None = None,
+    ) -> str | None:
+        """Name of the first rect containing the point, skipping names `enabled` rejects"""
+        if not self.bounds.contains(x, y):
+            return None
+        for name, rect in self.rects.items():
+            if rect.contains(x, y) and (enabled is None or enabled(name)):
+                return name
+        return None
+
+
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def grid_layout(
+    center: tuple[float, float],
+    size: float,
+    offset: tuple[float, float],
+    names: tuple[str, ...],
+    columns: int = 2,
+    spacing: float = 1.0,
+) -> Layout:
+    """
+    Square cells of `size` in rows of `columns`, filled left to right from the bottom row
+
+    The grid is centered on `center` and then shifted by `offset`; cells are
+    `spacing` apart.
+    """
+    rows = max(math.ceil(len(names) / columns), 1)
+    left = center[0] - (columns * size + (columns - 1) * spacing) * 0.5 + offset[0]
+    bottom = center[1] - (rows * size + (rows - 1) * spacing) * 0.5 + offset[1]
+    step = size + spacing
+    return Layout({
+        name: Rect(left + (index % columns) * step, bottom + (index // columns) * step, size, size)
+        for index, name in enumerate(names)
+    })
+
+
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def sector_layout(
+    center: tuple[float, float],
+    names: tuple[str, ...],
+    start_angle: float = math.pi * 0.5,
+    inner_radius: float = 0.0,
+) -> Sectors:
+    """Angular sectors, e.g. to pick an action by drag direction"""
+    return Sectors(center, names, start_angle, inner_radius)
@@ -1,3 +1,6 @@
+import typing
+
+
 class Rect(tuple[float, float, float, float]):
     """Rectangle with position and size (x, y, width, height)"""
 
@@ -33,3 +36,13 @@ class Rect(tuple[float, float, float, float]):
         """Get center point of rectangle"""
         return (self.x + self.width * 0.5, self.y + self.height * 0.5)
 
+
+    @staticmethod
+    def union(rects: typing.Iterable['Rect']) -> 'Rect':
+        """Smallest rectangle containing all `rects`"""
+        rects = tuple(rects)
+        left = min(rect.x for rect in rects)
+        bottom = min(rect.y for rect in rects)
+        right = max(rect.x + rect.width for rect in rects)
+        top = max(rect.y + rect.height for rect in rects)
+        return Rect(left, bottom, right - left, top - bottom)
@@ -26,6 +26,7 @@ class WidgetResponse:
     double_clicked: bool = False
     shift: bool = False
     ctrl: bool = False
+    state: WidgetState = WidgetState.IDLE
 
 
 class Theme:
@@ -36,3 +37,4 @@ class Theme:
     button_active = (0.45, 0.45, 0.55, 1.0)
     border = (0.4, 0.4, 0.4, 1.0)
     border_width = 1.0
+    corner_radius = 0.0
@@ -2,22 +2,19 @@ import typing
 import bpy
 import mathutils
 
-from .unique_id import UniqueID
-from ..renderer.rect_outline_command import RectOutlineCommand
 from .types import Theme, WidgetResponse, WidgetState
 from .rect import Rect
+from ..renderer import texture_cache
+from ..renderer.icon_atlas import IconAtlas
 from ..renderer.renderer import Renderer
+from ..renderer.draw_order import LAYER_BACKGROUND
 from .ui_context import UIContext
+from .widget_id import WidgetId
 
 
 ICON_BUTTON_SCALE = 0.8
 
-
-def get_widget_id(widget_id: typing.Optional[str], pos: tuple[float, float]) -> str:
-    """Generate a unique widget ID if none provided"""
-    if widget_id is None:
-        widget_id = f"widget_{pos[0]}_{pos[1]}_{UniqueID.get_id()}"
-    return widget_id
+WidgetDraw = tuple[Rect, WidgetState, float, bpy.types.Image]
 
 
 class UI:
@@ -27,57 +24,139 @@ class UI:
         self.theme = Theme()
         self.ctx = UIContext(self.theme)
         self.renderer = Renderer()
+        self.icon_atlas: IconAtlas | None = None
+        self.composite_rects: tuple[Rect, ...] | None = None
+        self.composite_opacity = 1.0
+        self.widget_draws: list[WidgetDraw] = []
 
     def begin_frame(self, mouse_pos: mathutils.Vector | tuple[float, float]):
         """Begin UI frame with batching"""
         self.ctx.begin_frame(mouse_pos)
+        self.renderer.begin_frame()
+
+    def begin_composite(self, rects: typing.Iterable[Rect], opacity: float) -> float:
+        """
+        Draw this frame through the renderer's offscreen cache
+
+        The cache is keyed by `rects` and the widgets drawn, relative to their
+        bounds, and by the hovered and active widgets, and is blitted with
+        `opacity`. Returns the opacity widgets should be drawn with.
+        """
+        if not self.renderer.composite.is_available():
+            return opacity
+        self.composite_rects = tuple(rects)
+        self.composite_opacity = opacity
+        return 1.0
 
     def end_frame(self):
         """End UI frame and flush all batched draws"""
+        widget_state = (self.ctx.hovered_id, self.ctx.active_id)
         self.ctx.end_frame()
-        UniqueID.reset()
-        self.renderer.draw()
+        if self.composite_rects is None:
+            frame_key = self._frame_key()
+            if not self.renderer.is_cached(frame_key):
+                self._draw_widgets()
+            self.widget_draws.clear()
+            self.renderer.draw(frame_key)
+            return
+
+        bounds = Rect.union(self.composite_rects)
+        layout = tuple(
+            (rect.x - bounds.x, rect.y - bounds.y, rect.width, rect.height)
+            for rect in self.composite_rects
+        )
+        widgets = self._widget_key((bounds.x, bounds.y))
+        key = None if widgets is None else (layout, widget_state, widgets)
+        if not self.renderer.is_composite_cached(key, bounds):
+            self._draw_widgets()
+        self.widget_draws.clear()
+        self.renderer.draw_composite(key, bounds, self.composite_opacity)
+        self.composite_rects = None
+
+    def free(self) -> None:
+        """Release the renderer's GPU resources and close its frame log; the UI can still draw afterwards"""
+        self.renderer.free()
 
     def icon_button(
         self,
         icon: bpy.types.Image,
         pos: tuple[float, float],
         size: tuple[float, float],
-        widget_id: typing.Optional[str] = None,
+        widget_id: int | str | None = None,
         opacity: float = 1.0,
     ) -> WidgetResponse:
-        """Create an icon button widget"""
-        widget_id = get_widget_id(widget_id, pos)
-        rect, response, state = self._button_interaction(widget_id, pos, size)
+        """Create an icon button widget; without `widget_id` it is identified by declaration order"""
+        rect, response, state = self._button_interaction(self.ctx.get_id(widget_id), pos, size)
 
-        self._draw_button_background(rect, state, opacity)
-        self._draw_centered_icon(icon, rect, opacity)
+        self.widget_draws.append((rect, state, opacity, icon))
 
         return response
 
+    def _frame_key(self) -> typing.Hashable:
+        """
+        Hash of everything the widgets of this frame draw from
+
+        None when commands were added to the renderer directly, since those
+        are not covered by the key.
+        """
+        return self._widget_key((0.0, 0.0))
+
+    def _widget_key(self, origin: tuple[float, float]) -> typing.Hashable:
+        """`_frame_key` with the widget rects relative to `origin`"""
+        if not self.renderer.batch.is_empty():
+            return None
+        ox, oy = origin
+        try:
+            widgets = tuple(
+                ((rect.x - ox, rect.y - oy, rect.width, rect.height), state, opacity, texture_cache.image_key(icon))
+                for rect, state, opacity, icon in self.widget_draws
+            )
+        except ReferenceError:
+            return None
+        return (widgets, id(self.icon_atlas), id(self.theme))
+
+    def _draw_widgets(self) -> None:
+        """Generate the draw commands of the widgets declared this frame"""
+        for rect, state, opacity, icon in self.widget_draws:
+            self._draw_button_background(rect, state, opacity)
+            self._draw_centered_icon(icon, rect, opacity)
+
     def _button_interaction(
         self,
-        widget_id: str,
+        widget_id: WidgetId,
         pos: tuple[float, float],
         size: tuple[float, float],
     ) -> tuple[Rect, WidgetResponse, WidgetState]:
         rect = Rect(pos[0], pos[1], size[0], size[1])
         response = self.ctx.get_widget_response(widget_id, rect)
-        state = self.ctx.get_widget_state(widget_id, rect)
-        return rect, response, state
+        return rect, response, response.state
 
     def _draw_button_background(self, rect: Rect, state: WidgetState, opacity: float) -> None:
         color = self._button_color(state)
-        self.renderer.add(RectOutlineCommand(
+        if self.renderer.add_rect_instance(
+            rect,
+            fill_color=color,
+            outline_color=self.theme.border,
+            opacity=opacity,
+            outline_width=self.theme.border_width,
+            corner_radius=self.theme.corner_radius,
+        ):
+            return
+        self.renderer.add_rect_outline(
             rect,
             outline_color=self._with_opacity(self.theme.border, opacity),
             fill_color=self._with_opacity(color, opacity),
             outline_width=self.theme.border_width,
-        ))
+            corner_radius=self.theme.corner_radius,
+            layer=LAYER_BACKGROUND,
+        )
 
     def _draw_centered_icon(self, icon: bpy.types.Image, rect: Rect, opacity: float) -> None:
         icon_size = (rect.width * ICON_BUTTON_SCALE, rect.height * ICON_BUTTON_SCALE)
-        self.renderer.add_image(icon, self._centered_position(rect, icon_size), icon_size, opacity=opacity)
+        icon_pos = self._centered_position(rect, icon_size)
+        if self.icon_atlas and self.renderer.add_atlas_icon(self.icon_atlas, icon, icon_pos, icon_size, opacity):
+            return
+        self.renderer.add_image(icon, icon_pos, icon_size, opacity=opacity)
 
     def _button_color(self, state: WidgetState) -> tuple[float, float, float, float]:
         match state:
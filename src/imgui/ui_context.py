@@ -1,18 +1,45 @@
+import dataclasses
 import typing
 import bpy
 import mathutils
 
 from .double_click_tracker import DoubleClickTracker
+from .hit_grid import HitGrid
 from .input_adapter import InputEventAdapter
 from .rect import Rect
 from .types import Theme, WidgetResponse, WidgetState
+from .widget_id import IdStack, WidgetId
 
 from .input_event import EventType, PointerEvent, PointerButton
 
 
+MAX_PENDING_EVENTS = 64
+
+@dataclasses.dataclass
+class FrameEvents:
+    """The pending events of a frame, resolved once against the hit index"""
+    presses: list[tuple[int, PointerEvent, tuple[WidgetId, ...]]] = dataclasses.field(default_factory=list)
+    last_drag: tuple[int, PointerEvent] | None = None
+    last_release: int = -1
+    shift: bool = False
+    ctrl: bool = False
+
 
 class UIContext:
-    """Main UI context managing widget state and interaction"""
+    """
+    Main UI context managing widget state and interaction
+
+    Widget rects declared in a frame are indexed in a `HitGrid`, built by
+    `end_frame`, that answers hit tests in the next frame and between frames
+    (`last_frame_hits`): the mouse position and every press are
+    looked up once per frame, and a widget whose rect is unchanged only
+    checks whether its id is among the hits. Widgets that moved, or are new,
+    fall back to `Rect.contains`.
+
+    Widget ids are 64-bit hashes scoped by `push_id`/`pop_id`; widgets
+    declared without an id get one from their declaration order in the
+    current scope.
+    """
 
     def __init__(self, theme: Theme):
         self.theme = theme
@@ -24,6 +51,8 @@ class UIContext:
 
         self.frame_count = 0
         self.pending_events: typing.List[PointerEvent] = []
+        # Records owned by the queue, so the adapter's ring can be reused freely
+        self.free_events = [PointerEvent() for _ in range(MAX_PENDING_EVENTS + 1)]
 
     def _init_input_state(self) -> None:
         self.mouse_pos = mathutils.Vector((0.0, 0.0))
@@ -31,12 +60,18 @@ class UIContext:
         self.mouse_delta = mathutils.Vector((0.0, 0.0))
 
     def _init_widget_state(self) -> None:
-        self.hovered_id: typing.Optional[str] = None
-        self.active_id: typing.Optional[str] = None
+        self.hovered_id: typing.Optional[WidgetId] = None
+        self.active_id: typing.Optional[WidgetId] = None
+        self.id_stack = IdStack()
+        self.auto_id_count = 0
+        self.hit_index = HitGrid()
+        self.next_hit_index = HitGrid()
+        self.mouse_hits: tuple[WidgetId, ...] | None = None
+        self.frame_events: FrameEvents | None = None
 
     def _init_click_state(self) -> None:
         self.click_start_pos = (0.0, 0.0)
-        self.click_time = 0.0
+        self.click_time = 0
         self.double_click_tracker = DoubleClickTracker()
 
     def begin_frame(self, mouse_pos: mathutils.Vector | tuple[float, float]):
@@ -54,6 +89,12 @@ class UIContext:
 
         # Reset per-frame state
         self.hovered_id = None
+        self.id_stack.reset()
+        self.auto_id_count = 0
+        self.hit_index, self.next_hit_index = self.next_hit_index, self.hit_index
+        self.next_hit_index.clear()
+        self.mouse_hits = None
+        self.frame_events = None
 
     def end_frame(self):
         """End frame - call this after drawing all widgets"""
@@ -63,14 +104,37 @@ class UIContext:
         ):
             self.active_id = None
 
+        self.next_hit_index.build()
+
         # Clear processed events
-        self.pending_events.clear()
+        self._clear_pending_events()
+        self.frame_events = None
 
     def reset_state(self):
         """Reset UI state - call this when context changes"""
         self.hovered_id = None
         self.active_id = None
-        self.pending_events.clear()
+        self._clear_pending_events()
+        self.hit_index.clear()
+        self.next_hit_index.clear()
+        self.mouse_hits = None
+        self.frame_events = None
+
+    def last_frame_hits(self, x: float, y: float) -> tuple[WidgetId, ...]:
+        """Ids of the widgets of the last finished frame under the point"""
+        return self.next_hit_index.hits(x, y)
+
+    def needs_event_processing(self) -> bool:
+        """
+        Check if the next frame has input to act on
+
+        Presses, releases and drags of the active widget only take effect
+        when widgets are declared, so they need a frame even when nothing
+        visible changed.
+        """
+        if self.active_id is not None and self.pending_events:
+            return True
+        return any(event.event_type != EventType.POINTER_MOVE for event in self.pending_events)
 
     def handle_event(self, blender_event: bpy.types.Event) -> bool:
         """
@@ -84,23 +148,100 @@ class UIContext:
         if not event:
             return False
 
-        self.pending_events.append(event)
+        self._queue_event(event)
+        self.frame_events = None
         self._remember_click_start(event)
         return self._release_consumed(event)
 
+    def _clear_pending_events(self) -> None:
+        self.free_events.extend(self.pending_events)
+        self.pending_events.clear()
+
+    def _queue_event(self, event: PointerEvent) -> None:
+        """
+        Queue a copy of `event`, coalescing runs of moves so the queue does not grow with the input rate
+
+        Queued events live in records of `free_events`, not in the adapter's
+        ring, so they stay valid however many events arrive before a frame.
+        A move following a move with the same button is merged into it: the
+        deltas are summed and the latest position, time and modifiers are
+        kept. Presses and releases are never merged or dropped, so their
+        order is kept. Past `MAX_PENDING_EVENTS` the oldest move is folded
+        into a later one (`_fold_oldest_move`).
+        """
+        pending = self.pending_events
+        if pending and is_coalescable_move(pending[-1], event):
+            last = pending[-1]
+            last.x = event.x
+            last.y = event.y
+            last.dx += event.dx
+            last.dy += event.dy
+            last.timestamp_ns = event.timestamp_ns
+            last.shift = event.shift
+            last.ctrl = event.ctrl
+            last.alt = event.alt
+            return
+
+        record = self.free_events.pop() if self.free_events else PointerEvent()
+        record.copy_from(event)
+        pending.append(record)
+        if len(pending) > MAX_PENDING_EVENTS:
+            self._fold_oldest_move()
+
+    def _fold_oldest_move(self) -> None:
+        """
+        Shorten the queue by folding its oldest move into the next move with the same button
+
+        The later move keeps its position and gains the delta, so no motion is
+        lost. Presses and releases are never dropped; when there is no pair of
+        moves to fold the queue is allowed to grow.
+        """
+        pending = self.pending_events
+        for index, queued in enumerate(pending):
+            if queued.event_type != EventType.POINTER_MOVE:
+                continue
+            following = next(
+                (
+                    later for later in pending[index + 1:]
+                    if later.event_type == EventType.POINTER_MOVE and later.button == queued.button
+                ),
+                None,
+            )
+            if following is None:
+                continue
+            following.dx += queued.dx
+            following.dy += queued.dy
+            self.free_events.append(pending.pop(index))
+            return
+
     def _remember_click_start(self, event: PointerEvent) -> None:
         if event.event_type == EventType.POINTER_DOWN and event.button == PointerButton.MAIN_BUTTON:
-            self.click_start_pos = event.position
-            self.click_time = event.timestamp
+            self.click_start_pos = (event.x, event.y)
+            self.click_time = event.timestamp_ns
 
     def _release_consumed(self, event: PointerEvent) -> bool:
         if event.event_type != EventType.POINTER_UP or event.button != PointerButton.MAIN_BUTTON:
             return False
         return self.active_id is not None or self.hovered_id is not None
 
-    def get_widget_state(self, widget_id: str, rect: Rect) -> WidgetState:
+    def push_id(self, value: int | str) -> WidgetId:
+        """Enter the id scope of `value`; ids created until `pop_id` are hashed under it"""
+        return self.id_stack.push(value)
+
+    def pop_id(self) -> None:
+        self.id_stack.pop()
+
+    def get_id(self, value: int | str | None = None) -> WidgetId:
+        """Id of `value` in the current scope, or the next automatic id when None"""
+        if value is None:
+            self.auto_id_count += 1
+            return self.id_stack.get_id(self.auto_id_count)
+        return self.id_stack.get_id(value)
+
+    def get_widget_state(self, widget_id: WidgetId, rect: Rect) -> WidgetState:
         """Get current state of widget"""
-        if not rect.contains(*self.mouse_pos):
+        self.next_hit_index.add(widget_id, rect)
+        if not self._mouse_over(widget_id, rect):
             if self.active_id == widget_id:
                 return WidgetState.ACTIVE
             return WidgetState.IDLE
@@ -110,60 +251,72 @@ class UIContext:
             return WidgetState.ACTIVE
         return WidgetState.HOVERED
 
-    def get_widget_response(self, widget_id: str, rect: Rect) -> WidgetResponse:
-        """Get interaction response for widget"""
+    def get_widget_response(self, widget_id: WidgetId, rect: Rect) -> WidgetResponse:
+        """Get interaction response for widget; `state` is the widget state after this frame's presses"""
         state = self.get_widget_state(widget_id, rect)
         response = WidgetResponse(hovered=state in (WidgetState.HOVERED, WidgetState.ACTIVE))
+        events = self._frame_events()
 
-        for event in self.pending_events:
-            self._apply_widget_event(widget_id, rect, event, response)
-
-        return response
-
-    def _apply_widget_event(
-        self,
-        widget_id: str,
-        rect: Rect,
-        event: PointerEvent,
-        response: WidgetResponse,
-    ) -> None:
-        if is_event_pointer_down(event, rect):
+        active_from = 0 if self.active_id == widget_id else None
+        for index, event, hits in events.presses:
+            if not self._hit(widget_id, rect, event.x, event.y, hits):
+                continue
             self.active_id = widget_id
             response.clicked = True
             response.double_clicked = self.double_click_tracker.is_double_click(widget_id, event)
+            if active_from is None:
+                active_from = index
 
-        response.shift = response.shift or event.shift
-        response.ctrl = response.ctrl or event.ctrl
+        response.shift = events.shift
+        response.ctrl = events.ctrl
 
-        if is_event_drag(event, self.active_id, widget_id):
-            response.dragged = True
-            response.drag_delta = event.delta
+        if active_from is not None:
+            if events.last_drag is not None and events.last_drag[0] >= active_from:
+                response.dragged = True
+                drag = events.last_drag[1]
+                response.drag_delta = mathutils.Vector((drag.dx, drag.dy))
+            response.released = events.last_release >= active_from
 
-        if is_event_release(event, self.active_id, widget_id):
-            response.released = True
-
-
-def is_event_pointer_down(event: PointerEvent, rect: Rect) -> bool:
-    """Check if event starts on this widget."""
-    return (
-        event.event_type == EventType.POINTER_DOWN
-        and event.button == PointerButton.MAIN_BUTTON
-        and rect.contains(*event.position)
-    )
-
-def is_event_drag(event: PointerEvent, active_id: str | None, widget_id: str | None) -> bool:
-    """Check if event represents a drag on the widget"""
-    return (
-        event.event_type == EventType.POINTER_MOVE
-        and active_id == widget_id
-        and event.button == PointerButton.MAIN_BUTTON
-    )
+        response.state = WidgetState.ACTIVE if self.active_id == widget_id else state
+        return response
 
-def is_event_release(event: PointerEvent, active_id: str | None, widget_id: str | None) -> bool:
-    """Check if event represents a mouse release on the widget"""
+    def _mouse_over(self, widget_id: WidgetId, rect: Rect) -> bool:
+        if self.hit_index.rect(widget_id) != rect:
+            return rect.contains(*self.mouse_pos)
+        if self.mouse_hits is None:
+            self.mouse_hits = self.hit_index.hits(*self.mouse_pos)
+        return widget_id in self.mouse_hits
+
+    def _hit(self, widget_id: WidgetId, rect: Rect, x: float, y: float, hits: tuple[WidgetId, ...]) -> bool:
+        if self.hit_index.rect(widget_id) != rect:
+            return rect.contains(x, y)
+        return widget_id in hits
+
+    def _frame_events(self) -> FrameEvents:
+        """Resolve the pending events once per frame"""
+        if self.frame_events is not None:
+            return self.frame_events
+
+        events = FrameEvents()
+        for index, event in enumerate(self.pending_events):
+            events.shift = events.shift or event.shift
+            events.ctrl = events.ctrl or event.ctrl
+            if event.button != PointerButton.MAIN_BUTTON:
+                continue
+            if event.event_type == EventType.POINTER_DOWN:
+                events.presses.append((index, event, self.hit_index.hits(event.x, event.y)))
+            elif event.event_type == EventType.POINTER_MOVE:
+                events.last_drag = (index, event)
+            elif event.event_type == EventType.POINTER_UP:
+                events.last_release = index
+        self.frame_events = events
+        return events
+
+
+def is_coalescable_move(previous: PointerEvent, event: PointerEvent) -> bool:
+    """Check if `event` continues the move `previous` with the same button held"""
     return (
-        event.event_type == EventType.POINTER_UP
-        and event.button == PointerButton.MAIN_BUTTON
-        and active_id == widget_id
-        and widget_id is not None
+        previous.event_type == EventType.POINTER_MOVE
+        and event.event_type == EventType.POINTER_MOVE
+        and previous.button == event.button
     )
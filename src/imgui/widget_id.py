@@ -0,0 +1,66 @@
+import functools
+
+
+WidgetId = int
+
+ID_MASK = (1 << 64) - 1
+ROOT_ID: WidgetId = 0x9E3779B97F4A7C15
+
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+
+def _mix(value: int) -> int:
+    """SplitMix64 finalizer; spreads every input bit over the 64-bit result"""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & ID_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & ID_MASK
+    return value ^ (value >> 31)
+
+
+@functools.lru_cache(maxsize=256)
+def _string_hash(text: str) -> int:
+    """64-bit FNV-1a of the UTF-8 bytes; cached, since widget labels repeat every frame"""
+    value = _FNV_OFFSET
+    for byte in text.encode("utf-8"):
+        value = ((value ^ byte) * _FNV_PRIME) & ID_MASK
+    return value
+
+
+def combine_id(seed: WidgetId, value: int | str) -> WidgetId:
+    """Hash `value` into the id scope `seed`"""
+    part = _string_hash(value) if isinstance(value, str) else value & ID_MASK
+    return _mix(seed ^ _mix(part ^ ROOT_ID))
+
+
+class IdStack:
+    """
+    ImGui-style id scopes
+
+    `push` enters the scope of a hashed integer or string; `get_id` hashes a
+    value inside the current scope, so equal labels under different parents
+    stay distinct while the same path always gives the same 64-bit id.
+    """
+
+    def __init__(self, root: WidgetId = ROOT_ID) -> None:
+        self.scopes: list[WidgetId] = [root]
+
+    @property
+    def current(self) -> WidgetId:
+        return self.scopes[-1]
+
+    def get_id(self, value: int | str) -> WidgetId:
+        return combine_id(self.scopes[-1], value)
+
+    def push(self, value: int | str) -> WidgetId:
+        widget_id = combine_id(self.scopes[-1], value)
+        self.scopes.append(widget_id)
+        return widget_id
+
+    def pop(self) -> None:
+        if len(self.scopes) == 1:
+            raise IndexError("pop_id without a matching push_id")
+        self.scopes.pop()
+
+    def reset(self) -> None:
+        """Drop every pushed scope"""
+        del self.scopes[1:]
@@ -1,6 +1,7 @@
 import bpy
 import mathutils
 
+from ..imgui.animation import animations
 from ..utils.modal import add_modal_handler
 from ..utils.operator_return import OperatorReturn, OperatorReturnType
 from . import activation_runtime
@@ -278,3 +279,4 @@ def register() -> None:
 def unregister() -> None:
     activation_runtime.shutdown()
     NavigationPuckWidgetOperator.app.shutdown()
+    animations.stop()
@@ -47,6 +47,10 @@ class OwnerContext:
     def update_draw_handler(self, draw_handler: typing.Any, context: bpy.types.Context) -> None:
         draw_handler.update_context(context, self.viewport_rects, self.region_data)
 
+    def region(self) -> bpy.types.Region | None:
+        """The owner region; usable from timers, which have no context"""
+        return self.context_override.get("region") if self.context_override else None
+
     def local_position(self, position: mathutils.Vector) -> mathutils.Vector:
         return mathutils.Vector((
             position.x - self.viewport_rect[0],
@@ -1,5 +1,7 @@
 import typing
 
+from ..renderer import texture_cache
+from ..renderer.icon_atlas import IconAtlas, get_icon_atlas
 from ..utils.load_image import load_image
 
 
@@ -12,16 +14,40 @@ ACTION_IMAGE_NAMES = {
 
 SHORTCUT_ICON_NAME = "explore_wght300.png"
 
+_atlas_images: dict[str, typing.Any] = {}
+# Loading a file frees every image; drop them with the textures built from them
+texture_cache.on_clear(_atlas_images.clear)
+
+
+def is_image_valid(image: typing.Any) -> bool:
+    """Check if `image` is loaded and its data has not been freed"""
+    if not image:
+        return False
+    try:
+        image.as_pointer()
+    except ReferenceError:
+        return False
+    return True
+
 
 def load_action_images(images: dict[str, typing.Any]) -> None:
+    """Load the missing action images, and reload the ones whose data was freed"""
     for action, image_name in ACTION_IMAGE_NAMES.items():
-        if not images.get(action):
+        if not is_image_valid(images.get(action)):
             images[action] = load_image(image_name)
 
 
 def all_action_images_loaded(images: dict[str, typing.Any]) -> bool:
-    return all(images.get(action) for action in ACTION_IMAGE_NAMES)
+    return all(is_image_valid(images.get(action)) for action in ACTION_IMAGE_NAMES)
 
 
 def load_shortcut_icon() -> typing.Any:
     return load_image(SHORTCUT_ICON_NAME)
+
+
+def puck_icon_atlas() -> IconAtlas | None:
+    """Atlas holding every action icon and the shortcut icon; call from draw callbacks."""
+    load_action_images(_atlas_images)
+    if not is_image_valid(_atlas_images.get("shortcut")):
+        _atlas_images["shortcut"] = load_shortcut_icon()
+    return get_icon_atlas(_atlas_images.values())
@@ -1,13 +1,16 @@
 import math
+import time
 import typing
 
 import bpy
 import mathutils
 
+from ..imgui.gesture import FlickRecognizer
 from ..imgui.ui import UI
 from ..operators.view_operations import ViewOperationSet
 from ..utils.draw_handler import DrawHandler, force_redraw
 from ..utils.operator_return import OperatorReturn, OperatorReturnType
+from ..utils.redraw_filter import RedrawFilter
 from ..utils.scale import interface_scale
 from ..activation import get_activation_mode, get_addon_preferences, get_mode_menu_button_size
 from .editor_context import (
@@ -20,6 +23,7 @@ from .puck_assets import load_action_images
 from .owner_context import OwnerContext
 from .puck_menu_actions import HOTKEY_MENU_POINTER_DEAD_ZONE_RADIUS, PuckMenuActions
 from .puck_menu_hotkey import PuckMenuHotkey
+from .shortcut_layout import PUCK_ACTIONS
 from .view_operation_dispatch import handle_view_operation_events
 
 
@@ -43,6 +47,7 @@ class NavigationPuckWidget:
 
     def _init_draw_state(self) -> None:
         self.draw_handler = DrawHandler()
+        self.redraw_filter = RedrawFilter()
         self.mouse_pos = mathutils.Vector((0, 0))
         self.initial_mouse_pos = mathutils.Vector((0, 0))
 
@@ -70,6 +75,8 @@ class NavigationPuckWidget:
         self.dismiss_key_type = ""
         self.dismiss_key_released = False
         self.drag_select_start_distance = DEFAULT_DRAG_SELECT_DISTANCE
+        self.flick = FlickRecognizer()
+        self.drag_select_time_saved = 0.0
         self.hotkey_dead_zone_radius = DEFAULT_HOTKEY_DEAD_ZONE_RADIUS
         self.is_running = False
         self.stop_requested = False
@@ -150,6 +157,8 @@ class NavigationPuckWidget:
     ) -> None:
         self.mouse_pos[:] = self.owner_context.local_position(raw_event_position)
         self.initial_mouse_pos[:] = self.owner_context.local_position(owner_position)
+        self.flick.reset(self.mouse_pos.x, self.mouse_pos.y, time.perf_counter_ns())
+        self.drag_select_time_saved = 0.0
         self.ensure_images_loaded()
 
     def invoke(
@@ -206,6 +215,7 @@ class NavigationPuckWidget:
         owner_key = self.owner_context.context_key
         self.draw_handler.remove()
         self.ui.ctx.reset_state()
+        self.ui.free()
         self.is_running = False
         self.dismiss_on_key_release = False
         self.dismiss_key_type = ""
@@ -224,6 +234,7 @@ class NavigationPuckWidget:
         """Clear draw state during add-on unregister."""
         self.draw_handler.remove()
         self.ui.ctx.reset_state()
+        self.ui.free()
         self.is_running = False
         self.stop_requested = True
         self.dismiss_on_key_release = False
@@ -241,6 +252,18 @@ class NavigationPuckWidget:
         prefs = get_addon_preferences(context)
         return bool(getattr(prefs, "debug_shortcut_bounds", False))
 
+    def _visual_signature(self, context: bpy.types.Context) -> tuple[typing.Any, ...]:
+        """Everything the puck's look depends on, rounded to what can be seen"""
+        return (
+            round(self.initial_mouse_pos.x),
+            round(self.initial_mouse_pos.y),
+            round(self.button_sizes),
+            self.ui.ctx.last_frame_hits(self.mouse_pos.x, self.mouse_pos.y),
+            self.ui.ctx.active_id,
+            tuple(self._supports_action(action) for action in PUCK_ACTIONS),
+            self.drag_select and self._debug_bounds_enabled(context),
+        )
+
     def _local_event_from_event(
         self,
         context: bpy.types.Context,
@@ -427,7 +450,8 @@ class NavigationPuckWidget:
         if result is not None:
             return result
 
-        force_redraw(context)
+        if self.ui.ctx.needs_event_processing() or self.redraw_filter.needs_redraw(self._visual_signature(context)):
+            force_redraw(context)
         return self._modal_or_passthrough(pass_through_modifier_hotkey_event)
 
     def event_handler(self, context: bpy.types.Context, event: bpy.types.Event) -> OperatorReturnType:
@@ -464,6 +488,7 @@ class NavigationPuckWidget:
 
         registered with a DrawHandler(), called after each `force_redraw` call
         """
+        self.redraw_filter.invalidate()
 
         if self.view_ops.any_active(self._is_view2d_editor()):
             self.ui.ctx.reset_state()
@@ -471,3 +496,4 @@ class NavigationPuckWidget:
 
         self._sync_preferences(context)
         self.actions.draw(context)
+        self.redraw_filter.mark_drawn(self._visual_signature(context))
@@ -1,18 +1,24 @@
+import math
+import time
 import typing
 
 import bpy
 import mathutils
 
+from ..imgui.layout import Layout
 from ..imgui.rect import Rect
-from ..renderer.circle_outline_command import CircleOutlineCommand
+from ..renderer.draw_order import LAYER_OVERLAY
 from ..utils.view_math import event_drag_delta
 from .editor_context import event_position_in_context
-from .puck_assets import all_action_images_loaded
-from .shortcut_layout import PUCK_ACTIONS, puck_action_rects
+from .puck_assets import all_action_images_loaded, puck_icon_atlas
+from .shortcut_layout import PUCK_ACTIONS, puck_action_layout, puck_action_sectors
 from .view_operation_dispatch import apply_view_action
 
 
 HOTKEY_MENU_POINTER_DEAD_ZONE_RADIUS = 12.0
+# A flick may commit once it covers this share of the drag-select distance
+FLICK_MIN_DISTANCE_FACTOR = 0.25
+FLICK_SECTOR_MARGIN = math.radians(10.0)
 
 
 class PuckMenuActions:
@@ -21,9 +27,12 @@ class PuckMenuActions:
     def __init__(self, menu: typing.Any) -> None:
         self.menu = menu
 
-    def button_rects(self) -> dict[str, Rect]:
+    def button_layout(self) -> Layout:
         menu = self.menu
-        return puck_action_rects(menu.initial_mouse_pos, menu.button_sizes, menu.initial_offset)
+        return puck_action_layout(menu.initial_mouse_pos, menu.button_sizes, menu.initial_offset)
+
+    def button_rects(self) -> dict[str, Rect]:
+        return self.button_layout().rects
 
     def hotkey_pointer_on_button(self, context: bpy.types.Context, event: bpy.types.Event) -> bool:
         menu = self.menu
@@ -39,10 +48,7 @@ class PuckMenuActions:
         if (pointer - menu.initial_mouse_pos).length <= dead_zone_radius:
             return False
 
-        return any(
-            menu._supports_action(action) and rect.contains(pointer.x, pointer.y)
-            for action, rect in self.button_rects().items()
-        )
+        return self.button_layout().hit(pointer.x, pointer.y, menu._supports_action) is not None
 
     def try_drag_select_action(self, context: bpy.types.Context, event: bpy.types.Event) -> bool:
         if not self._drag_select_action_is_ready(event):
@@ -51,10 +57,13 @@ class PuckMenuActions:
         menu = self.menu
         delta = event_drag_delta(event)
         pointer_offset = menu.mouse_pos - menu.initial_mouse_pos
-        action = self._action_at_mouse_position()
+        early = self._is_within_drag_select_distance()
+        action = self._flick_action() if early else self._action_at_mouse_position()
         if action is None:
             return False
 
+        if early:
+            self._report_flick_commit(context, action)
         self._start_action_drag(context, action, delta, pointer_offset, shift=event.shift)
         return True
 
@@ -66,8 +75,12 @@ class PuckMenuActions:
         if not all_action_images_loaded(menu.action_images):
             return
 
+        menu.ui.icon_atlas = puck_icon_atlas()
+
+        menu.ui.ctx.push_id("navigation_puck_menu")
         for action in PUCK_ACTIONS:
             self._draw_action_button(context, action, menu.action_images[action], rects[action])
+        menu.ui.ctx.pop_id()
 
         if menu.drag_select and menu._debug_bounds_enabled(context):
             self._draw_drag_select_bounds()
@@ -130,15 +143,47 @@ class PuckMenuActions:
         if event.type != 'MOUSEMOVE':
             return False
 
-        return (menu.mouse_pos - menu.initial_mouse_pos).length >= menu.drag_select_start_distance
+        menu.flick.add(menu.mouse_pos.x, menu.mouse_pos.y, time.perf_counter_ns())
+        if not self._is_within_drag_select_distance():
+            return True
+        return self._flick_action() is not None
+
+    def _is_within_drag_select_distance(self) -> bool:
+        menu = self.menu
+        return (menu.mouse_pos - menu.initial_mouse_pos).length < menu.drag_select_start_distance
+
+    def _flick_action(self) -> str | None:
+        """Action a fast, straight drag points at, before it reaches the drag-select distance"""
+        menu = self.menu
+        if not menu.flick.is_decisive(menu.drag_select_start_distance * FLICK_MIN_DISTANCE_FACTOR):
+            return None
+
+        sectors = puck_action_sectors(menu.initial_mouse_pos, menu.initial_offset)
+        dx, dy = menu.flick.displacement()
+        x = sectors.center[0] + dx
+        y = sectors.center[1] + dy
+        if sectors.boundary_margin(x, y) < FLICK_SECTOR_MARGIN:
+            return None
+
+        action = sectors.sector_at(x, y)
+        if action is None or not menu._supports_action(action):
+            return None
+        return action
+
+    def _report_flick_commit(self, context: bpy.types.Context, action: str) -> None:
+        menu = self.menu
+        menu.drag_select_time_saved = menu.flick.time_to_reach(menu.drag_select_start_distance)
+        if menu._debug_bounds_enabled(context):
+            saved_ms = menu.drag_select_time_saved * 1000.0
+            print(f"Navigation Puck drag-select started {action} {saved_ms:.0f} ms early")
 
     def _action_at_mouse_position(self) -> str | None:
         menu = self.menu
-        rects = self.button_rects()
-        for action in PUCK_ACTIONS:
-            if menu._supports_action(action) and rects[action].contains(menu.mouse_pos.x, menu.mouse_pos.y):
-                return action
-        return None
+        sectors = puck_action_sectors(menu.initial_mouse_pos, menu.initial_offset)
+        action = sectors.sector_at(menu.mouse_pos.x, menu.mouse_pos.y)
+        if action is None or not menu._supports_action(action):
+            return None
+        return action
 
     def _draw_action_button(
         self,
@@ -155,6 +200,7 @@ class PuckMenuActions:
             image,
             (rect.x, rect.y),
             (rect.width, rect.height),
+            action,
         )
         if not response.clicked and not response.dragged:
             return
@@ -170,9 +216,10 @@ class PuckMenuActions:
 
     def _draw_drag_select_bounds(self) -> None:
         menu = self.menu
-        menu.ui.renderer.add(CircleOutlineCommand(
+        menu.ui.renderer.add_circle_outline(
             center=(menu.initial_mouse_pos.x, menu.initial_mouse_pos.y),
             radius=menu.drag_select_start_distance,
             color=(0.0, 0.9, 1.0, 0.95),
             width=2.0,
-        ))
+            layer=LAYER_OVERLAY,
+        )
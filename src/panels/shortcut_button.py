@@ -4,10 +4,11 @@ import bpy
 import mathutils
 
 from ..imgui.rect import Rect
-from ..renderer.circle_outline_command import CircleOutlineCommand
+from ..renderer.draw_order import LAYER_OVERLAY
 from ..utils.draw_handler import force_redraw
 from ..utils.operator_return import OperatorReturn, OperatorReturnType
 from .editor_context import RegionLocalEvent
+from .puck_assets import puck_icon_atlas
 from .shortcut_layout import button_rect, fade_start_radius
 
 
@@ -41,17 +42,22 @@ class ShortcutButton:
 
         draw_opacity, debug_bounds = self._draw_opacity(context)
         if draw_opacity <= 0.01:
+            shortcut.redraw_filter.mark_drawn(shortcut.visual_signature(context))
             return
 
         shortcut.ui.begin_frame(shortcut.mouse_pos)
-        response = self._draw_button(button_rect(shortcut.button_center, shortcut.button_size), draw_opacity)
+        shortcut.ui.icon_atlas = puck_icon_atlas()
+        rect = button_rect(shortcut.button_center, shortcut.button_size)
+        if not debug_bounds:
+            draw_opacity = shortcut.ui.begin_composite((rect,), draw_opacity)
+        response = self._draw_button(rect, draw_opacity)
         if debug_bounds:
             self._draw_debug_bounds()
         if response and response.hovered:
-            shortcut.target_opacity = 1.0
-            shortcut.opacity = 1.0
+            shortcut.placement.set_opacity(1.0)
 
         shortcut.ui.end_frame()
+        shortcut.redraw_filter.mark_drawn(shortcut.visual_signature(context))
 
     def _handle_mousemove(
         self,
@@ -61,7 +67,7 @@ class ShortcutButton:
         shortcut = self.shortcut
         shortcut.placement.update_button_position()
         shortcut.placement.update_target_opacity(previous_mouse_pos)
-        force_redraw(context)
+        shortcut.redraw_if_changed(context)
         return OperatorReturn.PASS_THROUGH
 
     def _handle_leftmouse(
@@ -81,8 +87,7 @@ class ShortcutButton:
             shortcut.ui.ctx.handle_event(local_event)
             shortcut._open_puck_menu(context)
             shortcut.press_started_on_button = False
-            shortcut.target_opacity = 0.0
-            shortcut.opacity = 0.0
+            shortcut.placement.set_opacity(0.0)
             force_redraw(context)
             return OperatorReturn.RUNNING_MODAL
 
@@ -115,13 +120,14 @@ class ShortcutButton:
 
     def _draw_debug_bounds(self) -> None:
         shortcut = self.shortcut
-        shortcut.ui.renderer.add(CircleOutlineCommand(
+        shortcut.ui.renderer.add_circle_outline(
             center=(shortcut.button_center.x, shortcut.button_center.y),
             radius=shortcut.follow_zone_radius,
             color=(0.0, 0.85, 1.0, 0.85),
             width=2.0,
-        ))
-        shortcut.ui.renderer.add(CircleOutlineCommand(
+            layer=LAYER_OVERLAY,
+        )
+        shortcut.ui.renderer.add_circle_outline(
             center=(shortcut.button_center.x, shortcut.button_center.y),
             radius=fade_start_radius(
                 shortcut.fade_zone_min_inset,
@@ -133,10 +139,12 @@ class ShortcutButton:
             ),
             color=(1.0, 0.35, 0.0, 0.95),
             width=2.0,
-        ))
-        shortcut.ui.renderer.add(CircleOutlineCommand(
+            layer=LAYER_OVERLAY,
+        )
+        shortcut.ui.renderer.add_circle_outline(
             center=(shortcut.button_center.x, shortcut.button_center.y),
             radius=shortcut.button_size * 0.5,
             color=(0.2, 1.0, 0.25, 1.0),
             width=2.0,
-        ))
+            layer=LAYER_OVERLAY,
+        )
@@ -4,10 +4,11 @@ import bpy
 import mathutils
 
 from ..imgui.rect import Rect
-from ..renderer.circle_outline_command import CircleOutlineCommand
+from ..renderer.draw_order import LAYER_OVERLAY
 from ..utils.draw_handler import force_redraw
 from ..utils.operator_return import OperatorReturn, OperatorReturnType
 from .editor_context import RegionLocalEvent
+from .puck_assets import puck_icon_atlas
 from .shortcut_layout import PUCK_ACTIONS, direct_menu_contains, direct_menu_rects
 from .view_operation_dispatch import apply_view_action, handle_view_operation_events
 
@@ -57,17 +58,28 @@ class ShortcutDirectMenu:
         shortcut._ensure_direct_menu_images()
         draw_opacity, debug_bounds = self._draw_opacity(context)
         if draw_opacity <= 0.01:
+            shortcut.redraw_filter.mark_drawn(shortcut.visual_signature(context))
             return
 
         shortcut.ui.begin_frame(shortcut.mouse_pos)
+        shortcut.ui.icon_atlas = puck_icon_atlas()
         rects = direct_menu_rects(shortcut.button_center, shortcut.menu_button_size, shortcut.menu_gap)
+        drawn_actions = [
+            action for action in PUCK_ACTIONS
+            if shortcut.direct_menu_images[action] and shortcut._supports_action(action)
+        ]
+        if drawn_actions and not debug_bounds:
+            draw_opacity = shortcut.ui.begin_composite((rects[action] for action in drawn_actions), draw_opacity)
+        shortcut.ui.ctx.push_id("navigation_puck_direct")
         for action in PUCK_ACTIONS:
             self._draw_action(context, action, shortcut.direct_menu_images[action], rects[action], draw_opacity)
+        shortcut.ui.ctx.pop_id()
 
         if debug_bounds:
             self._draw_debug_bounds()
 
         shortcut.ui.end_frame()
+        shortcut.redraw_filter.mark_drawn(shortcut.visual_signature(context))
 
     def _continue_view_operation(
         self,
@@ -102,7 +114,7 @@ class ShortcutDirectMenu:
             shortcut.placement.update_button_position()
             shortcut.placement.update_target_opacity(previous_mouse_pos)
         shortcut.ui.ctx.handle_event(local_event)
-        force_redraw(context)
+        shortcut.redraw_if_changed(context)
         return OperatorReturn.RUNNING_MODAL if shortcut.ui.ctx.active_id is not None else OperatorReturn.PASS_THROUGH
 
     def _handle_leftmouse(
@@ -158,12 +170,13 @@ class ShortcutDirectMenu:
 
     def _draw_debug_bounds(self) -> None:
         shortcut = self.shortcut
-        shortcut.ui.renderer.add(CircleOutlineCommand(
+        shortcut.ui.renderer.add_circle_outline(
             center=(shortcut.button_center.x, shortcut.button_center.y),
             radius=shortcut.follow_zone_radius,
             color=(0.0, 0.85, 1.0, 0.85),
             width=2.0,
-        ))
+            layer=LAYER_OVERLAY,
+        )
 
     def _draw_action(
         self,
@@ -181,7 +194,7 @@ class ShortcutDirectMenu:
             image,
             (rect.x, rect.y),
             (rect.width, rect.height),
-            f"navigation_puck_direct_{action}",
+            action,
             opacity=opacity,
         )
         self._handle_response(context, action, response)
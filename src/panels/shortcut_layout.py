@@ -1,7 +1,9 @@
+import math
 import typing
 
 import mathutils
 
+from ..imgui.layout import Layout, Sectors, grid_layout, sector_layout
 from ..imgui.rect import Rect
 from ..activation import ACTIVATION_DIRECT_MENU
 
@@ -9,6 +11,11 @@ from ..activation import ACTIVATION_DIRECT_MENU
 PUCK_ACTIONS = ("pan", "orbit", "zoom", "roll")
 PAN_ZOOM_ACTIONS = {"pan", "zoom"}
 
+# Clockwise from the top-right cell of the action grid, so each drag-select
+# sector is centered on the diagonal of its button
+PUCK_ACTION_DIRECTIONS = ("roll", "orbit", "pan", "zoom")
+PUCK_ACTION_START_ANGLE = math.pi * 0.25
+
 SHORTCUT_CURSOR_DIRECTIONS = {
     'TOP_LEFT': (-1.0, 1.0),
     'TOP': (0.0, 1.0),
@@ -31,18 +38,37 @@ def button_rect(center: mathutils.Vector, size: float) -> Rect:
     )
 
 
+def puck_action_layout(
+    center: mathutils.Vector | tuple[float, float],
+    size: float,
+    offset: tuple[float, float] = (5.0, 5.0),
+) -> Layout:
+    return grid_layout(
+        (float(center[0]), float(center[1])),
+        float(size),
+        (float(offset[0]), float(offset[1])),
+        PUCK_ACTIONS,
+    )
+
+
 def puck_action_rects(
     center: mathutils.Vector,
     size: float,
     offset: tuple[float, float] = (5.0, 5.0),
 ) -> dict[str, Rect]:
-    x, y = center
-    return {
-        "pan": Rect(x - size - 0.5 + offset[0], y - size - 0.5 + offset[1], size, size),
-        "orbit": Rect(x + 0.5 + offset[0], y - size - 0.5 + offset[1], size, size),
-        "zoom": Rect(x - size - 0.5 + offset[0], y + 0.5 + offset[1], size, size),
-        "roll": Rect(x + 0.5 + offset[0], y + 0.5 + offset[1], size, size),
-    }
+    return puck_action_layout(center, size, offset).rects
+
+
+def puck_action_sectors(
+    center: mathutils.Vector | tuple[float, float],
+    offset: tuple[float, float] = (5.0, 5.0),
+) -> Sectors:
+    """Action per drag direction from the center of the action grid"""
+    return sector_layout(
+        (float(center[0]) + float(offset[0]), float(center[1]) + float(offset[1])),
+        PUCK_ACTION_DIRECTIONS,
+        PUCK_ACTION_START_ANGLE,
+    )
 
 
 def direct_menu_rects(
@@ -50,7 +76,7 @@ def direct_menu_rects(
     size: float,
     offset: float = 5.0,
 ) -> dict[str, Rect]:
-    return puck_action_rects(center, size, (offset, offset))
+    return puck_action_layout(center, size, (offset, offset)).rects
 
 
 def direct_menu_contains(
@@ -61,10 +87,7 @@ def direct_menu_contains(
     supports_action: typing.Callable[[str], bool],
     offset: float = 5.0,
 ) -> bool:
-    return any(
-        supports_action(action) and rect.contains(x, y)
-        for action, rect in direct_menu_rects(center, size, offset).items()
-    )
+    return puck_action_layout(center, size, (offset, offset)).hit(x, y, supports_action) is not None
 
 
 def supports_puck_action(
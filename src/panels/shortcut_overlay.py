@@ -3,10 +3,12 @@ import typing
 import bpy
 import mathutils
 
+from ..imgui.animation import animations
 from ..imgui.ui import UI
 from ..operators.view_operations import ViewOperationSet
 from ..utils.draw_handler import DrawHandler, force_redraw
 from ..utils.operator_return import OperatorReturn, OperatorReturnType
+from ..utils.redraw_filter import RedrawFilter
 from ..utils.scale import interface_scale
 from ..activation import (
     ACTIVATION_DIRECT_MENU,
@@ -16,6 +18,7 @@ from ..activation import (
     get_activation_mode,
     get_addon_preferences,
     get_mode_menu_button_size,
+    uses_cursor_overlay_drawing,
 )
 from .editor_context import (
     RegionLocalEvent,
@@ -25,12 +28,13 @@ from .editor_context import (
     event_window_position_is_in_context_area,
 )
 from .shortcut_layout import (
+    PUCK_ACTIONS,
     control_edge_radius,
     cursor_offset,
     follow_zone_radius,
 )
 from .editor_state import EditorState
-from .puck_assets import load_action_images, load_shortcut_icon
+from .puck_assets import is_image_valid, load_action_images, load_shortcut_icon
 from .owner_context import OwnerContext
 from .puck_invocation import _invoke_navigation_puck_widget
 from .shortcut_button import ShortcutButton
@@ -60,6 +64,7 @@ class NavigationPuckShortcut:
 
     def _init_draw_state(self) -> None:
         self.draw_handler = DrawHandler()
+        self.redraw_filter = RedrawFilter()
         self.ui = UI()
         self.mouse_pos = mathutils.Vector((0.0, 0.0))
         self.last_mouse_pos = mathutils.Vector((0.0, 0.0))
@@ -116,11 +121,10 @@ class NavigationPuckShortcut:
             self.placement.place_from_cursor()
             self.placement.update_target_opacity()
         else:
-            self.target_opacity = 0.0
-            self.opacity = 0.0
+            self.placement.set_opacity(0.0)
         self.draw_handler.remove()
         self.ui.ctx.reset_state()
-        self.draw_handler.add(context, self.draw_callback)
+        self.draw_handler.add(context, self.draw_callback, cursor=uses_cursor_overlay_drawing(context))
         self.owner_context.update_draw_handler(self.draw_handler, context)
         force_redraw(context)
         return OperatorReturn.RUNNING_MODAL
@@ -129,15 +133,17 @@ class NavigationPuckShortcut:
         load_action_images(self.direct_menu_images)
 
     def _ensure_shortcut_icon(self) -> None:
-        if self.icon is None:
+        if not is_image_valid(self.icon):
             self.icon = load_shortcut_icon()
 
     def shutdown(self) -> None:
         """Request a clean modal shutdown from add-on unregister."""
         self.stop_requested = True
         self.modal_generation += 1
+        animations.cancel(self)
         self.draw_handler.remove()
         self.ui.ctx.reset_state()
+        self.ui.free()
         self.is_running = False
         self.press_started_on_button = False
         self.owner_context.clear()
@@ -145,8 +151,10 @@ class NavigationPuckShortcut:
 
     def finish(self, context: bpy.types.Context) -> OperatorReturnType:
         """End the shortcut operator and clear draw/timer resources."""
+        animations.cancel(self)
         self.draw_handler.remove()
         self.ui.ctx.reset_state()
+        self.ui.free()
         self.is_running = False
         self.owner_context.clear()
         self.pointer_in_owner_area = True
@@ -162,14 +170,18 @@ class NavigationPuckShortcut:
     def refresh_context(self, context: bpy.types.Context) -> None:
         """Refresh draw state when Blender changes the active 3D View area."""
         context_key = self._context_key(context)
+        cursor = uses_cursor_overlay_drawing(context)
         if context_key != self.owner_context.context_key:
             self.owner_context.context_key = context_key
             self._sync_owner_viewport(context, self.owner_context.region_position(self.mouse_pos))
             self.draw_handler.remove()
-            self.draw_handler.add(context, self.draw_callback)
+            self.draw_handler.add(context, self.draw_callback, cursor=cursor)
         elif self.owner_context.context_override is None:
             self._sync_owner_viewport(context, self.owner_context.region_position(self.mouse_pos))
 
+        if self.draw_handler.handler is not None and self.draw_handler.cursor != cursor:
+            self.draw_handler.add(context, self.draw_callback, cursor=cursor)
+
         self.owner_context.update_draw_handler(self.draw_handler, context)
         self._sync_preferences(context)
         self._update_region_size(context)
@@ -184,8 +196,7 @@ class NavigationPuckShortcut:
         self.mouse_pos[:] = mouse_pos
         self.button_center[:] = mouse_pos
         self.placement.clamp_center()
-        self.target_opacity = 1.0
-        self.opacity = 1.0
+        self.placement.set_opacity(1.0)
         self.press_started_on_button = False
         self.ui.ctx.reset_state()
 
@@ -230,8 +241,7 @@ class NavigationPuckShortcut:
             return False
 
     def _hide_for_sibling_interaction(self, context: bpy.types.Context) -> OperatorReturnType:
-        self.target_opacity = 0.0
-        self.opacity = 0.0
+        self.placement.set_opacity(0.0)
         self.press_started_on_button = False
         self.ui.ctx.reset_state()
         force_redraw(context)
@@ -247,8 +257,7 @@ class NavigationPuckShortcut:
         )
         self.pointer_in_owner_area = False
         self.press_started_on_button = False
-        self.target_opacity = 0.0
-        self.opacity = 0.0
+        self.placement.set_opacity(0.0)
         if should_redraw:
             self.ui.ctx.reset_state()
             force_redraw(context)
@@ -277,8 +286,7 @@ class NavigationPuckShortcut:
         if self._event_has_region_position(event):
             self._sync_pointer_from_event(context, event)
         self.press_started_on_button = False
-        self.target_opacity = 0.0
-        self.opacity = 0.0
+        self.placement.set_opacity(0.0)
         force_redraw(context)
         return OperatorReturn.PASS_THROUGH
 
@@ -340,6 +348,7 @@ class NavigationPuckShortcut:
 
     def draw_callback(self, _op: typing.Any, context: bpy.types.Context):
         """Draw the shortcut icon and its debug zones."""
+        self.redraw_filter.invalidate()
         self._sync_preferences(context)
         if not self.pointer_in_owner_area and not self._has_active_pointer_interaction():
             return
@@ -402,6 +411,32 @@ class NavigationPuckShortcut:
     ) -> mathutils.Vector:
         return event_region_position(event, fallback)
 
+    def visual_signature(self, context: bpy.types.Context) -> tuple[typing.Any, ...]:
+        """Everything the overlay's look depends on, rounded to what can be seen"""
+        return (
+            self.activation_mode,
+            round(self.button_center.x),
+            round(self.button_center.y),
+            round(self.button_size),
+            round(self.menu_button_size),
+            round(self.opacity * 100),
+            self.pointer_in_owner_area,
+            self.press_started_on_button,
+            self.ui.ctx.last_frame_hits(self.mouse_pos.x, self.mouse_pos.y),
+            self.ui.ctx.active_id,
+            tuple(self._supports_action(action) for action in PUCK_ACTIONS),
+            self._debug_bounds_enabled(context),
+        )
+
+    def redraw_if_changed(self, context: bpy.types.Context) -> None:
+        """Redraw after a pointer event unless the overlay would look the same"""
+        if self.ui.ctx.needs_event_processing() or self.redraw_filter.needs_redraw(self.visual_signature(context)):
+            self.draw_handler.redraw_pointer(context)
+
+    def redraw_fade(self) -> None:
+        """Redraw callback of the opacity fade, called from the animation timer"""
+        self.draw_handler.redraw_region(self.owner_context.region())
+
     def _debug_bounds_enabled(self, context: bpy.types.Context) -> bool:
         prefs = get_addon_preferences(context)
         return bool(getattr(prefs, "debug_shortcut_bounds", False))
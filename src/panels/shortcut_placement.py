@@ -2,6 +2,7 @@ import typing
 
 import mathutils
 
+from ..imgui.animation import animations
 from .shortcut_layout import (
     clamp_shortcut_center,
     cursor_in_follow_zone,
@@ -11,6 +12,8 @@ from .shortcut_layout import (
     visible_control_contains,
 )
 
+SHORTCUT_FADE_DURATION = 0.12
+
 
 class ShortcutPlacement:
     """Shortcut button position and fade-zone calculations."""
@@ -72,6 +75,20 @@ class ShortcutPlacement:
         self.set_target_opacity(max(shortcut.idle_opacity, proximity))
 
     def set_target_opacity(self, opacity: float) -> None:
+        """Fade towards `opacity`; the owner region is redrawn while the fade runs"""
+        shortcut = self.shortcut
+        shortcut.target_opacity = opacity
+        animations.animate(
+            shortcut,
+            "opacity",
+            opacity,
+            SHORTCUT_FADE_DURATION,
+            redraw=shortcut.redraw_fade,
+        )
+
+    def set_opacity(self, opacity: float) -> None:
+        """Show or hide the shortcut at once, stopping a running fade"""
         shortcut = self.shortcut
+        animations.cancel(shortcut, "opacity")
         shortcut.target_opacity = opacity
-        shortcut.opacity = shortcut.target_opacity
+        shortcut.opacity = opacity
@@ -13,6 +13,9 @@ from .activation import (
     ACTIVATION_HOTKEY_MENU,
     ACTIVATION_SHORTCUT_BUTTON,
     DEFAULT_ACTIVATION_MODE,
+    DEFAULT_OVERLAY_DRAW_MODE,
+    OVERLAY_DRAW_CURSOR,
+    OVERLAY_DRAW_REGION,
 )
 
 KEYMAP_HOTKEY_SEARCH_TEXT = "Navigation Puck Hotkey"
@@ -100,6 +103,19 @@ class NavigationPuckPreferences(bpy.types.AddonPreferences):
         default=DEFAULT_ACTIVATION_MODE,
         update=_refresh_activation_mode,
     )
+    overlay_draw_mode: bpy.props.EnumProperty( # type: ignore
+        name="Overlay drawing",
+        description="How the shortcut button and the menu near the cursor are redrawn while the cursor moves",
+        items=(
+            (OVERLAY_DRAW_REGION, "Editor Region", "Redraw the whole editor region on every cursor move"),
+            (
+                OVERLAY_DRAW_CURSOR,
+                "Window Cursor (Experimental)",
+                "Draw as a window paint cursor, so cursor moves only re-composite the window",
+            ),
+        ),
+        default=DEFAULT_OVERLAY_DRAW_MODE,
+    )
     debug_shortcut_bounds: bpy.props.BoolProperty( # type: ignore
         name="Debug mode",
         description="Show shortcut bounds and puck drag-select debug values",
@@ -205,6 +221,7 @@ class NavigationPuckPreferences(bpy.types.AddonPreferences):
         box.prop(self, "shortcut_menu_button_size")
         box.prop(self, "drag_select_threshold_radius")
         box.prop(self, "shortcut_fade_start_inset_percent")
+        box.prop(self, "overlay_draw_mode")
         box.prop(self, "debug_shortcut_bounds")
 
     def _draw_direct_menu_settings(self, layout: bpy.types.UILayout) -> None:
@@ -213,6 +230,7 @@ class NavigationPuckPreferences(bpy.types.AddonPreferences):
         box.prop(self, "shortcut_cursor_distance", text="Menu cursor distance")
         box.prop(self, "shortcut_cursor_position", text="Menu position")
         box.prop(self, "direct_menu_button_size")
+        box.prop(self, "overlay_draw_mode")
         box.prop(self, "debug_shortcut_bounds")
 
     def _draw_hotkey_settings(self, context: bpy.types.Context, layout: bpy.types.UILayout) -> None:
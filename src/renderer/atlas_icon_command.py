@@ -0,0 +1,43 @@
+"""
+Defines a command to render an icon from the shared icon atlas.
+"""
+import typing
+import dataclasses
+
+from .builtin_vertices import RectangleIndices, RectangleVertices
+from .draw_protocol import BoundsProtocol, DrawProtocol
+
+if typing.TYPE_CHECKING:
+    from .icon_atlas import IconAtlas
+    from .renderer_batch import BatchCache
+
+
+@dataclasses.dataclass(slots=True)
+class AtlasIconCommand(DrawProtocol, BoundsProtocol):
+    """UV-mapped quad sampling one icon region of an atlas"""
+    atlas: 'IconAtlas'
+    uv_rect: tuple[float, float, float, float]
+    rect: tuple[float, float, float, float]
+    opacity: float = 1.0
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self.rect
+
+    def quad(self) -> tuple[RectangleVertices, tuple[tuple[float, float], ...], RectangleIndices]:
+        """Positions, texture coordinates and indices of the icon quad"""
+        u0, v0, u1, v1 = self.uv_rect
+        return (
+            RectangleVertices(self.rect),
+            ((u0, v0), (u1, v0), (u1, v1), (u0, v1)),
+            RectangleIndices(),
+        )
+
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        """Draw the icon on its own; `RendererBatch` merges atlas icons instead"""
+        if self.opacity <= 0.0:
+            return
+        from .mesh_builder import AtlasMeshBuilder
+
+        builder = AtlasMeshBuilder(4, 2)
+        builder.append_command(self)
+        builder.draw(self.atlas.texture, batch_cache)
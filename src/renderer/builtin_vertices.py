@@ -1,4 +1,10 @@
 """Built-in rectangle and outline geometry data."""
+import array
+import functools
+import itertools
+import typing
+
+PACKED_COLOR_CACHE_SIZE = 256
 
 
 class OutlineVertices(list[
@@ -137,3 +143,30 @@ class RectangleIndices(list[
     def offset_size() -> int:
         """offset size is 4"""
         return 4
+
+
+def rectangle_positions(rect: tuple[float, float, float, float], border: float = 0) -> array.array:  # type: ignore
+    """`RectangleVertices` as a flat `float` array, for mesh builders"""
+    x, y, width, height = rect
+    left, bottom = x + border, y + border
+    right, top = x + width - border, y + height - border
+    return array.array('f', (left, bottom, right, bottom, right, top, left, top))
+
+
+@functools.lru_cache(maxsize=PACKED_COLOR_CACHE_SIZE)
+def pack_color(color: tuple[float, ...]) -> bytes:
+    """RGBA floats as normalized unsigned bytes, converted once per distinct color"""
+    return bytes(round(min(max(component, 0.0), 1.0) * 255.0) for component in color)
+
+
+def packed_colors(colors: typing.Iterable[typing.Sequence[float]]) -> array.array:  # type: ignore
+    """Pack per-vertex colors, converting each run of equal colors once and repeating its bytes"""
+    return array.array('B', b"".join(
+        pack_color(tuple(color)) * sum(1 for _ in run)
+        for color, run in itertools.groupby(colors, key=tuple)
+    ))
+
+
+def uniform_color(color: typing.Sequence[float], count: int) -> array.array:  # type: ignore
+    """One color packed once and repeated for `count` vertices"""
+    return array.array('B', pack_color(tuple(color))) * count
@@ -1,52 +1,98 @@
 """
-Creates a command to draw a circle outline using triangle segments.
+Creates a command to draw a circle outline with the SDF shader, or triangle segments as a fallback.
 """
 
 import dataclasses
-import math
+import itertools
+import typing
 
-from .draw_protocol import DrawProtocol, UnwrapProtocol
+from .draw_protocol import BoundsProtocol, DrawProtocol, UnwrapProtocol
 from .flat_color_shader_command import FlatColorShaderCommand
+from .sdf_shader import get_sdf_shader
+from .sdf_shape_command import SdfShapeCommand
+from .unit_circle import CIRCLE_MIN_SEGMENTS, circle_segments, unit_circle
 
+if typing.TYPE_CHECKING:
+    from .renderer_batch import BatchCache
 
-@dataclasses.dataclass
-class CircleOutlineCommand(DrawProtocol, UnwrapProtocol):
-    """Command to draw a circular outline as a thin ring."""
+
+@dataclasses.dataclass(slots=True)
+class CircleOutlineCommand(DrawProtocol, UnwrapProtocol, BoundsProtocol):
+    """
+    Command to draw a circular outline as a thin ring.
+
+    `segments` = None picks the tessellation from the on-screen radius
+    (`radius * scale` pixels). The unwrapped command and its vertex lists
+    are kept and refilled on the next unwrap.
+    """
     center: tuple[float, float]
     radius: float
     color: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
     width: float = 2.0
-    segments: int = 48
+    segments: int | None = None
+    scale: float = 1.0
+    _shape: SdfShapeCommand | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    _mesh: FlatColorShaderCommand | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        radius = max(self.radius, self.width)
+        return (self.center[0] - radius, self.center[1] - radius, radius * 2.0, radius * 2.0)
+
+    def unwrap(self) -> SdfShapeCommand | FlatColorShaderCommand:
+        """Convert to one SDF quad, or to triangle segments when the SDF shader is unavailable"""
+        if get_sdf_shader() is None:
+            return self.tessellate()
+        return self.sdf_shape()
 
-    def unwrap(self) -> FlatColorShaderCommand:
+    def sdf_shape(self) -> SdfShapeCommand:
+        """The ring as one SDF quad"""
+        radius = max(self.radius, self.width)
+        shape = self._shape
+        if shape is None:
+            shape = self._shape = SdfShapeCommand(self.center, (radius, radius), fill_color=(0.0, 0.0, 0.0, 0.0))
+        shape.center = self.center
+        shape.half_size = (radius, radius)
+        shape.corner_radius = radius
+        shape.outline_width = self.width
+        shape.outline_color = self.color
+        return shape
+
+    def tessellate(self) -> FlatColorShaderCommand:
         cx, cy = self.center
         radius = max(self.radius, self.width)
         inner_radius = max(radius - self.width, 0.0)
-        segment_count = max(self.segments, 12)
+        if self.segments is None:
+            segment_count = circle_segments(radius, self.scale)
+        else:
+            segment_count = max(self.segments, CIRCLE_MIN_SEGMENTS)
+        cos_table, sin_table = unit_circle(segment_count)
 
-        positions: list[tuple[float, float]] = []
-        indices: list[tuple[int, int, int]] = []
+        mesh = self._mesh
+        if mesh is None:
+            mesh = self._mesh = FlatColorShaderCommand(pos=[], color=[], indices=[])
+        positions = typing.cast(list[tuple[float, float]], mesh.pos)
+        colors = typing.cast(list[tuple[float, float, float, float]], mesh.color)
+        indices = typing.cast(list[tuple[int, int, int]], mesh.indices)
 
-        for index in range(segment_count):
-            angle = (index / segment_count) * math.tau
-            cos_angle = math.cos(angle)
-            sin_angle = math.sin(angle)
+        positions.clear()
+        for cos_angle, sin_angle in zip(cos_table, sin_table):
             positions.append((cx + cos_angle * radius, cy + sin_angle * radius))
             positions.append((cx + cos_angle * inner_radius, cy + sin_angle * inner_radius))
 
-        for index in range(segment_count):
-            outer_current = index * 2
-            inner_current = outer_current + 1 
-            outer_next = ((index + 1) % segment_count) * 2
-            inner_next = outer_next + 1
-            indices.append((outer_current, outer_next, inner_next))
-            indices.append((inner_next, inner_current, outer_current))
-
-        return FlatColorShaderCommand(
-            pos=positions,
-            color=[self.color] * len(positions),
-            indices=indices,
-        )
-
-    def draw(self):
-        self.unwrap().draw()
+        colors.clear()
+        colors.extend(itertools.repeat(self.color, len(positions)))
+
+        if len(indices) != segment_count * 2:
+            indices.clear()
+            for index in range(segment_count):
+                outer_current = index * 2
+                inner_current = outer_current + 1 
+                outer_next = ((index + 1) % segment_count) * 2
+                inner_next = outer_next + 1
+                indices.append((outer_current, outer_next, inner_next))
+                indices.append((inner_next, inner_current, outer_current))
+
+        return mesh
+
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        self.unwrap().draw(batch_cache)
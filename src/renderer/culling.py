@@ -0,0 +1,54 @@
+"""
+Culls draw commands whose bounds fall outside the visible viewport.
+"""
+import dataclasses
+
+ClipRect = tuple[float, float, float, float]
+
+
+def current_clip_rect() -> ClipRect | None:
+    """
+    Visible rect of the current viewport in region pixel coordinates
+
+    `POST_PIXEL` callbacks draw in region-local pixels, so the visible area is
+    `(0, 0, width, height)` of the bound viewport. None when it is unknown.
+    """
+    import gpu
+    try:
+        _, _, width, height = gpu.state.viewport_get()
+    except (AttributeError, ReferenceError, RuntimeError, ValueError):
+        return None
+    if width <= 0 or height <= 0:
+        return None
+    return (0.0, 0.0, float(width), float(height))
+
+
+def intersects(bounds: tuple[float, float, float, float], clip_rect: ClipRect) -> bool:
+    """True when the `(x, y, width, height)` rects overlap"""
+    x, y, width, height = bounds
+    clip_x, clip_y, clip_width, clip_height = clip_rect
+    return (
+        x <= clip_x + clip_width
+        and clip_x <= x + width
+        and y <= clip_y + clip_height
+        and clip_y <= y + height
+    )
+
+
+@dataclasses.dataclass
+class CullStats:
+    """Counters of the commands submitted and culled by a `RendererBatch`"""
+    submitted: int = 0
+    culled: int = 0
+    total_submitted: int = 0
+    total_culled: int = 0
+
+    def begin_frame(self) -> None:
+        self.submitted = 0
+        self.culled = 0
+
+    def count(self, submitted: int, culled: int) -> None:
+        self.submitted += submitted
+        self.culled += culled
+        self.total_submitted += submitted
+        self.total_culled += culled
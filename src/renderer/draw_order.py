@@ -0,0 +1,44 @@
+"""
+Layers and the sort key that groups unwrapped commands by shader pass.
+
+Shared by the GPU batch and the software rasterizer, so it does not import
+`gpu` or `bpy`.
+"""
+from .atlas_icon_command import AtlasIconCommand
+from .draw_protocol import DrawProtocol
+from .flat_color_shader_command import FlatColorShaderCommand
+from .image_shader_command import ImageShaderCommand
+from .instanced_rect_command import InstancedRectCommand
+from .sdf_shape_command import SdfShapeCommand
+
+LAYER_BACKGROUND = 0
+LAYER_CONTENT = 1
+LAYER_OVERLAY = 2
+
+SHADER_PASSES: tuple[type, ...] = (
+    FlatColorShaderCommand,
+    InstancedRectCommand,
+    SdfShapeCommand,
+    AtlasIconCommand,
+    ImageShaderCommand,
+)
+
+DrawKey = tuple[int, int, int]
+
+
+def draw_key(layer: int, command: DrawProtocol) -> DrawKey:
+    """
+    Sort key `(layer, shader pass, texture)` of an unwrapped command
+
+    Shader passes follow `SHADER_PASSES`; unknown commands draw last in their layer.
+    """
+    shader_pass = next(
+        (index for index, command_type in enumerate(SHADER_PASSES) if isinstance(command, command_type)),
+        len(SHADER_PASSES),
+    )
+    texture = 0
+    if isinstance(command, AtlasIconCommand):
+        texture = id(command.atlas)
+    elif isinstance(command, ImageShaderCommand) and command.texture is not None:
+        texture = id(command.texture)
+    return (layer, shader_pass, texture)
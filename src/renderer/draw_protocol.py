@@ -1,18 +1,36 @@
 """
 Defines the DrawCommand protocol
+
+The protocols declare empty `__slots__` so slotted commands stay free of `__dict__`.
 """
 import typing
 
+if typing.TYPE_CHECKING:
+    from .renderer_batch import BatchCache
+
 @typing.runtime_checkable
 class DrawProtocol(typing.Protocol):
     """Protocol for draw commands"""
 
-    def draw(self) -> None:
-        """Execute the draw command"""
+    __slots__ = ()
+
+    def draw(self, batch_cache: 'BatchCache | None' = None) -> None:
+        """Execute the draw command, reusing GPU batches from `batch_cache` when given"""
 
 @typing.runtime_checkable
 class UnwrapProtocol(typing.Protocol):
     """Protocol for commands that can be unwrapped into another command"""
 
+    __slots__ = ()
+
     def unwrap(self) -> DrawProtocol:  # type: ignore
         """Unwrap the command into another draw command"""
+
+@typing.runtime_checkable
+class BoundsProtocol(typing.Protocol):
+    """Protocol for commands that know the screen rect they cover"""
+
+    __slots__ = ()
+
+    def bounds(self) -> tuple[float, float, float, float]:  # type: ignore
+        """Bounding rect `(x, y, width, height)` of everything the command draws"""
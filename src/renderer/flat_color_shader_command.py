@@ -3,14 +3,16 @@ Defines a command to render flat colored shapes using Blender's GPU module.
 """
 import typing
 import dataclasses
-import gpu
-from gpu_extras.batch import batch_for_shader
 
 from .builtin_vertices import RectangleIndices, RectangleVertices
 from .draw_protocol import DrawProtocol
 
+if typing.TYPE_CHECKING:
+    import gpu
+    from .renderer_batch import BatchCache
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class FlatColorShaderCommand(DrawProtocol):
     """Wrapper for FLAT_COLOR shader"""
 
@@ -23,15 +25,14 @@ class FlatColorShaderCommand(DrawProtocol):
     )
     indices: typing.Sequence[float] | typing.Sequence[typing.Sequence[float]] = dataclasses.field(default_factory=RectangleIndices)
 
-    def draw(self):
-        """Draw the rectangle using the FLAT_COLOR shader"""
-        
-        gpu.state.blend_set('ALPHA')
-        gpu.state.depth_test_set('NONE')
-        
-        shader: gpu.types.GPUShader = gpu.shader.from_builtin('FLAT_COLOR')
+    def batch_key(self) -> typing.Hashable:
+        """Cache key built from the shader and the command geometry"""
+        return ('FLAT_COLOR', tuple(self.pos), tuple(self.color), tuple(self.indices))  # type: ignore
 
-        batch = batch_for_shader(  # type: ignore
+    def build_batch(self, shader: 'gpu.types.GPUShader') -> 'gpu.types.GPUBatch':
+        """Upload the command geometry into a new GPUBatch"""
+        from gpu_extras.batch import batch_for_shader
+        return batch_for_shader(  # type: ignore
             shader,
             'TRIS',
             {
@@ -41,18 +42,21 @@ class FlatColorShaderCommand(DrawProtocol):
             indices=self.indices
         )
 
-        shader.bind()
-        batch.draw(shader)
-
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        """Draw the rectangle using the FLAT_COLOR shader"""
+        import gpu
+        from . import gpu_state
 
-    # is too slow for large merges
-    def __add__(self, other: 'FlatColorShaderCommand') -> 'FlatColorShaderCommand':
-        biggest_index = max(max(tri) for tri in self.indices)  # type: ignore
-        other_indices_offset = list(tuple( # type: ignore
-            index + biggest_index + 1 for index in tri) for tri in other.indices)  # type: ignore
+        gpu_state.blend_set('ALPHA')
+        gpu_state.depth_test_set('NONE')
         
-        return FlatColorShaderCommand(
-            pos=self.pos + other.pos,  # type: ignore
-            color=self.color + other.color,  # type: ignore
-            indices=self.indices + other_indices_offset  # type: ignore
-        )
+        shader = gpu.shader.from_builtin('FLAT_COLOR')
+
+        if batch_cache is None:
+            batch = self.build_batch(shader)
+        else:
+            batch = batch_cache.get(self.batch_key(), lambda: self.build_batch(shader))
+
+        gpu_state.bind(shader)
+        batch.draw(shader)
+
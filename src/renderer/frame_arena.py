@@ -0,0 +1,56 @@
+"""
+Recycles draw command objects from one frame to the next.
+"""
+import dataclasses
+import functools
+import typing
+
+CommandT = typing.TypeVar("CommandT")
+
+
+@functools.cache
+def _init_fields(command_type: type) -> tuple[dataclasses.Field, ...]:
+    return tuple(field for field in dataclasses.fields(command_type) if field.init)
+
+
+class FrameArena:
+    """
+    Free lists of command dataclasses, refilled by `reset()` each frame
+
+    A recycled command gets its init fields assigned in place instead of
+    running `__init__`, so fields with `init=False` (the unwrapped command a
+    command keeps for reuse) survive and are updated rather than reallocated.
+    Commands acquired in a frame must not be kept past the next `reset()`.
+    """
+
+    def __init__(self) -> None:
+        self.free: dict[type, list[typing.Any]] = {}
+        self.used: list[typing.Any] = []
+
+    def acquire(self, command_type: type[CommandT], *args: typing.Any, **kwargs: typing.Any) -> CommandT:
+        """A `command_type(*args, **kwargs)`, recycled from a previous frame when one is free"""
+        free = self.free.get(command_type)
+        if not free:
+            command = command_type(*args, **kwargs)
+        else:
+            command = free.pop()
+            for index, field in enumerate(_init_fields(command_type)):
+                if index < len(args):
+                    value = args[index]
+                elif field.name in kwargs:
+                    value = kwargs[field.name]
+                elif field.default is not dataclasses.MISSING:
+                    value = field.default
+                elif field.default_factory is not dataclasses.MISSING:
+                    value = field.default_factory()
+                else:
+                    raise TypeError(f"{command_type.__name__} missing argument {field.name!r}")
+                setattr(command, field.name, value)
+        self.used.append(command)
+        return command
+
+    def reset(self) -> None:
+        """Return every command acquired since the last reset to the free lists"""
+        for command in self.used:
+            self.free.setdefault(type(command), []).append(command)
+        self.used.clear()
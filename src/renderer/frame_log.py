@@ -0,0 +1,318 @@
+"""
+Binary log of the unwrapped commands of each frame, for offline profiling and replay.
+
+Layout (little endian, every section 4-byte aligned):
+
+- file header = `b"NPFL"`, `uint32` version
+- frame = `b"FRAM"`, `uint32` frame index, `uint32` body size, body
+- body = `uint32` record count, records
+- record = `uint8` kind, `uint8` layer, `uint16` texture name length,
+  `uint32` vertex count, `uint32` triangle count, `uint8` attribute count,
+  `uint8` uniform count, 2 pad bytes, texture name, `float32` uniforms,
+  attributes, `uint32` indices (3 per triangle)
+- attribute = `uint8` name length, `uint8` components, 2 pad bytes, name,
+  `float32` values (`components` per vertex)
+"""
+import dataclasses
+import enum
+import mmap
+import struct
+import typing
+
+import numpy
+
+from .atlas_icon_command import AtlasIconCommand
+from .builtin_vertices import RectangleVertices
+from .draw_protocol import DrawProtocol
+from .flat_color_shader_command import FlatColorShaderCommand
+from .image_render_command import ImageRenderCommand
+from .image_shader_command import ImageShaderCommand
+from .instanced_rect_command import INSTANCE_FLOATS, InstancedRectCommand
+from .sdf_shape_command import SdfShapeCommand
+
+FRAME_LOG_MAGIC = b"NPFL"
+FRAME_LOG_VERSION = 1
+FRAME_MAGIC = b"FRAM"
+
+_FILE_HEADER = struct.Struct("<4sI")
+_FRAME_HEADER = struct.Struct("<4sII")
+_RECORD_COUNT = struct.Struct("<I")
+_RECORD_HEADER = struct.Struct("<BBHIIBBxx")
+_ATTRIBUTE_HEADER = struct.Struct("<BBxx")
+
+ATLAS_TEXTURE_NAME = "ICON_ATLAS"
+
+
+class RecordKind(enum.IntEnum):
+    FLAT_COLOR = 1
+    SDF_SHAPE = 2
+    ATLAS_ICON = 3
+    IMAGE = 4
+    RECT_INSTANCES = 5
+
+
+@dataclasses.dataclass
+class FrameRecord:
+    """One unwrapped command; arrays are views into the log when read back"""
+    kind: RecordKind
+    layer: int
+    texture: str = ""
+    uniforms: tuple[float, ...] = ()
+    attributes: dict[str, numpy.ndarray] = dataclasses.field(default_factory=dict)
+    indices: numpy.ndarray = dataclasses.field(default_factory=lambda: numpy.zeros((0, 3), dtype=numpy.uint32))
+
+    @property
+    def vertex_count(self) -> int:
+        return next((len(values) for values in self.attributes.values()), 0)
+
+
+@dataclasses.dataclass
+class LoggedFrame:
+    index: int
+    records: list[FrameRecord]
+
+
+def _padded(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 4)
+
+
+def _rows(values: typing.Any, components: int) -> numpy.ndarray:
+    return numpy.asarray(values, dtype=numpy.float32).reshape(-1, components)
+
+
+def texture_name(draw_call: DrawProtocol) -> str:
+    """Name a replay backend resolves the command's texture by"""
+    if isinstance(draw_call, ImageRenderCommand):
+        try:
+            return draw_call.image.name
+        except ReferenceError:
+            return ""
+    if isinstance(draw_call, AtlasIconCommand):
+        return ATLAS_TEXTURE_NAME
+    return ""
+
+
+def encode_command(layer: int, command: DrawProtocol, texture: str = "") -> FrameRecord | None:
+    """Describe an unwrapped command as a record; None for commands the log does not know"""
+    if isinstance(command, FlatColorShaderCommand):
+        return FrameRecord(
+            RecordKind.FLAT_COLOR,
+            layer,
+            attributes={"pos": _rows(command.pos, 2), "color": _rows(command.color, 4)},
+            indices=numpy.asarray(command.indices, dtype=numpy.uint32).reshape(-1, 3),
+        )
+    if isinstance(command, SdfShapeCommand):
+        vertices, indices = command.quad()
+        components = {"pos": 2, "local": 2, "shape": 4, "fillColor": 4, "outlineColor": 4}
+        return FrameRecord(
+            RecordKind.SDF_SHAPE,
+            layer,
+            attributes={name: _rows(vertices[name], count) for name, count in components.items()},
+            indices=numpy.asarray(indices, dtype=numpy.uint32),
+        )
+    if isinstance(command, AtlasIconCommand):
+        positions, tex_coords, indices = command.quad()
+        return FrameRecord(
+            RecordKind.ATLAS_ICON,
+            layer,
+            texture or ATLAS_TEXTURE_NAME,
+            (command.opacity,),
+            {"pos": _rows(positions, 2), "texCoord": _rows(tex_coords, 2)},
+            numpy.asarray(indices, dtype=numpy.uint32),
+        )
+    if isinstance(command, ImageRenderCommand):
+        image_command = ImageShaderCommand(None, RectangleVertices(command.bounds()), opacity=command.opacity)
+        return encode_command(layer, image_command, texture)
+    if isinstance(command, ImageShaderCommand):
+        return FrameRecord(
+            RecordKind.IMAGE,
+            layer,
+            texture,
+            (command.opacity,),
+            {"pos": _rows(command.pos, 2), "texCoord": _rows(command.tex_coord, 2)},
+            numpy.asarray(command.indices, dtype=numpy.uint32).reshape(-1, 3),
+        )
+    if isinstance(command, InstancedRectCommand):
+        return FrameRecord(
+            RecordKind.RECT_INSTANCES,
+            layer,
+            attributes={"instance": _rows(command.values[:len(command) * INSTANCE_FLOATS], INSTANCE_FLOATS)},
+        )
+    return None
+
+
+def _encode_record(record: FrameRecord) -> bytes:
+    name = record.texture.encode("utf-8")
+    parts = [
+        _RECORD_HEADER.pack(
+            int(record.kind),
+            record.layer,
+            len(name),
+            record.vertex_count,
+            len(record.indices),
+            len(record.attributes),
+            len(record.uniforms),
+        ),
+        _padded(name),
+        numpy.asarray(record.uniforms, dtype=numpy.float32).tobytes(),
+    ]
+    for attribute, values in record.attributes.items():
+        attribute_name = attribute.encode("utf-8")
+        parts.append(_ATTRIBUTE_HEADER.pack(len(attribute_name), values.shape[1]))
+        parts.append(_padded(attribute_name))
+        parts.append(numpy.ascontiguousarray(values, dtype=numpy.float32).tobytes())
+    parts.append(numpy.ascontiguousarray(record.indices, dtype=numpy.uint32).tobytes())
+    return b"".join(parts)
+
+
+class FrameLogWriter:
+    """
+    Appends frames to a log file
+
+    Every frame is flushed as one write, so a session that ends without
+    `close` leaves whole frames behind.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.file = open(path, "wb")
+        self.file.write(_FILE_HEADER.pack(FRAME_LOG_MAGIC, FRAME_LOG_VERSION))
+        self.frame_index = 0
+        self.last_body = _RECORD_COUNT.pack(0)
+
+    def write_frame(self, entries: typing.Iterable[tuple[int, DrawProtocol, DrawProtocol]]) -> None:
+        """Write one frame of `(layer, queued draw call, unwrapped command)` entries"""
+        records = [
+            record for record in (
+                encode_command(layer, command, texture_name(draw_call)) for layer, draw_call, command in entries
+            )
+            if record is not None
+        ]
+        self.last_body = _RECORD_COUNT.pack(len(records)) + b"".join(_encode_record(record) for record in records)
+        self._write_body(self.last_body)
+
+    def write_repeat(self) -> None:
+        """Write the previous frame again, for frames replayed from the batch"""
+        self._write_body(self.last_body)
+
+    def _write_body(self, body: bytes) -> None:
+        self.file.write(_FRAME_HEADER.pack(FRAME_MAGIC, self.frame_index, len(body)) + body)
+        self.file.flush()
+        self.frame_index += 1
+
+    def close(self) -> None:
+        """Flush and close the file; safe to call more than once"""
+        if self.file.closed:
+            return
+        self.file.flush()
+        self.file.close()
+
+
+class FrameLogReader:
+    """Memory-maps a log; records reference the mapping without copying"""
+
+    def __init__(self, path: str) -> None:
+        self.file = open(path, "rb")
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = _FILE_HEADER.unpack_from(self.mapping, 0)
+        if magic != FRAME_LOG_MAGIC or version != FRAME_LOG_VERSION:
+            raise ValueError(f"Not a frame log (version {FRAME_LOG_VERSION}): {path}")
+
+    def frames(self) -> typing.Iterator[LoggedFrame]:
+        offset = _FILE_HEADER.size
+        while offset + _FRAME_HEADER.size <= len(self.mapping):
+            magic, index, size = _FRAME_HEADER.unpack_from(self.mapping, offset)
+            if magic != FRAME_MAGIC:
+                raise ValueError(f"Corrupt frame log at byte {offset}")
+            offset += _FRAME_HEADER.size
+            if offset + size > len(self.mapping):
+                # A session that was killed mid-write; keep the whole frames before it
+                return
+            yield LoggedFrame(index, self._records(offset))
+            offset += size
+
+    def _records(self, offset: int) -> list[FrameRecord]:
+        buffer = self.mapping
+        (count,) = _RECORD_COUNT.unpack_from(buffer, offset)
+        offset += _RECORD_COUNT.size
+        records: list[FrameRecord] = []
+        for _ in range(count):
+            kind, layer, name_length, vertex_count, triangle_count, attribute_count, uniform_count = (
+                _RECORD_HEADER.unpack_from(buffer, offset))
+            offset += _RECORD_HEADER.size
+            texture = bytes(buffer[offset:offset + name_length]).decode("utf-8")
+            offset += name_length + (-name_length % 4)
+            uniforms = tuple(numpy.frombuffer(buffer, numpy.float32, uniform_count, offset).tolist())
+            offset += uniform_count * 4
+
+            attributes: dict[str, numpy.ndarray] = {}
+            for _ in range(attribute_count):
+                attribute_length, components = _ATTRIBUTE_HEADER.unpack_from(buffer, offset)
+                offset += _ATTRIBUTE_HEADER.size
+                attribute = bytes(buffer[offset:offset + attribute_length]).decode("utf-8")
+                offset += attribute_length + (-attribute_length % 4)
+                values = numpy.frombuffer(buffer, numpy.float32, vertex_count * components, offset)
+                attributes[attribute] = values.reshape(vertex_count, components)
+                offset += vertex_count * components * 4
+
+            indices = numpy.frombuffer(buffer, numpy.uint32, triangle_count * 3, offset).reshape(triangle_count, 3)
+            offset += triangle_count * 12
+            records.append(FrameRecord(RecordKind(kind), layer, texture, uniforms, attributes, indices))
+        return records
+
+    def close(self) -> None:
+        if not self.mapping.closed:
+            self.mapping.close()
+        self.file.close()
+
+
+def decode_record(record: FrameRecord, texture_source: typing.Callable[[str], typing.Any]) -> DrawProtocol:
+    """Rebuild a draw command from a record; textures are resolved by name"""
+    attributes = record.attributes
+    indices = record.indices.tolist()
+    if record.kind == RecordKind.FLAT_COLOR:
+        return FlatColorShaderCommand(
+            pos=attributes["pos"].tolist(),
+            color=attributes["color"].tolist(),
+            indices=indices,
+        )
+    if record.kind == RecordKind.SDF_SHAPE:
+        positions = attributes["pos"]
+        half_width, half_height, corner_radius, outline_width = attributes["shape"][0].tolist()
+        return SdfShapeCommand(
+            center=tuple(positions.mean(axis=0).tolist()),  # type: ignore
+            half_size=(half_width, half_height),
+            corner_radius=corner_radius,
+            outline_width=outline_width,
+            fill_color=tuple(attributes["fillColor"][0].tolist()),  # type: ignore
+            outline_color=tuple(attributes["outlineColor"][0].tolist()),  # type: ignore
+        )
+    if record.kind == RecordKind.RECT_INSTANCES:
+        command = InstancedRectCommand()
+        for values in attributes["instance"].tolist():
+            command.add(
+                tuple(values[0:4]),  # type: ignore
+                tuple(values[4:8]),  # type: ignore
+                tuple(values[8:12]),  # type: ignore
+                values[12],
+                values[13],
+                values[14],
+            )
+        return command
+    return ImageShaderCommand(
+        texture=texture_source(record.texture),
+        pos=attributes["pos"].tolist(),
+        tex_coord=attributes["texCoord"].tolist(),
+        indices=indices,
+        opacity=record.uniforms[0] if record.uniforms else 1.0,
+    )
+
+
+def replay_frame(
+    frame: LoggedFrame,
+    batch: typing.Any,
+    texture_source: typing.Callable[[str], typing.Any] = lambda _name: None,
+) -> None:
+    """Queue a logged frame on `batch` (`RendererBatch` or `SoftwareBatch`) and draw it"""
+    for record in frame.records:
+        batch.add(decode_record(record, texture_source), record.layer)
+    batch.draw()
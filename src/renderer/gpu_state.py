@@ -0,0 +1,41 @@
+"""
+Skips redundant GPU state changes and shader binds within one batch draw.
+
+Blender and other add-ons change the GPU state between draw callbacks, so the
+tracked values are only trusted between `reset()` calls; `RendererBatch.draw`
+resets at its start and end.
+"""
+import gpu
+
+_blend: str | None = None
+_depth_test: str | None = None
+_shader: gpu.types.GPUShader | None = None
+
+
+def reset() -> None:
+    """Forget the tracked state so the next calls set it again"""
+    global _blend, _depth_test, _shader
+    _blend = None
+    _depth_test = None
+    _shader = None
+
+
+def blend_set(mode: str) -> None:
+    global _blend
+    if mode != _blend:
+        gpu.state.blend_set(mode)
+        _blend = mode
+
+
+def depth_test_set(mode: str) -> None:
+    global _depth_test
+    if mode != _depth_test:
+        gpu.state.depth_test_set(mode)
+        _depth_test = mode
+
+
+def bind(shader: gpu.types.GPUShader) -> None:
+    global _shader
+    if shader is not _shader:
+        shader.bind()
+        _shader = shader
@@ -0,0 +1,208 @@
+"""
+Packs icon images into a single texture atlas with per-icon UV rects.
+"""
+import dataclasses
+import math
+import typing
+
+import bpy
+import gpu
+import numpy
+
+from . import texture_cache
+
+ATLAS_PADDING = 2
+ATLAS_MIN_LEVEL_SIZE = 16
+
+_ATLAS_SHADER: gpu.types.GPUShader | None = None
+_ATLAS_SHADER_FAILED = False
+
+ATLAS_VERTEX_SHADER = """
+    uniform mat4 ModelViewProjectionMatrix;
+    in vec2 pos;
+    in vec2 texCoord;
+    in float opacity;
+    out vec2 texCoord_interp;
+    out float opacity_interp;
+
+    void main()
+    {
+        texCoord_interp = texCoord;
+        opacity_interp = opacity;
+        gl_Position = ModelViewProjectionMatrix * vec4(pos.xy, 0.0, 1.0);
+    }
+"""
+ATLAS_FRAGMENT_SHADER = """
+    uniform sampler2D image;
+    in vec2 texCoord_interp;
+    in float opacity_interp;
+    out vec4 fragColor;
+
+    void main()
+    {
+        vec4 color = texture(image, texCoord_interp);
+        fragColor = vec4(color.rgb, color.a * opacity_interp);
+    }
+"""
+
+
+def get_atlas_shader() -> gpu.types.GPUShader | None:
+    """Create the shader that draws UV-mapped atlas quads with per-vertex opacity."""
+    global _ATLAS_SHADER, _ATLAS_SHADER_FAILED
+    if _ATLAS_SHADER_FAILED:
+        return None
+
+    if _ATLAS_SHADER is None:
+        try:
+            _ATLAS_SHADER = gpu.types.GPUShader(ATLAS_VERTEX_SHADER, ATLAS_FRAGMENT_SHADER)
+        except Exception as ex:
+            _ATLAS_SHADER_FAILED = True
+            print(f"Icon atlas shader disabled: {ex}")
+            return None
+    return _ATLAS_SHADER
+
+
+@dataclasses.dataclass
+class AtlasRegion:
+    """
+    Placement of one icon inside the atlas
+
+    Each icon is packed at several downsampled levels (largest first) because
+    the atlas texture has no mipmaps; `uv_rect` picks the smallest level that
+    still covers the drawn size.
+    """
+    levels: tuple[tuple[float, tuple[float, float, float, float]], ...]
+
+    def uv_rect(self, draw_size: float) -> tuple[float, float, float, float]:
+        """UV rect `(u0, v0, u1, v1)` of the level best matching `draw_size` pixels"""
+        for level_size, uv_rect in reversed(self.levels):
+            if level_size >= draw_size:
+                return uv_rect
+        return self.levels[0][1]
+
+
+@dataclasses.dataclass(eq=False)
+class IconAtlas:
+    """Texture holding every packed icon, with the UV regions keyed by image pointer"""
+    texture: gpu.types.GPUTexture
+    size: tuple[int, int]
+    regions: dict[int, AtlasRegion]
+
+    def region(self, image: bpy.types.Image) -> AtlasRegion | None:
+        """Return the atlas region of `image`, if it was packed"""
+        return self.regions.get(image.as_pointer())
+
+
+def pack_shelves(
+    sizes: typing.Sequence[tuple[int, int]],
+    padding: int = ATLAS_PADDING,
+) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """
+    Shelf-pack rectangles, tallest first
+
+    Returns the bottom-left position of every rectangle (in input order)
+    and the total atlas size.
+    """
+    padded = [(width + padding * 2, height + padding * 2) for width, height in sizes]
+    area = sum(width * height for width, height in padded)
+    atlas_width = max(max((width for width, _ in padded), default=1), math.ceil(math.sqrt(area)))
+
+    positions: list[tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf_height = 0
+    for index in sorted(range(len(sizes)), key=lambda i: (-padded[i][1], -padded[i][0])):
+        width, height = padded[index]
+        if x + width > atlas_width:
+            y += shelf_height
+            x = shelf_height = 0
+        positions[index] = (x + padding, y + padding)
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    return positions, (atlas_width, max(y + shelf_height, 1))
+
+
+def _image_pixels(image: bpy.types.Image) -> numpy.ndarray | None:
+    width, height = int(image.size[0]), int(image.size[1])
+    if width <= 0 or height <= 0:
+        return None
+    pixels = numpy.empty(width * height * 4, dtype=numpy.float32)
+    image.pixels.foreach_get(pixels)  # type: ignore
+    return pixels.reshape(height, width, 4)
+
+
+def _downsample(pixels: numpy.ndarray) -> numpy.ndarray:
+    """Halve an RGBA image with a premultiplied 2x2 box filter"""
+    height, width = pixels.shape[0] // 2 * 2, pixels.shape[1] // 2 * 2
+    premultiplied = pixels[:height, :width].copy()
+    premultiplied[..., :3] *= premultiplied[..., 3:4]
+    average = premultiplied.reshape(height // 2, 2, width // 2, 2, 4).mean(axis=(1, 3))
+    alpha = average[..., 3:4]
+    numpy.divide(average[..., :3], alpha, out=average[..., :3], where=alpha > 0.0)
+    return average
+
+
+def _image_levels(pixels: numpy.ndarray) -> list[numpy.ndarray]:
+    levels = [pixels]
+    while min(levels[-1].shape[0], levels[-1].shape[1]) // 2 >= ATLAS_MIN_LEVEL_SIZE:
+        levels.append(_downsample(levels[-1]))
+    return levels
+
+
+def build_icon_atlas(images: typing.Iterable[bpy.types.Image]) -> IconAtlas | None:
+    """Pack `images` into one GPU texture"""
+    if get_atlas_shader() is None:
+        return None
+
+    owners: list[int] = []
+    levels: list[numpy.ndarray] = []
+    for image in images:
+        pixels = _image_pixels(image)
+        if pixels is None:
+            continue
+        for level in _image_levels(pixels):
+            owners.append(image.as_pointer())
+            levels.append(level)
+
+    if not levels:
+        return None
+
+    positions, (atlas_width, atlas_height) = pack_shelves([(level.shape[1], level.shape[0]) for level in levels])
+    atlas_pixels = numpy.zeros((atlas_height, atlas_width, 4), dtype=numpy.float32)
+    region_levels: dict[int, list[tuple[float, tuple[float, float, float, float]]]] = {}
+    for owner, level, (x, y) in zip(owners, levels, positions):
+        height, width = level.shape[0], level.shape[1]
+        atlas_pixels[y:y + height, x:x + width] = level
+        region_levels.setdefault(owner, []).append((
+            float(max(width, height)),
+            (x / atlas_width, y / atlas_height, (x + width) / atlas_width, (y + height) / atlas_height),
+        ))
+
+    buffer = gpu.types.Buffer('FLOAT', atlas_width * atlas_height * 4, atlas_pixels.ravel())
+    texture = gpu.types.GPUTexture((atlas_width, atlas_height), format='RGBA8', data=buffer)
+    return IconAtlas(
+        texture=texture,
+        size=(atlas_width, atlas_height),
+        regions={owner: AtlasRegion(tuple(region)) for owner, region in region_levels.items()},
+    )
+
+
+def _build_icon_atlas_or_none(images: list[bpy.types.Image]) -> IconAtlas | None:
+    try:
+        return build_icon_atlas(images)
+    except Exception as ex:
+        print(f"Icon atlas disabled: {ex}")
+        return None
+
+
+def get_icon_atlas(images: typing.Iterable[bpy.types.Image | None]) -> IconAtlas | None:
+    """Return the atlas packing `images`, building it on first use or after any of them reloads"""
+    loaded_images = [image for image in images if image is not None]
+    try:
+        image_keys = tuple(sorted(texture_cache.image_key(image) for image in loaded_images))
+    except ReferenceError:
+        return None
+    return texture_cache.get(
+        ('ICON_ATLAS', image_keys),
+        image_keys,
+        lambda: _build_icon_atlas_or_none(loaded_images),
+    )
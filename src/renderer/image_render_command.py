@@ -3,31 +3,43 @@ Defines a command to render an image using Blender's GPU module.
 """
 import typing
 import dataclasses
-import bpy
 
 from .builtin_vertices import RectangleVertices
-from .draw_protocol import DrawProtocol, UnwrapProtocol
+from .draw_protocol import BoundsProtocol, DrawProtocol, UnwrapProtocol
 from .image_shader_command import ImageShaderCommand
 
+if typing.TYPE_CHECKING:
+    import bpy
+    from .renderer_batch import BatchCache
 
-@dataclasses.dataclass
-class ImageRenderCommand(DrawProtocol, UnwrapProtocol):
-    """Represents an image draw operation"""
-    image: bpy.types.Image
+
+@dataclasses.dataclass(slots=True)
+class ImageRenderCommand(DrawProtocol, UnwrapProtocol, BoundsProtocol):
+    """Represents an image draw operation; the unwrapped command is kept for reuse"""
+    image: 'bpy.types.Image'
     pos: tuple[float, float]
     size: typing.Optional[tuple[float, float]]
     opacity: float = 1.0
+    _shader_command: ImageShaderCommand | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
     
+    def bounds(self) -> tuple[float, float, float, float]:
+        size = self.size or (float(self.image.size[0]), float(self.image.size[1]))
+        return (self.pos[0], self.pos[1], size[0], size[1])
+
     def unwrap(self) -> ImageShaderCommand:
+        from .texture_cache import texture_for_image
+
         image, pos = self.image, self.pos
 
         size = self.size or (float(image.size[0]), float(image.size[1]))
 
-        return ImageShaderCommand(
-            image=image,
-            pos=RectangleVertices((pos[0], pos[1], size[0], size[1])),
-            opacity=self.opacity,
-        )
+        command = self._shader_command
+        if command is None:
+            command = self._shader_command = ImageShaderCommand(None)
+        command.texture = texture_for_image(image)
+        command.pos = RectangleVertices((pos[0], pos[1], size[0], size[1]))
+        command.opacity = self.opacity
+        return command
 
-    def draw(self):
-        self.unwrap().draw()
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        self.unwrap().draw(batch_cache)
@@ -3,13 +3,14 @@ Defines a command to render an image using Blender's GPU module.
 """
 import typing
 import dataclasses
-import gpu
-import bpy
-from gpu_extras.batch import batch_for_shader
 
 from .draw_protocol import DrawProtocol
 
-_IMAGE_OPACITY_SHADER: gpu.types.GPUShader | None = None
+if typing.TYPE_CHECKING:
+    import gpu
+    from .renderer_batch import BatchCache
+
+_IMAGE_OPACITY_SHADER: 'gpu.types.GPUShader | None' = None
 _IMAGE_OPACITY_SHADER_FAILED = False
 IMAGE_OPACITY_VERTEX_SHADER = """
     uniform mat4 ModelViewProjectionMatrix;
@@ -37,13 +38,14 @@ IMAGE_OPACITY_FRAGMENT_SHADER = """
 """
 
 
-def get_image_opacity_shader() -> gpu.types.GPUShader | None:
+def get_image_opacity_shader() -> 'gpu.types.GPUShader | None':
     """Create the image shader used when an icon needs alpha fading."""
     global _IMAGE_OPACITY_SHADER, _IMAGE_OPACITY_SHADER_FAILED
     if _IMAGE_OPACITY_SHADER_FAILED:
         return None
 
     if _IMAGE_OPACITY_SHADER is None:
+        import gpu
         try:
             _IMAGE_OPACITY_SHADER = gpu.types.GPUShader(IMAGE_OPACITY_VERTEX_SHADER, IMAGE_OPACITY_FRAGMENT_SHADER)
         except Exception as ex:
@@ -53,11 +55,11 @@ def get_image_opacity_shader() -> gpu.types.GPUShader | None:
     return _IMAGE_OPACITY_SHADER
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ImageShaderCommand(DrawProtocol):
     """Wrapper for IMAGE shader"""
 
-    image: bpy.types.Image
+    texture: 'gpu.types.GPUTexture | None'
     pos: typing.Sequence[float] | typing.Sequence[typing.Sequence[float]] = (
         (0, 0),
         (1, 0),
@@ -74,21 +76,14 @@ class ImageShaderCommand(DrawProtocol):
         (0, 1, 2), (2, 3, 0))
     opacity: float = 1.0
 
-    def draw(self):
-        """Draw the image using the IMAGE shader"""
-        if self.opacity <= 0.0:
-            return
-
-        self.image.gl_load()
-
-        # Set up GPU state for image rendering
-        gpu.state.blend_set('ALPHA')
-        gpu.state.depth_test_set('NONE')
-
-        opacity_shader = None if self.opacity >= 1.0 else get_image_opacity_shader()
-        shader = opacity_shader or gpu.shader.from_builtin('IMAGE')
+    def batch_key(self, shader_name: str) -> typing.Hashable:
+        """Cache key built from the shader and the quad geometry"""
+        return (shader_name, tuple(self.pos), tuple(self.tex_coord), tuple(self.indices))  # type: ignore
 
-        batch = batch_for_shader(  # type: ignore
+    def build_batch(self, shader: 'gpu.types.GPUShader') -> 'gpu.types.GPUBatch':
+        """Upload the quad geometry into a new GPUBatch"""
+        from gpu_extras.batch import batch_for_shader
+        return batch_for_shader(  # type: ignore
             shader, 'TRIS',
             {
                 "pos": self.pos,
@@ -97,9 +92,28 @@ class ImageShaderCommand(DrawProtocol):
             indices=self.indices
         )
 
-        texture = gpu.texture.from_image(self.image)
-        shader.bind()
-        shader.uniform_sampler("image", texture)
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        """Draw the image using the IMAGE shader"""
+        if self.opacity <= 0.0 or self.texture is None:
+            return
+        import gpu
+        from . import gpu_state
+
+        # Set up GPU state for image rendering
+        gpu_state.blend_set('ALPHA')
+        gpu_state.depth_test_set('NONE')
+
+        opacity_shader = None if self.opacity >= 1.0 else get_image_opacity_shader()
+        shader = opacity_shader or gpu.shader.from_builtin('IMAGE')
+        shader_name = 'IMAGE_OPACITY' if opacity_shader else 'IMAGE'
+
+        if batch_cache is None:
+            batch = self.build_batch(shader)
+        else:
+            batch = batch_cache.get(self.batch_key(shader_name), lambda: self.build_batch(shader))
+
+        gpu_state.bind(shader)
+        shader.uniform_sampler("image", self.texture)
         if opacity_shader:
             shader.uniform_float("opacity", self.opacity)
         batch.draw(shader)
@@ -0,0 +1,128 @@
+"""
+Creates a command to draw many SDF rects as instances of one unit quad.
+"""
+import array
+import typing
+
+from .builtin_vertices import RectangleIndices, RectangleVertices
+from .culling import ClipRect, intersects
+from .draw_protocol import DrawProtocol
+from .sdf_shader import SDF_INSTANCE_CAPACITY, SDF_INSTANCE_VECTORS, get_instanced_sdf_shader
+
+if typing.TYPE_CHECKING:
+    import gpu
+    from .renderer_batch import BatchCache
+
+
+INSTANCE_FLOATS = SDF_INSTANCE_VECTORS * 4
+
+
+class InstancedRectCommand(DrawProtocol):
+    """
+    Per-instance rect data drawn with `draw_instanced` on a shared unit quad
+
+    The Python `gpu` module cannot attach a per-instance vertex buffer to a
+    batch, so the instance records are uploaded as a uniform array that the
+    vertex shader indexes with `gl_InstanceID`. Each record is four `vec4`:
+
+    - rect = `x, y, width, height`
+    - fill color
+    - outline color
+    - style = `opacity, outline_width, corner_radius, 0`
+
+    Records live in one growable float array that is reused from frame to
+    frame. Each `add` still writes one record, and the records are drawn in
+    chunks of `SDF_INSTANCE_CAPACITY`: one draw call per 32 rects instead of
+    one per rect.
+    """
+
+    __slots__ = ('values', 'count')
+
+    def __init__(self) -> None:
+        self.values = array.array('f')
+        self.count = 0
+
+    def clear(self) -> None:
+        """Forget the added instances but keep the allocated storage"""
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(
+        self,
+        rect: tuple[float, float, float, float],
+        fill_color: tuple[float, float, float, float],
+        outline_color: tuple[float, float, float, float],
+        opacity: float = 1.0,
+        outline_width: float = 1.0,
+        corner_radius: float = 0.0,
+    ) -> None:
+        """Add one rect instance"""
+        start = self.count * INSTANCE_FLOATS
+        end = start + INSTANCE_FLOATS
+        if len(self.values) < end:
+            self.values.frombytes(bytes(max(INSTANCE_FLOATS, len(self.values)) * self.values.itemsize))
+        self.values[start:end] = array.array('f', (
+            *rect,
+            *fill_color,
+            *outline_color,
+            opacity, outline_width, corner_radius, 0.0,
+        ))
+        self.count += 1
+
+    def cull(self, clip_rect: ClipRect) -> int:
+        """Drop the instances outside `clip_rect`, keeping the order of the rest; returns the count dropped"""
+        kept = 0
+        for index in range(self.count):
+            start = index * INSTANCE_FLOATS
+            if not intersects(self.values[start:start + 4], clip_rect):  # type: ignore
+                continue
+            if kept != index:
+                self.values[kept * INSTANCE_FLOATS:(kept + 1) * INSTANCE_FLOATS] = self.values[start:start + INSTANCE_FLOATS]
+            kept += 1
+        culled = self.count - kept
+        self.count = kept
+        return culled
+
+    def snapshot(self) -> 'InstancedRectCommand':
+        """Copy of the current instances, unaffected by later `clear` calls"""
+        copy = InstancedRectCommand()
+        copy.values = self.values[:self.count * INSTANCE_FLOATS]
+        copy.count = self.count
+        return copy
+
+    @staticmethod
+    def build_batch(shader: 'gpu.types.GPUShader') -> 'gpu.types.GPUBatch':
+        """Upload the unit quad shared by every instance"""
+        from gpu_extras.batch import batch_for_shader
+        return batch_for_shader(  # type: ignore
+            shader,
+            'TRIS',
+            {"pos": RectangleVertices((0.0, 0.0, 1.0, 1.0))},
+            indices=RectangleIndices(),
+        )
+
+    def draw(self, batch_cache: 'BatchCache | None' = None) -> None:
+        """Draw every instance, `SDF_INSTANCE_CAPACITY` per draw call"""
+        shader = get_instanced_sdf_shader()
+        if self.count == 0 or shader is None:
+            return
+        from . import gpu_state
+
+        gpu_state.blend_set('ALPHA')
+        gpu_state.depth_test_set('NONE')
+
+        if batch_cache is None:
+            batch = self.build_batch(shader)
+        else:
+            batch = batch_cache.get(('SDF_INSTANCE_QUAD',), lambda: self.build_batch(shader))
+
+        gpu_state.bind(shader)
+        location = shader.uniform_from_name("instances")
+        values = memoryview(self.values)
+        for first in range(0, self.count, SDF_INSTANCE_CAPACITY):
+            count = min(SDF_INSTANCE_CAPACITY, self.count - first)
+            chunk = values[first * INSTANCE_FLOATS:(first + count) * INSTANCE_FLOATS]
+            shader.uniform_vector_float(location, chunk, 4, count * SDF_INSTANCE_VECTORS)
+            batch.draw_instanced(shader, instance_count=count)
@@ -0,0 +1,361 @@
+"""
+Growable mesh builders that merge geometry into a single draw call.
+"""
+import array
+import dataclasses
+import itertools
+import typing
+
+import gpu
+
+from . import gpu_state
+from .builtin_vertices import RectangleIndices, packed_colors, rectangle_positions, uniform_color
+from .icon_atlas import get_atlas_shader
+from .sdf_shader import SDF_ANTIALIAS_MARGIN, get_sdf_shader
+
+if typing.TYPE_CHECKING:
+    from .atlas_icon_command import AtlasIconCommand
+    from .flat_color_shader_command import FlatColorShaderCommand
+    from .renderer_batch import BatchCache
+    from .sdf_shape_command import SdfShapeCommand
+
+
+TRIANGLE_COMPONENTS = 3
+
+DEFAULT_VERTEX_CAPACITY = 256
+DEFAULT_TRIANGLE_CAPACITY = 256
+
+RECTANGLE_INDICES = RectangleIndices()
+
+VertexData = typing.Sequence[typing.Sequence[float]] | array.array  # type: ignore
+
+
+@dataclasses.dataclass(frozen=True)
+class VertexAttribute:
+    """
+    One vertex attribute and its storage
+
+    - `F32` = `float` per component, fetched as float
+    - `U8` = unsigned byte per component, normalized to `0..1` by the GPU
+
+    Values already packed into an `array` of the storage type are copied
+    as they are; rows of floats are converted by `pack`.
+    """
+    name: str
+    components: int
+    comp_type: typing.Literal['F32', 'U8'] = 'F32'
+
+    @property
+    def typecode(self) -> str:
+        return 'B' if self.comp_type == 'U8' else 'f'
+
+    @property
+    def fetch_mode(self) -> str:
+        return 'INT_TO_FLOAT_UNIT' if self.comp_type == 'U8' else 'FLOAT'
+
+    def pack(self, values: VertexData) -> array.array:  # type: ignore
+        """Convert rows of float components to the storage type"""
+        if isinstance(values, array.array):
+            return values
+        if self.comp_type == 'U8':
+            return packed_colors(values)
+        return array.array('f', itertools.chain.from_iterable(values))
+
+    def row_count(self, values: VertexData) -> int:
+        if isinstance(values, array.array):
+            return len(values) // self.components
+        return len(values)
+
+
+@dataclasses.dataclass(slots=True)
+class CompiledDraw:
+    """A built batch with the shader (and texture) it is drawn with, ready to replay"""
+    batch: gpu.types.GPUBatch
+    shader: gpu.types.GPUShader
+    texture: gpu.types.GPUTexture | None = None
+
+    def draw(self, batch_cache: 'BatchCache | None' = None) -> None:
+        gpu_state.blend_set('ALPHA')
+        gpu_state.depth_test_set('NONE')
+        gpu_state.bind(self.shader)
+        if self.texture is not None:
+            self.shader.uniform_sampler("image", self.texture)
+        self.batch.draw(self.shader)
+
+
+def _grow(values: array.array, required: int) -> None:  # type: ignore
+    """Grow `values` to hold `required` items, doubling to keep appends amortized O(1)"""
+    capacity = len(values)
+    if required <= capacity:
+        return
+    new_capacity = max(required, capacity * 2)
+    values.frombytes(bytes((new_capacity - capacity) * values.itemsize))
+
+
+def _rows(values: array.array, count: int, components: int) -> memoryview:  # type: ignore
+    """Return the first `count` rows of `values` as a 2D buffer without copying"""
+    return memoryview(values)[:count * components].cast('B').cast(values.typecode, (count, components))
+
+
+class MeshBuilder:
+    """
+    Appends vertex attributes and offset indices into preallocated typed arrays
+
+    Replaces merging commands with `+`, which rescanned every index with `max()`
+    and rebuilt Python lists for each merge. The arrays are handed to
+    `GPUVertBuf.attr_fill` through the buffer protocol with a matching
+    `GPUVertFormat`, so nothing is converted back to Python tuples on upload.
+
+    - attributes = `VertexAttribute` per name, stored as `float` or `ubyte` components
+    - indices = `uint3` per triangle, offset by the vertices already appended;
+      the Python API only accepts 4-byte indices, Blender stores them as
+      16-bit on the GPU when the vertex count allows
+    """
+
+    shader_name = ''
+
+    def __init__(
+        self,
+        attributes: typing.Sequence[VertexAttribute],
+        vertex_capacity: int = DEFAULT_VERTEX_CAPACITY,
+        triangle_capacity: int = DEFAULT_TRIANGLE_CAPACITY,
+    ) -> None:
+        self.attributes = tuple(attributes)
+        self.vertices = {attribute.name: array.array(attribute.typecode) for attribute in self.attributes}
+        for attribute in self.attributes:
+            _grow(self.vertices[attribute.name], vertex_capacity * attribute.components)
+        self.vertex_format: gpu.types.GPUVertFormat | None = None
+        self.indices = array.array('I', bytes(triangle_capacity * TRIANGLE_COMPONENTS * 4))
+        self.vertex_count = 0
+        self.triangle_count = 0
+
+    def clear(self) -> None:
+        """Forget the appended geometry but keep the allocated storage"""
+        self.vertex_count = 0
+        self.triangle_count = 0
+
+    def is_empty(self) -> bool:
+        return self.triangle_count == 0
+
+    def append(
+        self,
+        vertices: typing.Mapping[str, VertexData],
+        indices: typing.Sequence[typing.Sequence[int]],
+    ) -> None:
+        """Append triangles, offsetting their indices past the existing vertices"""
+        first = self.attributes[0]
+        vertex_start = self.vertex_count
+        vertex_end = vertex_start + first.row_count(vertices[first.name])
+        triangle_start = self.triangle_count
+        triangle_end = triangle_start + len(indices)
+
+        for attribute in self.attributes:
+            values = self.vertices[attribute.name]
+            components = attribute.components
+            _grow(values, vertex_end * components)
+            values[vertex_start * components:vertex_end * components] = attribute.pack(vertices[attribute.name])
+
+        _grow(self.indices, triangle_end * TRIANGLE_COMPONENTS)
+        self.indices[triangle_start * TRIANGLE_COMPONENTS:triangle_end * TRIANGLE_COMPONENTS] = array.array(
+            'I', (index + vertex_start for index in itertools.chain.from_iterable(indices)))
+
+        self.vertex_count = vertex_end
+        self.triangle_count = triangle_end
+
+    def vertex_buffers(self) -> dict[str, memoryview]:
+        """Per-attribute views of the appended vertices"""
+        return {
+            attribute.name: _rows(self.vertices[attribute.name], self.vertex_count, attribute.components)
+            for attribute in self.attributes
+        }
+
+    def index_buffer(self) -> memoryview:
+        """View of the appended triangle indices"""
+        return _rows(self.indices, self.triangle_count, TRIANGLE_COMPONENTS)
+
+    def batch_key(self) -> typing.Hashable:
+        """Cache key built from the shader and the merged geometry"""
+        return (
+            self.shader_name,
+            *(buffer.tobytes() for buffer in self.vertex_buffers().values()),
+            self.index_buffer().tobytes(),
+        )
+
+    def format(self) -> gpu.types.GPUVertFormat:
+        """Vertex format matching the attribute storage, created once"""
+        if self.vertex_format is None:
+            self.vertex_format = gpu.types.GPUVertFormat()
+            for attribute in self.attributes:
+                self.vertex_format.attr_add(
+                    id=attribute.name,
+                    comp_type=attribute.comp_type,
+                    len=attribute.components,
+                    fetch_mode=attribute.fetch_mode,
+                )
+        return self.vertex_format
+
+    def build_batch(self, shader: gpu.types.GPUShader) -> gpu.types.GPUBatch:
+        """Upload the merged geometry straight from the typed arrays"""
+        vertex_buffer = gpu.types.GPUVertBuf(self.format(), self.vertex_count)
+        for name, buffer in self.vertex_buffers().items():
+            vertex_buffer.attr_fill(name, buffer)
+        index_buffer = gpu.types.GPUIndexBuf(type='TRIS', seq=self.index_buffer())
+        return gpu.types.GPUBatch(type='TRIS', buf=vertex_buffer, elem=index_buffer)
+
+    def cached_batch(
+        self,
+        shader: gpu.types.GPUShader,
+        batch_cache: 'BatchCache | None' = None,
+    ) -> gpu.types.GPUBatch:
+        if batch_cache is None:
+            return self.build_batch(shader)
+        return batch_cache.get(self.batch_key(), lambda: self.build_batch(shader))
+
+
+class FlatColorMeshBuilder(MeshBuilder):
+    """
+    Merges FLAT_COLOR geometry
+
+    - positions = `float2` per vertex
+    - colors = `ubyte4` per vertex, normalized
+    """
+
+    shader_name = 'FLAT_COLOR_MESH'
+
+    def __init__(
+        self,
+        vertex_capacity: int = DEFAULT_VERTEX_CAPACITY,
+        triangle_capacity: int = DEFAULT_TRIANGLE_CAPACITY,
+    ) -> None:
+        super().__init__(
+            (VertexAttribute("pos", 2), VertexAttribute("color", 4, 'U8')),
+            vertex_capacity,
+            triangle_capacity,
+        )
+
+    def append_command(self, command: 'FlatColorShaderCommand') -> None:
+        """Append the geometry of a FLAT_COLOR command"""
+        self.append({"pos": command.pos, "color": command.color}, command.indices)  # type: ignore
+
+    def compile(self, batch_cache: 'BatchCache | None' = None) -> CompiledDraw | None:
+        """Build the FLAT_COLOR draw of all appended geometry"""
+        if self.is_empty():
+            return None
+
+        shader: gpu.types.GPUShader = gpu.shader.from_builtin('FLAT_COLOR')
+        return CompiledDraw(self.cached_batch(shader, batch_cache), shader)
+
+    def draw(self, batch_cache: 'BatchCache | None' = None) -> None:
+        """Draw all appended geometry with a single FLAT_COLOR draw call"""
+        compiled = self.compile(batch_cache)
+        if compiled is not None:
+            compiled.draw()
+
+
+class SdfMeshBuilder(MeshBuilder):
+    """
+    Merges SDF shape quads
+
+    - positions = `float2` per vertex
+    - local = `float2` offset from the shape center
+    - shape = `float4` half size, corner radius and outline width
+    - fillColor, outlineColor = `ubyte4` per vertex, normalized
+    """
+
+    shader_name = 'SDF_MESH'
+
+    def __init__(
+        self,
+        vertex_capacity: int = DEFAULT_VERTEX_CAPACITY,
+        triangle_capacity: int = DEFAULT_TRIANGLE_CAPACITY,
+    ) -> None:
+        super().__init__(
+            (
+                VertexAttribute("pos", 2),
+                VertexAttribute("local", 2),
+                VertexAttribute("shape", 4),
+                VertexAttribute("fillColor", 4, 'U8'),
+                VertexAttribute("outlineColor", 4, 'U8'),
+            ),
+            vertex_capacity,
+            triangle_capacity,
+        )
+
+    def append_command(self, command: 'SdfShapeCommand') -> None:
+        """Append the quad of an SDF shape command, written straight into typed arrays"""
+        half_width, half_height = command.half_size
+        extent_x = half_width + SDF_ANTIALIAS_MARGIN
+        extent_y = half_height + SDF_ANTIALIAS_MARGIN
+        shape = (half_width, half_height, min(command.corner_radius, half_width, half_height), command.outline_width)
+        self.append({
+            "pos": rectangle_positions(
+                (command.center[0] - extent_x, command.center[1] - extent_y, extent_x * 2.0, extent_y * 2.0)),
+            "local": array.array('f', (-extent_x, -extent_y, extent_x, -extent_y, extent_x, extent_y, -extent_x, extent_y)),
+            "shape": array.array('f', shape) * 4,
+            "fillColor": uniform_color(command.fill_color, 4),
+            "outlineColor": uniform_color(command.outline_color, 4),
+        }, RECTANGLE_INDICES)
+
+    def compile(self, batch_cache: 'BatchCache | None' = None) -> CompiledDraw | None:
+        """Build the SDF draw of all appended shapes"""
+        shader = get_sdf_shader()
+        if self.is_empty() or shader is None:
+            return None
+
+        return CompiledDraw(self.cached_batch(shader, batch_cache), shader)
+
+    def draw(self, batch_cache: 'BatchCache | None' = None) -> None:
+        """Draw all appended shapes with a single draw call"""
+        compiled = self.compile(batch_cache)
+        if compiled is not None:
+            compiled.draw()
+
+
+class AtlasMeshBuilder(MeshBuilder):
+    """
+    Merges UV-mapped icon quads that sample the same atlas texture
+
+    - positions = `float2` per vertex
+    - texCoord = `float2` per vertex
+    - opacity = `float` per vertex
+    """
+
+    shader_name = 'ICON_ATLAS_MESH'
+
+    def __init__(
+        self,
+        vertex_capacity: int = DEFAULT_VERTEX_CAPACITY,
+        triangle_capacity: int = DEFAULT_TRIANGLE_CAPACITY,
+    ) -> None:
+        super().__init__(
+            (VertexAttribute("pos", 2), VertexAttribute("texCoord", 2), VertexAttribute("opacity", 1)),
+            vertex_capacity,
+            triangle_capacity,
+        )
+
+    def append_command(self, command: 'AtlasIconCommand') -> None:
+        """Append the quad of an atlas icon command"""
+        u0, v0, u1, v1 = command.uv_rect
+        self.append({
+            "pos": rectangle_positions(command.rect),
+            "texCoord": array.array('f', (u0, v0, u1, v0, u1, v1, u0, v1)),
+            "opacity": array.array('f', (command.opacity,)) * 4,
+        }, RECTANGLE_INDICES)
+
+    def compile(
+        self,
+        texture: gpu.types.GPUTexture,
+        batch_cache: 'BatchCache | None' = None,
+    ) -> CompiledDraw | None:
+        """Build the textured draw of all appended quads"""
+        shader = get_atlas_shader()
+        if self.is_empty() or shader is None:
+            return None
+
+        return CompiledDraw(self.cached_batch(shader, batch_cache), shader, texture)
+
+    def draw(self, texture: gpu.types.GPUTexture, batch_cache: 'BatchCache | None' = None) -> None:
+        """Draw all appended quads with a single textured draw call"""
+        compiled = self.compile(texture, batch_cache)
+        if compiled is not None:
+            compiled.draw()
@@ -0,0 +1,189 @@
+"""
+Caches a finished UI frame in an offscreen texture and blits it with an opacity.
+"""
+import math
+import typing
+
+import gpu
+import mathutils
+from gpu_extras.batch import batch_for_shader
+
+from . import gpu_state
+from .builtin_vertices import RectangleIndices, RectangleVertices
+
+if typing.TYPE_CHECKING:
+    from .renderer_batch import BatchCache, RendererBatch
+
+
+COMPOSITE_MARGIN = 2
+
+_COMPOSITE_SHADER: gpu.types.GPUShader | None = None
+_COMPOSITE_SHADER_FAILED = False
+
+COMPOSITE_VERTEX_SHADER = """
+    uniform mat4 ModelViewProjectionMatrix;
+    in vec2 pos;
+    in vec2 texCoord;
+    out vec2 texCoord_interp;
+
+    void main()
+    {
+        texCoord_interp = texCoord;
+        gl_Position = ModelViewProjectionMatrix * vec4(pos.xy, 0.0, 1.0);
+    }
+"""
+COMPOSITE_FRAGMENT_SHADER = """
+    uniform sampler2D image;
+    uniform float opacity;
+    in vec2 texCoord_interp;
+    out vec4 fragColor;
+
+    void main()
+    {
+        fragColor = texture(image, texCoord_interp) * opacity;
+    }
+"""
+
+
+def get_composite_shader() -> gpu.types.GPUShader | None:
+    """Create the shader that blits a premultiplied offscreen texture with an opacity."""
+    global _COMPOSITE_SHADER, _COMPOSITE_SHADER_FAILED
+    if _COMPOSITE_SHADER_FAILED:
+        return None
+
+    if _COMPOSITE_SHADER is None:
+        try:
+            _COMPOSITE_SHADER = gpu.types.GPUShader(COMPOSITE_VERTEX_SHADER, COMPOSITE_FRAGMENT_SHADER)
+        except Exception as ex:
+            _COMPOSITE_SHADER_FAILED = True
+            print(f"Offscreen composite shader disabled: {ex}")
+            return None
+    return _COMPOSITE_SHADER
+
+
+def _pixel_projection(x: int, y: int, width: int, height: int) -> mathutils.Matrix:
+    """Orthographic projection mapping the region pixels `x, y, width, height` to the offscreen"""
+    return mathutils.Matrix((
+        (2.0 / width, 0.0, 0.0, -1.0 - 2.0 * x / width),
+        (0.0, 2.0 / height, 0.0, -1.0 - 2.0 * y / height),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, 0.0, 0.0, 1.0),
+    ))
+
+
+class OffscreenComposite:
+    """
+    One `GPUOffScreen` holding the last frame drawn for a key
+
+    The key describes everything that changes the pixels (layout relative to
+    the composite origin, hovered and active widgets, scale); the subpixel
+    offset of `bounds` is added to it. While it stays the same, the queued
+    commands are dropped and the texture is blitted with the requested
+    opacity, so fading or moving the composite only costs one textured quad.
+    """
+
+    def __init__(self) -> None:
+        self.offscreen: gpu.types.GPUOffScreen | None = None
+        self.key: typing.Hashable = None
+        self.failed = False
+
+    def is_available(self) -> bool:
+        return not self.failed and get_composite_shader() is not None
+
+    def is_cached(self, key: typing.Hashable, bounds: tuple[float, float, float, float]) -> bool:
+        """True when `draw(batch, key, bounds, ...)` will blit the cached frame without drawing `batch`"""
+        return self.offscreen is not None and key is not None and self._frame_key(key, bounds)[0] == self.key
+
+    def free(self) -> None:
+        """Release the offscreen buffer"""
+        if self.offscreen is not None:
+            self.offscreen.free()
+        self.offscreen = None
+        self.key = None
+
+    def draw(
+        self,
+        batch: 'RendererBatch',
+        key: typing.Hashable,
+        bounds: tuple[float, float, float, float],
+        opacity: float,
+    ) -> None:
+        """
+        Blit the cached frame for `key`, drawing `batch` into it first on a miss
+
+        A None `key` is never cached.
+        """
+        frame_key, (x, y, width, height) = self._frame_key(key, bounds)
+
+        if key is None or frame_key != self.key or self.offscreen is None:
+            if not self._render(batch, x, y, width, height):
+                batch.draw()
+                return
+            self.key = frame_key
+        else:
+            batch.clear()
+
+        self._blit(batch.batch_cache, (x, y, width, height), opacity)
+
+    @staticmethod
+    def _frame_key(
+        key: typing.Hashable,
+        bounds: tuple[float, float, float, float],
+    ) -> tuple[typing.Hashable, tuple[int, int, int, int]]:
+        """`key` with the subpixel offset and size of the offscreen, and its pixel rect"""
+        x = math.floor(bounds[0]) - COMPOSITE_MARGIN
+        y = math.floor(bounds[1]) - COMPOSITE_MARGIN
+        width = math.ceil(bounds[0] + bounds[2]) + COMPOSITE_MARGIN - x
+        height = math.ceil(bounds[1] + bounds[3]) + COMPOSITE_MARGIN - y
+        return (key, bounds[0] - x, bounds[1] - y, width, height), (x, y, width, height)
+
+    def _render(self, batch: 'RendererBatch', x: int, y: int, width: int, height: int) -> bool:
+        try:
+            if self.offscreen is None or (self.offscreen.width, self.offscreen.height) != (width, height):
+                self.free()
+                self.offscreen = gpu.types.GPUOffScreen(width, height)
+        except Exception as ex:
+            self.failed = True
+            self.free()
+            print(f"Offscreen composite disabled: {ex}")
+            return False
+
+        with self.offscreen.bind():
+            framebuffer = gpu.state.active_framebuffer_get()
+            framebuffer.clear(color=(0.0, 0.0, 0.0, 0.0))
+            with gpu.matrix.push_pop(), gpu.matrix.push_pop_projection():
+                gpu.matrix.load_identity()
+                gpu.matrix.load_projection_matrix(_pixel_projection(x, y, width, height))
+                # The composite is reused wherever it moves, so nothing is culled into it.
+                clip_rect, batch.clip_rect = batch.clip_rect, None
+                batch.draw()
+                batch.clip_rect = clip_rect
+        return True
+
+    def _blit(self, batch_cache: 'BatchCache', rect: tuple[int, int, int, int], opacity: float) -> None:
+        shader = get_composite_shader()
+        if opacity <= 0.0 or shader is None or self.offscreen is None:
+            return
+
+        gpu_state.blend_set('ALPHA_PREMULT')
+        gpu_state.depth_test_set('NONE')
+
+        x, y, width, height = rect
+        batch = batch_cache.get(('OFFSCREEN_COMPOSITE', width, height), lambda: batch_for_shader(  # type: ignore
+            shader,
+            'TRIS',
+            {
+                "pos": RectangleVertices((0.0, 0.0, width, height)),
+                "texCoord": RectangleVertices((0.0, 0.0, 1.0, 1.0)),
+            },
+            indices=RectangleIndices(),
+        ))
+
+        with gpu.matrix.push_pop():
+            gpu.matrix.translate((x, y))
+            gpu_state.bind(shader)
+            shader.uniform_sampler("image", self.offscreen.texture_color)
+            shader.uniform_float("opacity", opacity)
+            batch.draw(shader)
+        gpu_state.blend_set('ALPHA')
+        gpu_state.reset()
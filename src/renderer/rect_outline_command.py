@@ -1,31 +1,69 @@
 """
-Creates a command to draw a rectangle outline using four rectangles.
+Creates a command to draw a rectangle outline with the SDF shader, or four rectangles as a fallback.
 """
 
 import dataclasses
+import typing
 
-from .draw_protocol import DrawProtocol, UnwrapProtocol
+from .draw_protocol import BoundsProtocol, DrawProtocol, UnwrapProtocol
 from .flat_color_shader_command import FlatColorShaderCommand
 from .builtin_vertices import RectangleVertices, OutlineVertices, RectangleIndices, OutlineIndices
+from .sdf_shader import get_sdf_shader
+from .sdf_shape_command import SdfShapeCommand
 
-@dataclasses.dataclass
-class RectOutlineCommand(DrawProtocol, UnwrapProtocol):
-    """Command to draw a rectangle outline using four rectangles"""
+if typing.TYPE_CHECKING:
+    from .renderer_batch import BatchCache
+
+@dataclasses.dataclass(slots=True)
+class RectOutlineCommand(DrawProtocol, UnwrapProtocol, BoundsProtocol):
+    """
+    Command to draw a filled rectangle with an outline and optional rounded corners
+
+    The unwrapped command is kept and updated on the next unwrap, so a
+    command recycled by `FrameArena` does not allocate a new one.
+    """
     rect: tuple[float, float, float, float] = (0, 0, 100, 100)
     outline_color: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
     fill_color: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0)
     outline_width: float = 1.0
+    corner_radius: float = 0.0
+    _shape: SdfShapeCommand | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    _mesh: FlatColorShaderCommand | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self.rect
+
+    def unwrap(self) -> SdfShapeCommand | FlatColorShaderCommand:
+        """Convert to one SDF quad, or to FlatColorShaderCommand when the SDF shader is unavailable"""
+        if get_sdf_shader() is None:
+            return self.tessellate()
+        return self.sdf_shape()
+
+    def sdf_shape(self) -> SdfShapeCommand:
+        """The rect as one SDF quad"""
+        x, y, width, height = self.rect
+        shape = self._shape
+        if shape is None:
+            shape = self._shape = SdfShapeCommand((0.0, 0.0), (0.0, 0.0))
+        shape.center = (x + width * 0.5, y + height * 0.5)
+        shape.half_size = (width * 0.5, height * 0.5)
+        shape.corner_radius = self.corner_radius
+        shape.outline_width = self.outline_width
+        shape.fill_color = self.fill_color
+        shape.outline_color = self.outline_color
+        return shape
 
-    def unwrap(self) -> FlatColorShaderCommand:
-        """Convert to FlatColorShaderCommand"""
+    def tessellate(self) -> FlatColorShaderCommand:
+        """Convert to FlatColorShaderCommand; corners stay square"""
 
         rect, outline_color, fill_color, outline_width = self.rect, self.outline_color, self.fill_color, self.outline_width
 
-        return FlatColorShaderCommand(
-            pos=RectangleVertices(rect, outline_width) + OutlineVertices(rect, outline_width),
-            color=[fill_color] * RectangleIndices.offset_size() + [outline_color] * OutlineIndices.offset_size(),
-            indices=RectangleIndices(0) + OutlineIndices(4)
-        )
+        mesh = self._mesh
+        if mesh is None:
+            mesh = self._mesh = FlatColorShaderCommand(indices=RectangleIndices(0) + OutlineIndices(4))
+        mesh.pos = RectangleVertices(rect, outline_width) + OutlineVertices(rect, outline_width)
+        mesh.color = [fill_color] * RectangleIndices.offset_size() + [outline_color] * OutlineIndices.offset_size()
+        return mesh
 
-    def draw(self):
-        self.unwrap().draw()
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        self.unwrap().draw(batch_cache)
@@ -4,28 +4,83 @@ High-level interface for drawing operations with batching support
 import typing
 import bpy
 
+from .atlas_icon_command import AtlasIconCommand
+from .circle_outline_command import CircleOutlineCommand
 from .draw_protocol import DrawProtocol
+from .frame_arena import FrameArena
+from .frame_log import FrameLogWriter
+from .icon_atlas import IconAtlas
 from .image_render_command import ImageRenderCommand
+from .offscreen_composite import OffscreenComposite
+from .rect_outline_command import RectOutlineCommand
+from .sdf_shader import get_instanced_sdf_shader
 
+from .draw_order import LAYER_CONTENT
 from .renderer_batch import RendererBatch
 
 
 class Renderer:
-    """High-level interface for drawing operations with batching support"""
+    """
+    High-level interface for drawing operations with batching support
 
-    def __init__(self):
-        self.batch = RendererBatch()
+    The `add_*` helpers take their commands from `arena`, which recycles
+    them at `begin_frame` once the previous frame has been drawn.
+    """
 
-    def draw(self):
-        """Execute all batched draw operations"""
-        self.batch.draw()
+    def __init__(self, batch: RendererBatch | None = None):
+        self.batch = batch or RendererBatch()
+        self.composite = OffscreenComposite()
+        self.arena = FrameArena()
+
+    def draw(self, frame_key: typing.Hashable = None):
+        """Execute all batched draw operations, replaying the last frame when `frame_key` is unchanged"""
+        self.batch.draw(frame_key)
+
+    def begin_frame(self):
+        """Clip this frame's commands against the viewport bound by the draw callback"""
+        if self.batch.is_empty():
+            self.arena.reset()
+        self.batch.update_clip_rect()
+
+    def start_frame_log(self, path: str):
+        """Append every drawn frame to the binary frame log at `path`"""
+        self.stop_frame_log()
+        self.batch.frame_log = FrameLogWriter(path)
+
+    def stop_frame_log(self):
+        if self.batch.frame_log is not None:
+            self.batch.frame_log.close()
+            self.batch.frame_log = None
+
+    def is_cached(self, frame_key: typing.Hashable) -> bool:
+        """True when `draw(frame_key)` will replay the previous frame"""
+        return self.batch.is_cached(frame_key)
+
+    def is_composite_cached(self, key: typing.Hashable, bounds: tuple[float, float, float, float]) -> bool:
+        """True when `draw_composite(key, bounds)` will blit the cached frame"""
+        return self.composite.is_cached(key, bounds)
+
+    def free(self):
+        """Release the GPU resources held between frames and close the frame log; call when the overlay shuts down"""
+        self.composite.free()
+        self.stop_frame_log()
+
+    def draw_composite(
+        self,
+        key: typing.Hashable,
+        bounds: tuple[float, float, float, float],
+        opacity: float = 1.0
+    ):
+        """Draw the batched operations through the offscreen cache for `key`, blitted with `opacity`"""
+        self.composite.draw(self.batch, key, bounds, opacity)
         
     def add(
         self,
-        draw_call: DrawProtocol
+        draw_call: DrawProtocol,
+        layer: int = LAYER_CONTENT
     ):
-        """Add a draw call to the batch"""
-        self.batch.add(draw_call)
+        """Add a draw call to the batch; lower layers draw first"""
+        self.batch.add(draw_call, layer)
 
     def add_image(
         self,
@@ -35,4 +90,72 @@ class Renderer:
         opacity: float = 1.0
     ):
         """Draw an image at the specified position"""
-        self.batch.add(ImageRenderCommand(image, pos, size, opacity))
+        self.batch.add(self.arena.acquire(ImageRenderCommand, image, pos, size, opacity))
+
+    def add_atlas_icon(
+        self,
+        atlas: IconAtlas,
+        image: bpy.types.Image,
+        pos: tuple[float, float],
+        size: tuple[float, float],
+        opacity: float = 1.0
+    ) -> bool:
+        """Draw an image from `atlas`; returns False when the image is not packed in it"""
+        region = atlas.region(image)
+        if region is None:
+            return False
+        if opacity > 0.0:
+            self.batch.add(self.arena.acquire(
+                AtlasIconCommand,
+                atlas,
+                region.uv_rect(max(size)),
+                (pos[0], pos[1], size[0], size[1]),
+                opacity,
+            ))
+        return True
+
+    def add_rect_instance(
+        self,
+        rect: tuple[float, float, float, float],
+        fill_color: tuple[float, float, float, float],
+        outline_color: tuple[float, float, float, float],
+        opacity: float = 1.0,
+        outline_width: float = 1.0,
+        corner_radius: float = 0.0,
+    ) -> bool:
+        """Draw a rect as an instance of the shared unit quad; returns False when instancing is unavailable"""
+        if get_instanced_sdf_shader() is None:
+            return False
+        if opacity > 0.0:
+            self.batch.add_rect_instance(rect, fill_color, outline_color, opacity, outline_width, corner_radius)
+        return True
+
+    def add_rect_outline(
+        self,
+        rect: tuple[float, float, float, float],
+        outline_color: tuple[float, float, float, float],
+        fill_color: tuple[float, float, float, float],
+        outline_width: float = 1.0,
+        corner_radius: float = 0.0,
+        layer: int = LAYER_CONTENT
+    ):
+        """Draw a filled rect with an outline"""
+        self.batch.add(self.arena.acquire(
+            RectOutlineCommand,
+            rect,
+            outline_color,
+            fill_color,
+            outline_width,
+            corner_radius,
+        ), layer)
+
+    def add_circle_outline(
+        self,
+        center: tuple[float, float],
+        radius: float,
+        color: tuple[float, float, float, float],
+        width: float = 2.0,
+        layer: int = LAYER_CONTENT
+    ):
+        """Draw a ring of `width` pixels"""
+        self.batch.add(self.arena.acquire(CircleOutlineCommand, center, radius, color, width), layer)
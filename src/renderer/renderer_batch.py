@@ -1,29 +1,231 @@
 """
 Defines a batch renderer to optimize draw calls
 """
+import collections
+import itertools
+import operator
 import typing
 
-from .draw_protocol import DrawProtocol
+import gpu
+
+from . import gpu_state
+from .atlas_icon_command import AtlasIconCommand
+from .culling import ClipRect, CullStats, current_clip_rect, intersects
+from .draw_order import LAYER_BACKGROUND, LAYER_CONTENT, DrawKey, draw_key
+from .draw_protocol import BoundsProtocol, DrawProtocol, UnwrapProtocol
+from .flat_color_shader_command import FlatColorShaderCommand
+from .icon_atlas import IconAtlas
+from .instanced_rect_command import InstancedRectCommand
+from .mesh_builder import AtlasMeshBuilder, CompiledDraw, FlatColorMeshBuilder, SdfMeshBuilder
+from .sdf_shape_command import SdfShapeCommand
+
+if typing.TYPE_CHECKING:
+    from .frame_log import FrameLogWriter
+
+DEFAULT_BATCH_CACHE_BUDGET = 128
+
+
+class BatchCache:
+    """
+    Least-recently-used cache of built `GPUBatch` objects
+
+    Keys are taken from the command geometry and the shader, so unchanged
+    button backgrounds, outlines and icon quads reuse their vertex and index
+    buffers across frames instead of uploading them again.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BATCH_CACHE_BUDGET):
+        self.budget = max(budget, 1)
+        self.batches: collections.OrderedDict[typing.Hashable, gpu.types.GPUBatch] = collections.OrderedDict()
+
+    def get(
+        self,
+        key: typing.Hashable,
+        build: typing.Callable[[], gpu.types.GPUBatch],
+    ) -> gpu.types.GPUBatch:
+        """Return the cached batch for `key`, building it on a miss"""
+        batch = self.batches.get(key)
+        if batch is not None:
+            self.batches.move_to_end(key)
+            return batch
+
+        batch = build()
+        self.batches[key] = batch
+        self._evict()
+        return batch
+
+    def clear(self) -> None:
+        """Drop all cached batches"""
+        self.batches.clear()
+
+    def _evict(self) -> None:
+        while len(self.batches) > self.budget:
+            self.batches.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.batches)
 
 
 class RendererBatch:
     """
     Manages batched draw operations for performance
 
+    Every command gets a draw key `(layer, shader pass, texture)` and the list
+    is stable-sorted by it, so insertion order only matters within a key.
+    Each group is drawn once: FLAT_COLOR and SDF shapes are merged into one
+    mesh per group, atlas icons into one textured quad list per atlas, and
+    GPU state and shader binds are only issued when they change.
+
+    The draws of the last frame are kept as compiled steps; when the caller
+    passes the same `frame_key` again they are replayed without unwrapping
+    or merging anything.
+
+    Commands with bounds entirely outside `clip_rect` are culled before they
+    are unwrapped; `cull_stats` counts them.
+
+    While `frame_log` is set, every drawn frame is appended to it.
     """
 
     def __init__(self):
-        self.draw_calls: typing.List[typing.Any] = []
+        self.draw_calls: list[tuple[int, DrawProtocol]] = []
+        self.batch_cache = BatchCache()
+        self.mesh_builder = FlatColorMeshBuilder()
+        self.sdf_builder = SdfMeshBuilder(64, 32)
+        self.rect_instances = InstancedRectCommand()
+        self.atlas_builders: dict[IconAtlas, AtlasMeshBuilder] = {}
+        self.compiled: list[DrawProtocol] = []
+        self.compiled_key: typing.Hashable = None
+        self.clip_rect: ClipRect | None = None
+        self.cull_stats = CullStats()
+        self.frame_log: 'FrameLogWriter | None' = None
 
-    def add(self, draw_call: DrawProtocol):
+    def add(self, draw_call: DrawProtocol, layer: int = LAYER_CONTENT):
         """Add a draw call to the batch"""
 
-        self.draw_calls.append(draw_call)
+        self.draw_calls.append((layer, draw_call))
+
+    def add_rect_instance(
+        self,
+        rect: tuple[float, float, float, float],
+        fill_color: tuple[float, float, float, float],
+        outline_color: tuple[float, float, float, float],
+        opacity: float = 1.0,
+        outline_width: float = 1.0,
+        corner_radius: float = 0.0,
+    ):
+        """Add a rect to the instanced background rects"""
+        if len(self.rect_instances) == 0:
+            self.draw_calls.append((LAYER_BACKGROUND, self.rect_instances))
+        self.rect_instances.add(rect, fill_color, outline_color, opacity, outline_width, corner_radius)
+
+    def is_empty(self) -> bool:
+        return not self.draw_calls
+
+    def is_cached(self, frame_key: typing.Hashable) -> bool:
+        return frame_key is not None and (frame_key, self.clip_rect) == self.compiled_key
+
+    def update_clip_rect(self) -> None:
+        """Clip against the viewport that is bound now"""
+        self.clip_rect = current_clip_rect()
+
+    def draw(self, frame_key: typing.Hashable = None):
+        """
+        Execute all batched operations
+
+        With a `frame_key` equal to the previous one, the queued calls are
+        dropped and the previous frame's compiled draws are replayed.
+        """
 
-    def draw(self):
-        """Execute all batched operations"""
+        gpu_state.reset()
+        if self.is_cached(frame_key):
+            if self.frame_log is not None:
+                self.frame_log.write_repeat()
+            self.replay()
+            self.clear()
+            gpu_state.reset()
+            return
 
-        for draw_call in self.draw_calls:
-            draw_call.draw()
+        self.cull_stats.begin_frame()
+        entries: list[tuple[DrawKey, DrawProtocol]] = []
+        logged: list[tuple[int, DrawProtocol, DrawProtocol]] = []
+        for layer, draw_call in self.draw_calls:
+            if self._is_culled(draw_call):
+                continue
+            command = draw_call.unwrap() if isinstance(draw_call, UnwrapProtocol) else draw_call
+            entries.append((draw_key(layer, command), command))
+            if self.frame_log is not None:
+                logged.append((layer, draw_call, command))
+        entries.sort(key=operator.itemgetter(0))
+        if self.frame_log is not None:
+            self.frame_log.write_frame(logged)
 
+        self.compiled = []
+        used_atlases: set[IconAtlas] = set()
+        for _, group in itertools.groupby(entries, key=operator.itemgetter(0)):
+            self.compiled.extend(self._compile_group([command for _, command in group], used_atlases))
+        self._prune_atlas_builders(used_atlases)
+        self.compiled_key = None if frame_key is None else (frame_key, self.clip_rect)
+
+        self.replay()
+        self.clear()
+        gpu_state.reset()
+
+    def _is_culled(self, draw_call: DrawProtocol) -> bool:
+        clip_rect = self.clip_rect
+        if clip_rect is None:
+            return False
+        if isinstance(draw_call, InstancedRectCommand):
+            submitted = len(draw_call)
+            culled = draw_call.cull(clip_rect)
+            self.cull_stats.count(submitted, culled)
+            return len(draw_call) == 0
+        culled = isinstance(draw_call, BoundsProtocol) and not intersects(draw_call.bounds(), clip_rect)
+        self.cull_stats.count(1, int(culled))
+        return culled
+
+    def replay(self) -> None:
+        """Draw the compiled steps of the last frame again"""
+        for step in self.compiled:
+            step.draw(self.batch_cache)
+
+    def clear(self) -> None:
+        """Drop the queued draw calls without drawing them"""
         self.draw_calls.clear()
+        self.rect_instances.clear()
+
+    def _compile_group(self, commands: list[DrawProtocol], used_atlases: set[IconAtlas]) -> list[DrawProtocol]:
+        first = commands[0]
+        compiled: CompiledDraw | None
+        if isinstance(first, FlatColorShaderCommand):
+            self.mesh_builder.clear()
+            for command in commands:
+                self.mesh_builder.append_command(command)  # type: ignore
+            compiled = self.mesh_builder.compile(self.batch_cache)
+        elif isinstance(first, SdfShapeCommand):
+            self.sdf_builder.clear()
+            for command in commands:
+                self.sdf_builder.append_command(command)  # type: ignore
+            compiled = self.sdf_builder.compile(self.batch_cache)
+        elif isinstance(first, AtlasIconCommand):
+            builder = self._atlas_builder(first.atlas, used_atlases)
+            for command in commands:
+                builder.append_command(command)  # type: ignore
+            compiled = builder.compile(first.atlas.texture, self.batch_cache)
+        elif isinstance(first, InstancedRectCommand):
+            return [first.snapshot()]
+        else:
+            return commands
+        return [] if compiled is None else [compiled]
+
+    def _atlas_builder(self, atlas: IconAtlas, used_atlases: set[IconAtlas]) -> AtlasMeshBuilder:
+        builder = self.atlas_builders.get(atlas)
+        if builder is None:
+            builder = self.atlas_builders[atlas] = AtlasMeshBuilder(16, 8)
+        used_atlases.add(atlas)
+        builder.clear()
+        return builder
+
+    def _prune_atlas_builders(self, used_atlases: set[IconAtlas]) -> None:
+        for atlas in list(self.atlas_builders):
+            if atlas not in used_atlases:
+                del self.atlas_builders[atlas]
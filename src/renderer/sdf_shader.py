@@ -0,0 +1,127 @@
+"""
+Signed-distance-field shader for rects, rounded rects and rings.
+"""
+import typing
+
+if typing.TYPE_CHECKING:
+    import gpu
+
+SDF_INSTANCE_CAPACITY = 32
+SDF_INSTANCE_VECTORS = 4
+SDF_ANTIALIAS_MARGIN = 1.0
+
+_SDF_SHADER: 'gpu.types.GPUShader | None' = None
+_SDF_SHADER_FAILED = False
+_INSTANCED_SDF_SHADER: 'gpu.types.GPUShader | None' = None
+_INSTANCED_SDF_SHADER_FAILED = False
+
+SDF_VERTEX_SHADER = """
+    uniform mat4 ModelViewProjectionMatrix;
+    in vec2 pos;
+    in vec2 local;
+    in vec4 shape;
+    in vec4 fillColor;
+    in vec4 outlineColor;
+    out vec2 local_interp;
+    flat out vec4 shape_interp;
+    flat out vec4 fillColor_interp;
+    flat out vec4 outlineColor_interp;
+
+    void main()
+    {
+        local_interp = local;
+        shape_interp = shape;
+        fillColor_interp = fillColor;
+        outlineColor_interp = outlineColor;
+        gl_Position = ModelViewProjectionMatrix * vec4(pos.xy, 0.0, 1.0);
+    }
+"""
+INSTANCED_SDF_VERTEX_SHADER = f"""
+    uniform mat4 ModelViewProjectionMatrix;
+    uniform vec4 instances[{SDF_INSTANCE_CAPACITY * SDF_INSTANCE_VECTORS}];
+    in vec2 pos;
+    out vec2 local_interp;
+    flat out vec4 shape_interp;
+    flat out vec4 fillColor_interp;
+    flat out vec4 outlineColor_interp;
+
+    void main()
+    {{
+        int base = gl_InstanceID * {SDF_INSTANCE_VECTORS};
+        vec4 rect = instances[base];
+        vec4 fillColor = instances[base + 1];
+        vec4 outlineColor = instances[base + 2];
+        vec4 style = instances[base + 3];
+
+        vec2 half_size = rect.zw * 0.5;
+        vec2 extent = half_size + {SDF_ANTIALIAS_MARGIN:.1f};
+        local_interp = (pos * 2.0 - 1.0) * extent;
+        shape_interp = vec4(half_size, min(style.z, min(half_size.x, half_size.y)), style.y);
+        fillColor_interp = vec4(fillColor.rgb, fillColor.a * style.x);
+        outlineColor_interp = vec4(outlineColor.rgb, outlineColor.a * style.x);
+        gl_Position = ModelViewProjectionMatrix * vec4(rect.xy + half_size + local_interp, 0.0, 1.0);
+    }}
+"""
+SDF_FRAGMENT_SHADER = """
+    in vec2 local_interp;
+    flat in vec4 shape_interp;
+    flat in vec4 fillColor_interp;
+    flat in vec4 outlineColor_interp;
+    out vec4 fragColor;
+
+    float rounded_box_distance(vec2 point, vec2 half_size, float radius)
+    {
+        vec2 q = abs(point) - half_size + radius;
+        return length(max(q, 0.0)) + min(max(q.x, q.y), 0.0) - radius;
+    }
+
+    void main()
+    {
+        float dist = rounded_box_distance(local_interp, shape_interp.xy, shape_interp.z);
+        float aa = max(fwidth(dist) * 0.5, 1e-4);
+        float outer = 1.0 - smoothstep(-aa, aa, dist);
+        float inner = 1.0 - smoothstep(-aa, aa, dist + shape_interp.w);
+
+        vec4 fill = vec4(fillColor_interp.rgb * fillColor_interp.a, fillColor_interp.a) * inner;
+        vec4 outline = vec4(outlineColor_interp.rgb * outlineColor_interp.a, outlineColor_interp.a) * (outer - inner);
+        vec4 color = fill + outline;
+        if (color.a <= 0.0) {
+            discard;
+        }
+        fragColor = vec4(color.rgb / color.a, color.a);
+    }
+"""
+
+
+def get_sdf_shader() -> 'gpu.types.GPUShader | None':
+    """Create the shader that draws SDF shapes on one quad per primitive."""
+    global _SDF_SHADER, _SDF_SHADER_FAILED
+    if _SDF_SHADER_FAILED:
+        return None
+
+    if _SDF_SHADER is None:
+        import gpu
+        try:
+            _SDF_SHADER = gpu.types.GPUShader(SDF_VERTEX_SHADER, SDF_FRAGMENT_SHADER)
+        except Exception as ex:
+            _SDF_SHADER_FAILED = True
+            print(f"SDF shader disabled: {ex}")
+            return None
+    return _SDF_SHADER
+
+
+def get_instanced_sdf_shader() -> 'gpu.types.GPUShader | None':
+    """Create the shader that draws one SDF rect per instance of a unit quad."""
+    global _INSTANCED_SDF_SHADER, _INSTANCED_SDF_SHADER_FAILED
+    if _INSTANCED_SDF_SHADER_FAILED:
+        return None
+
+    if _INSTANCED_SDF_SHADER is None:
+        import gpu
+        try:
+            _INSTANCED_SDF_SHADER = gpu.types.GPUShader(INSTANCED_SDF_VERTEX_SHADER, SDF_FRAGMENT_SHADER)
+        except Exception as ex:
+            _INSTANCED_SDF_SHADER_FAILED = True
+            print(f"Instanced SDF shader disabled: {ex}")
+            return None
+    return _INSTANCED_SDF_SHADER
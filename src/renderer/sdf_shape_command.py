@@ -0,0 +1,62 @@
+"""
+Creates a command to draw a rect, rounded rect or ring with the SDF shader.
+"""
+import dataclasses
+import typing
+
+from .builtin_vertices import RectangleIndices, RectangleVertices
+from .draw_protocol import BoundsProtocol, DrawProtocol
+from .sdf_shader import SDF_ANTIALIAS_MARGIN
+
+if typing.TYPE_CHECKING:
+    from .renderer_batch import BatchCache
+
+
+@dataclasses.dataclass(slots=True)
+class SdfShapeCommand(DrawProtocol, BoundsProtocol):
+    """
+    One quad per primitive, shaded by a rounded-box distance field
+
+    - filled rect = `corner_radius` 0, `outline_width` 0
+    - outlined rect = `outline_width` > 0, drawn inside the shape edge
+    - rounded rect = `corner_radius` > 0
+    - ring = square `half_size` with `corner_radius` equal to it and a transparent fill
+    """
+    center: tuple[float, float]
+    half_size: tuple[float, float]
+    corner_radius: float = 0.0
+    outline_width: float = 0.0
+    fill_color: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+    outline_color: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        extent_x = self.half_size[0] + SDF_ANTIALIAS_MARGIN
+        extent_y = self.half_size[1] + SDF_ANTIALIAS_MARGIN
+        return (self.center[0] - extent_x, self.center[1] - extent_y, extent_x * 2.0, extent_y * 2.0)
+
+    def quad(self) -> tuple[dict[str, typing.Sequence[typing.Sequence[float]]], RectangleIndices]:
+        """Vertex attributes and indices of the quad, grown by the antialiasing margin"""
+        cx, cy = self.center
+        half_width, half_height = self.half_size
+        extent_x = half_width + SDF_ANTIALIAS_MARGIN
+        extent_y = half_height + SDF_ANTIALIAS_MARGIN
+        shape = (
+            half_width,
+            half_height,
+            min(self.corner_radius, half_width, half_height),
+            self.outline_width,
+        )
+        return {
+            "pos": RectangleVertices((cx - extent_x, cy - extent_y, extent_x * 2.0, extent_y * 2.0)),
+            "local": ((-extent_x, -extent_y), (extent_x, -extent_y), (extent_x, extent_y), (-extent_x, extent_y)),
+            "shape": (shape,) * 4,
+            "fillColor": (self.fill_color,) * 4,
+            "outlineColor": (self.outline_color,) * 4,
+        }, RectangleIndices()
+
+    def draw(self, batch_cache: 'BatchCache | None' = None):
+        """Draw the shape on its own; `RendererBatch` merges SDF shapes instead"""
+        from .mesh_builder import SdfMeshBuilder
+        builder = SdfMeshBuilder(4, 2)
+        builder.append_command(self)
+        builder.draw(batch_cache)
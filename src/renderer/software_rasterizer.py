@@ -0,0 +1,354 @@
+"""
+Headless NumPy backend that rasterizes draw commands into an RGBA framebuffer.
+"""
+import dataclasses
+import operator
+import typing
+
+import numpy
+
+from .atlas_icon_command import AtlasIconCommand
+from .culling import ClipRect, CullStats, intersects
+from .draw_order import LAYER_BACKGROUND, LAYER_CONTENT, DrawKey, draw_key
+from .draw_protocol import BoundsProtocol, DrawProtocol, UnwrapProtocol
+from .flat_color_shader_command import FlatColorShaderCommand
+from .image_render_command import ImageRenderCommand
+from .image_shader_command import ImageShaderCommand
+from .instanced_rect_command import INSTANCE_FLOATS, InstancedRectCommand
+from .sdf_shape_command import SdfShapeCommand
+
+if typing.TYPE_CHECKING:
+    from .frame_log import FrameLogWriter
+
+TextureSource = typing.Callable[[typing.Any], numpy.ndarray | None]
+
+
+@dataclasses.dataclass
+class RasterStats:
+    """Counters of one software frame"""
+    commands: int = 0
+    triangles: int = 0
+    fragments: int = 0
+    missing_textures: int = 0
+
+
+class SoftwareFramebuffer:
+    """
+    Straight-alpha RGBA float framebuffer with an overdraw counter
+
+    Rows go bottom to top like region pixels; pixel centers sit at `+0.5`.
+    Blending matches the GPU `ALPHA` mode.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.pixels = numpy.zeros((height, width, 4), dtype=numpy.float32)
+        self.overdraw = numpy.zeros((height, width), dtype=numpy.int32)
+
+    def clear(self, color: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)) -> None:
+        self.pixels[...] = color
+        self.overdraw[...] = 0
+
+    def region(
+        self,
+        x_min: float,
+        y_min: float,
+        x_max: float,
+        y_max: float,
+    ) -> tuple[slice, slice, numpy.ndarray, numpy.ndarray] | None:
+        """Pixel slices and pixel-center coordinates covering a bounding box, clamped to the framebuffer"""
+        x0 = max(int(numpy.floor(x_min)), 0)
+        y0 = max(int(numpy.floor(y_min)), 0)
+        x1 = min(int(numpy.ceil(x_max)), self.width)
+        y1 = min(int(numpy.ceil(y_max)), self.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        xs, ys = numpy.meshgrid(
+            numpy.arange(x0, x1, dtype=numpy.float32) + 0.5,
+            numpy.arange(y0, y1, dtype=numpy.float32) + 0.5,
+        )
+        return slice(y0, y1), slice(x0, x1), xs, ys
+
+    def blend(self, rows: slice, columns: slice, color: numpy.ndarray) -> int:
+        """Blend straight-alpha `color` over the pixels; returns the fragments written"""
+        alpha = color[..., 3:4]
+        covered = alpha[..., 0] > 0.0
+        target = self.pixels[rows, columns]
+        target[..., :3] = color[..., :3] * alpha + target[..., :3] * (1.0 - alpha)
+        target[..., 3:4] = alpha + target[..., 3:4] * (1.0 - alpha)
+        self.overdraw[rows, columns] += covered
+        return int(covered.sum())
+
+
+def _rounded_box_distance(
+    xs: numpy.ndarray,
+    ys: numpy.ndarray,
+    center: tuple[float, float],
+    half_size: tuple[float, float],
+    radius: float,
+) -> numpy.ndarray:
+    qx = numpy.abs(xs - center[0]) - half_size[0] + radius
+    qy = numpy.abs(ys - center[1]) - half_size[1] + radius
+    outside = numpy.hypot(numpy.maximum(qx, 0.0), numpy.maximum(qy, 0.0))
+    return outside + numpy.minimum(numpy.maximum(qx, qy), 0.0) - radius
+
+
+def _sample_nearest(texture: numpy.ndarray, u: numpy.ndarray, v: numpy.ndarray) -> numpy.ndarray:
+    height, width = texture.shape[0], texture.shape[1]
+    columns = numpy.clip((u * width).astype(numpy.int32), 0, width - 1)
+    rows = numpy.clip((v * height).astype(numpy.int32), 0, height - 1)
+    return texture[rows, columns]
+
+
+class SoftwareBatch:
+    """
+    Drop-in replacement for `RendererBatch` that draws on the CPU
+
+    Pass it to `Renderer(batch=...)` to run the UI without a GPU. Commands are
+    sorted with the same draw keys as the GPU batch; rects and circles are
+    drawn from their SDF description, FLAT_COLOR geometry as triangles and
+    images as textured quads. `texture_source` maps an image, atlas texture
+    or GPU texture to an RGBA float array (bottom row first).
+
+    While `frame_log` is set, every drawn frame is appended to it.
+    """
+
+    def __init__(self, width: int, height: int, texture_source: TextureSource | None = None) -> None:
+        self.framebuffer = SoftwareFramebuffer(width, height)
+        self.texture_source = texture_source or (lambda _source: None)
+        self.draw_calls: list[tuple[int, DrawProtocol]] = []
+        self.rect_instances = InstancedRectCommand()
+        self.clip_rect: ClipRect | None = None
+        self.cull_stats = CullStats()
+        self.stats = RasterStats()
+        self.batch_cache = None
+        self.frame_log: 'FrameLogWriter | None' = None
+
+    def add(self, draw_call: DrawProtocol, layer: int = LAYER_CONTENT):
+        self.draw_calls.append((layer, draw_call))
+
+    def add_rect_instance(
+        self,
+        rect: tuple[float, float, float, float],
+        fill_color: tuple[float, float, float, float],
+        outline_color: tuple[float, float, float, float],
+        opacity: float = 1.0,
+        outline_width: float = 1.0,
+        corner_radius: float = 0.0,
+    ):
+        if len(self.rect_instances) == 0:
+            self.draw_calls.append((LAYER_BACKGROUND, self.rect_instances))
+        self.rect_instances.add(rect, fill_color, outline_color, opacity, outline_width, corner_radius)
+
+    def is_empty(self) -> bool:
+        return not self.draw_calls
+
+    def is_cached(self, _frame_key: typing.Hashable) -> bool:
+        return False
+
+    def update_clip_rect(self) -> None:
+        self.clip_rect = (0.0, 0.0, float(self.framebuffer.width), float(self.framebuffer.height))
+
+    def clear(self) -> None:
+        self.draw_calls.clear()
+        self.rect_instances.clear()
+
+    def draw(self, _frame_key: typing.Hashable = None):
+        """Rasterize the queued commands over the current framebuffer contents"""
+        self.stats = RasterStats()
+        self.cull_stats.begin_frame()
+        entries: list[tuple[DrawKey, DrawProtocol]] = []
+        logged: list[tuple[int, DrawProtocol, DrawProtocol]] = []
+        for layer, draw_call in self.draw_calls:
+            culled = (
+                self.clip_rect is not None
+                and isinstance(draw_call, BoundsProtocol)
+                and not intersects(draw_call.bounds(), self.clip_rect)
+            )
+            self.cull_stats.count(1, int(culled))
+            if not culled:
+                command = self._resolve(draw_call)
+                entries.append((draw_key(layer, command), command))
+                if self.frame_log is not None:
+                    logged.append((layer, draw_call, command))
+        entries.sort(key=operator.itemgetter(0))
+        if self.frame_log is not None:
+            self.frame_log.write_frame(logged)
+
+        for _, command in entries:
+            self.stats.commands += 1
+            self._rasterize(command)
+        self.clear()
+
+    def _resolve(self, draw_call: DrawProtocol) -> DrawProtocol:
+        """Unwrap without touching the GPU: prefer SDF shapes, keep images for `texture_source`"""
+        if isinstance(draw_call, ImageRenderCommand):
+            return draw_call
+        sdf_shape = getattr(draw_call, "sdf_shape", None)
+        if sdf_shape is not None:
+            return sdf_shape()
+        if isinstance(draw_call, UnwrapProtocol):
+            return draw_call.unwrap()
+        return draw_call
+
+    def _rasterize(self, command: DrawProtocol) -> None:
+        if isinstance(command, SdfShapeCommand):
+            self._rasterize_sdf(
+                command.center,
+                command.half_size,
+                command.corner_radius,
+                command.outline_width,
+                command.fill_color,
+                command.outline_color,
+            )
+        elif isinstance(command, InstancedRectCommand):
+            self._rasterize_instances(command)
+        elif isinstance(command, FlatColorShaderCommand):
+            self._rasterize_flat_color(command)
+        elif isinstance(command, AtlasIconCommand):
+            u0, v0, u1, v1 = command.uv_rect
+            x, y, width, height = command.rect
+            self._rasterize_textured_quad(
+                self.texture_source(command.atlas.texture),
+                (x, y, x + width, y + height),
+                ((u0, v0), (u1, v0), (u1, v1), (u0, v1)),
+                command.opacity,
+            )
+        elif isinstance(command, ImageRenderCommand):
+            x, y, width, height = command.bounds()
+            self._rasterize_textured_quad(
+                self.texture_source(command.image),
+                (x, y, x + width, y + height),
+                ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)),
+                command.opacity,
+            )
+        elif isinstance(command, ImageShaderCommand):
+            xs = [position[0] for position in command.pos]  # type: ignore
+            ys = [position[1] for position in command.pos]  # type: ignore
+            self._rasterize_textured_quad(
+                self.texture_source(command.texture),
+                (min(xs), min(ys), max(xs), max(ys)),
+                tuple(command.tex_coord),  # type: ignore
+                command.opacity,
+            )
+
+    def _rasterize_sdf(
+        self,
+        center: tuple[float, float],
+        half_size: tuple[float, float],
+        corner_radius: float,
+        outline_width: float,
+        fill_color: typing.Sequence[float],
+        outline_color: typing.Sequence[float],
+        opacity: float = 1.0,
+    ) -> None:
+        region = self.framebuffer.region(
+            center[0] - half_size[0] - 1.0,
+            center[1] - half_size[1] - 1.0,
+            center[0] + half_size[0] + 1.0,
+            center[1] + half_size[1] + 1.0,
+        )
+        if region is None:
+            return
+        rows, columns, xs, ys = region
+
+        radius = min(corner_radius, half_size[0], half_size[1])
+        distance = _rounded_box_distance(xs, ys, center, half_size, radius)
+        outer = numpy.clip(0.5 - distance, 0.0, 1.0)[..., None]
+        inner = numpy.clip(0.5 - (distance + outline_width), 0.0, 1.0)[..., None]
+
+        fill = numpy.asarray(fill_color, dtype=numpy.float32)
+        outline = numpy.asarray(outline_color, dtype=numpy.float32)
+        fill_alpha = fill[3] * opacity * inner
+        outline_alpha = outline[3] * opacity * (outer - inner)
+        alpha = fill_alpha + outline_alpha
+        rgb = numpy.divide(
+            fill[:3] * fill_alpha + outline[:3] * outline_alpha,
+            alpha,
+            out=numpy.zeros(alpha.shape[:-1] + (3,), dtype=numpy.float32),
+            where=alpha > 0.0,
+        )
+        self.stats.fragments += self.framebuffer.blend(rows, columns, numpy.concatenate((rgb, alpha), axis=-1))
+
+    def _rasterize_instances(self, command: InstancedRectCommand) -> None:
+        for index in range(len(command)):
+            start = index * INSTANCE_FLOATS
+            record = command.values[start:start + INSTANCE_FLOATS]
+            x, y, width, height = record[0:4]
+            opacity, outline_width, corner_radius = record[12:15]
+            self._rasterize_sdf(
+                (x + width * 0.5, y + height * 0.5),
+                (width * 0.5, height * 0.5),
+                corner_radius,
+                outline_width,
+                record[4:8],
+                record[8:12],
+                opacity,
+            )
+
+    def _rasterize_flat_color(self, command: FlatColorShaderCommand) -> None:
+        positions = numpy.asarray(command.pos, dtype=numpy.float32)
+        colors = numpy.asarray(command.color, dtype=numpy.float32)
+        for triangle in command.indices:
+            self.stats.triangles += 1
+            corners = positions[list(triangle)]
+            weights = self._barycentric(corners)
+            if weights is None:
+                continue
+            rows, columns, inside, w = weights
+            color = numpy.einsum('hwk,kc->hwc', w, colors[list(triangle)])
+            color[~inside] = 0.0
+            self.stats.fragments += self.framebuffer.blend(rows, columns, color)
+
+    def _rasterize_textured_quad(
+        self,
+        texture: numpy.ndarray | None,
+        rect: tuple[float, float, float, float],
+        tex_coords: typing.Sequence[typing.Sequence[float]],
+        opacity: float,
+    ) -> None:
+        if texture is None:
+            self.stats.missing_textures += 1
+            return
+
+        x0, y0, x1, y1 = rect
+        corners = numpy.asarray(((x0, y0), (x1, y0), (x1, y1), (x0, y1)), dtype=numpy.float32)
+        uvs = numpy.asarray(tex_coords, dtype=numpy.float32)
+        for triangle in ((0, 1, 2), (2, 3, 0)):
+            self.stats.triangles += 1
+            weights = self._barycentric(corners[list(triangle)])
+            if weights is None:
+                continue
+            rows, columns, inside, w = weights
+            uv = numpy.einsum('hwk,kc->hwc', w, uvs[list(triangle)])
+            color = _sample_nearest(texture, uv[..., 0], uv[..., 1]).astype(numpy.float32)
+            color[..., 3] *= opacity
+            color[~inside] = 0.0
+            self.stats.fragments += self.framebuffer.blend(rows, columns, color)
+
+    def _barycentric(
+        self,
+        corners: numpy.ndarray,
+    ) -> tuple[slice, slice, numpy.ndarray, numpy.ndarray] | None:
+        """Barycentric weights of the pixel centers inside a triangle's bounding box"""
+        region = self.framebuffer.region(
+            float(corners[:, 0].min()),
+            float(corners[:, 1].min()),
+            float(corners[:, 0].max()),
+            float(corners[:, 1].max()),
+        )
+        if region is None:
+            return None
+        rows, columns, xs, ys = region
+
+        (ax, ay), (bx, by), (cx, cy) = corners
+        area = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        if area == 0.0:
+            return None
+        w0 = ((bx - xs) * (cy - ys) - (by - ys) * (cx - xs)) / area
+        w1 = ((cx - xs) * (ay - ys) - (cy - ys) * (ax - xs)) / area
+        w2 = 1.0 - w0 - w1
+        weights = numpy.stack((w0, w1, w2), axis=-1)
+        inside = (weights >= 0.0).all(axis=-1)
+        return rows, columns, inside, weights
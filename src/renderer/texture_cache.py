@@ -0,0 +1,149 @@
+"""
+Caches GPU textures created from Blender images.
+
+Entries are keyed by image pointer, name and reload counter, so a texture
+is created once per image and dropped as soon as the image is reloaded.
+Entries of freed images are dropped on the next depsgraph update that
+touches an image, and all entries before a file load. Draw commands
+receive the cached `GPUTexture` and never touch the `bpy.types.Image`
+again.
+"""
+import typing
+
+import bpy
+import gpu
+from bpy.app.handlers import persistent
+
+ImageKey = tuple[int, str, int]
+
+_MISSING = object()
+_entries: dict[typing.Hashable, tuple[frozenset[int], typing.Any]] = {}
+_reload_counts: dict[int, int] = {}
+_clear_callbacks: list[typing.Callable[[], None]] = []
+
+
+def image_key(image: bpy.types.Image) -> ImageKey:
+    """Return the `(pointer, name, reload counter)` key of `image`"""
+    pointer = image.as_pointer()
+    return (pointer, image.name, _reload_counts.get(pointer, 0))
+
+
+def get(
+    key: typing.Hashable,
+    image_keys: typing.Iterable[ImageKey],
+    build: typing.Callable[[], typing.Any],
+) -> typing.Any:
+    """
+    Return the cached value for `key`, building it on a miss
+
+    `image_keys` lists the images the value was created from, so reloading
+    or freeing any of them drops the entry.
+    """
+    entry = _entries.get(key, _MISSING)
+    if entry is not _MISSING:
+        return entry[1]  # type: ignore
+
+    value = build()
+    _entries[key] = (frozenset(pointer for pointer, _, _ in image_keys), value)
+    return value
+
+
+def texture_for_image(image: bpy.types.Image) -> gpu.types.GPUTexture | None:
+    """Return the GPU texture of `image`, creating it once"""
+    try:
+        key = image_key(image)
+    except ReferenceError:
+        return None
+    return get(('IMAGE', key), (key,), lambda: _create_texture(image))
+
+
+def _create_texture(image: bpy.types.Image) -> gpu.types.GPUTexture | None:
+    try:
+        image.gl_load()
+        return gpu.texture.from_image(image)
+    except (ReferenceError, RuntimeError) as ex:
+        print(f"Texture cache failed to load image: {ex}")
+        return None
+
+
+def invalidate(pointer: int) -> None:
+    """Mark the image at `pointer` as reloaded and drop every entry built from it"""
+    _reload_counts[pointer] = _reload_counts.get(pointer, 0) + 1
+    for key, (pointers, _) in list(_entries.items()):
+        if pointer in pointers:
+            del _entries[key]
+
+
+def drop_freed() -> None:
+    """Drop the entries and reload counters of images that are no longer in `bpy.data`"""
+    live_pointers = {image.as_pointer() for image in bpy.data.images}
+    freed = (_cached_pointers() | _reload_counts.keys()) - live_pointers
+    if not freed:
+        return
+    for key, (pointers, _) in list(_entries.items()):
+        if not pointers.isdisjoint(freed):
+            del _entries[key]
+    for pointer in freed:
+        _reload_counts.pop(pointer, None)
+
+
+def clear() -> None:
+    """Drop every cached texture, and let `on_clear` callbacks drop their image references"""
+    _entries.clear()
+    _reload_counts.clear()
+    for callback in _clear_callbacks:
+        callback()
+
+
+def on_clear(callback: typing.Callable[[], None]) -> None:
+    """Call `callback` whenever the cache is cleared, e.g. before a file load frees every image"""
+    if callback not in _clear_callbacks:
+        _clear_callbacks.append(callback)
+
+
+def _cached_pointers() -> set[int]:
+    pointers: set[int] = set()
+    for image_pointers, _ in _entries.values():
+        pointers |= image_pointers
+    return pointers
+
+
+@persistent
+def _on_load_pre(*_args: typing.Any) -> None:
+    # Loading a file frees every image, and their pointers can be reused.
+    clear()
+
+
+@persistent
+def _on_depsgraph_update_post(_scene: typing.Any, depsgraph: typing.Any) -> None:
+    if not _entries and not _reload_counts:
+        return
+
+    image_pointers = [
+        update.id.original.as_pointer() for update in depsgraph.updates if isinstance(update.id, bpy.types.Image)
+    ]
+    if not image_pointers:
+        # Transform steps and other edits send no image update; keep them free of image scans
+        return
+
+    # `bpy.data.images.remove` sends no update of its own; prune along with the next image change
+    drop_freed()
+    cached_pointers = _cached_pointers()
+    for pointer in image_pointers:
+        if pointer in cached_pointers:
+            invalidate(pointer)
+
+
+def register() -> None:
+    if _on_load_pre not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(_on_load_pre)
+    if _on_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_post)
+
+
+def unregister() -> None:
+    if _on_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_post)
+    if _on_load_pre in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_on_load_pre)
+    clear()
@@ -0,0 +1,34 @@
+"""
+Shared unit-circle tables and the adaptive segment count for tessellated circles.
+"""
+import functools
+import math
+
+CIRCLE_MIN_SEGMENTS = 12
+CIRCLE_MAX_SEGMENTS = 256
+CIRCLE_SEGMENT_STEP = 8
+CIRCLE_MAX_ERROR = 0.25
+UNIT_CIRCLE_CACHE_SIZE = 16
+
+
+def circle_segments(radius: float, scale: float = 1.0) -> int:
+    """
+    Segment count keeping the polygon within `CIRCLE_MAX_ERROR` pixels of the circle
+
+    `radius * scale` is the on-screen radius in pixels. The count is rounded up
+    to a multiple of `CIRCLE_SEGMENT_STEP` so nearby radii share one table.
+    """
+    screen_radius = radius * scale
+    if screen_radius <= CIRCLE_MAX_ERROR:
+        return CIRCLE_MIN_SEGMENTS
+
+    segments = math.ceil(math.pi / math.acos(1.0 - CIRCLE_MAX_ERROR / screen_radius))
+    segments = math.ceil(segments / CIRCLE_SEGMENT_STEP) * CIRCLE_SEGMENT_STEP
+    return min(max(segments, CIRCLE_MIN_SEGMENTS), CIRCLE_MAX_SEGMENTS)
+
+
+@functools.lru_cache(maxsize=UNIT_CIRCLE_CACHE_SIZE)
+def unit_circle(segments: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """`(cos, sin)` of `segments` evenly spaced angles, computed once per segment count"""
+    angles = [(index / segments) * math.tau for index in range(segments)]
+    return tuple(map(math.cos, angles)), tuple(map(math.sin, angles))
@@ -8,6 +8,12 @@ class DrawHandler:
 
     - `Space*.draw_handler_add()`
     - `Space*.draw_handler_remove()`
+    - `WindowManager.draw_cursor_add()` / `draw_cursor_remove()` with `cursor=True`
+
+    A cursor handler is drawn as a window paint cursor on top of the region's
+    cached pixels; the window redraws it on every cursor move, so pointer
+    updates do not need `area.tag_redraw()` and the editor (e.g. all 3D
+    scene geometry) is not rendered again.
     
     This is crucial for efficient script execution and avoiding memory leaks, especially in add-ons that dynamically add and remove drawing elements.
 
@@ -23,6 +29,7 @@ class DrawHandler:
         self.viewport_rects: tuple[tuple[int, int, int, int], ...] = ()
         self.region_data_pointer: int | None = None
         self.callback: typing.Optional[typing.Callable[..., None]] = None
+        self.cursor = False
 
     def _context_key(self, context: bpy.types.Context) -> tuple[int, int, int, int]:
         return (
@@ -127,23 +134,60 @@ class DrawHandler:
             self.region_data_pointer = None
 
     def _draw_callback(self, *args: typing.Any) -> None:
-        if not self.callback or not self._viewport_matches():
+        if not self.callback:
+            return
+        if self.cursor:
+            # Paint cursors also get the cursor `(x, y)` as a last argument
+            self._draw_cursor_callback(*args[:2])
+            return
+        if not self._viewport_matches():
             return
         self.callback(*args)
 
-    def add(self, context: bpy.types.Context, callback: typing.Callable[[typing.Any, bpy.types.Context], None]) -> None:
+    def _cursor_region_matches(self, region: bpy.types.Region) -> bool:
+        region_data_match = self._region_data_matches()
+        if region_data_match is not None:
+            return region_data_match
+        return self.context_key is None or int(region.as_pointer()) == self.context_key[3]
+
+    def _draw_cursor_callback(self, *args: typing.Any) -> None:
+        """Draw a paint cursor, which is drawn in window pixels, in region-local pixels"""
+        region = getattr(bpy.context, "region", None)
+        if region is None or self.callback is None:
+            return
+        try:
+            if not self._cursor_region_matches(region):
+                return
+            offset = (float(region.x), float(region.y))
+        except (AttributeError, ReferenceError, RuntimeError):
+            return
+        with gpu.matrix.push_pop():
+            gpu.matrix.translate(offset)
+            self.callback(*args)
+
+    def add(
+        self,
+        context: bpy.types.Context,
+        callback: typing.Callable[[typing.Any, bpy.types.Context], None],
+        cursor: bool = False,
+    ) -> None:
         """
         Add a draw handler if not already added
 
         https://docs.blender.org/api/current/bpy.types.Space.html#bpy.types.Space.draw_handler_add
+        https://docs.blender.org/api/current/bpy.types.WindowManager.html#bpy.types.WindowManager.draw_cursor_add
 
         Args:
             context (bpy.types.Context): The Blender context.
             callback (typing.Callable[[typing.Any, bpy.types.Context], None]): The draw callback function.
+            cursor (bool): Draw as a window paint cursor instead of in the region.
         """
         if context.space_data is None:
             return
 
+        if self.handler is not None and self.cursor != cursor:
+            self.remove()
+
         args = (self, context)
         space_type = type(context.space_data)
 
@@ -151,7 +195,12 @@ class DrawHandler:
             self.space_type = space_type
             self.update_context(context)
             self.callback = callback
-            self.handler = space_type.draw_handler_add(self._draw_callback, args, 'WINDOW', 'POST_PIXEL')
+            self.cursor = cursor
+            if cursor:
+                self.handler = bpy.types.WindowManager.draw_cursor_add(
+                    self._draw_callback, args, context.space_data.type, 'WINDOW')
+            else:
+                self.handler = space_type.draw_handler_add(self._draw_callback, args, 'WINDOW', 'POST_PIXEL')
         else:
             self.update_context(context)
             self.callback = callback
@@ -164,17 +213,40 @@ class DrawHandler:
         """
         if self.handler:
             try:
-                if self.space_type:
+                if self.cursor:
+                    bpy.types.WindowManager.draw_cursor_remove(self.handler)
+                elif self.space_type:
                     self.space_type.draw_handler_remove(self.handler, 'WINDOW')
             except (AttributeError, ReferenceError, ValueError):
                 pass
             self.handler = None
+            self.cursor = False
             self.space_type = None
             self.context_key = None
             self.viewport_rects = ()
             self.region_data_pointer = None
             self.callback = None
-            
+
+    def redraw_pointer(self, context: bpy.types.Context) -> None:
+        """Redraw after a cursor move; paint cursors are redrawn by the window itself"""
+        if not self.cursor:
+            force_redraw(context)
+
+    def redraw_region(self, region: bpy.types.Region | None) -> None:
+        """
+        Redraw the owner region after a change the cursor did not cause, e.g. a fade
+
+        Only the region is tagged, not its area. Paint cursors are not tagged
+        at all: that would render the region under them again, and the window
+        redraws them on the next cursor move anyway.
+        """
+        if self.cursor or region is None:
+            return
+        try:
+            region.tag_redraw()
+        except ReferenceError:
+            pass
+
 def force_redraw(context: bpy.types.Context) -> None:
     """Force redraw of the 3D view"""
     if context.area:
@@ -0,0 +1,35 @@
+import typing
+
+
+class RedrawFilter:
+    """
+    Skips region redraws that would not change what is on screen
+
+    Event handlers describe the visual state with a hashable signature
+    (positions rounded to pixels, opacity in percent, hovered and active ids,
+    ...). `needs_redraw` only asks for a redraw when the signature differs from
+    the last drawn one and from the one a redraw is already pending for;
+    `skipped` counts the requests that were dropped.
+    """
+
+    def __init__(self) -> None:
+        self.drawn: typing.Hashable | None = None
+        self.requested: typing.Hashable | None = None
+        self.skipped = 0
+
+    def needs_redraw(self, signature: typing.Hashable) -> bool:
+        if signature == self.drawn or signature == self.requested:
+            self.skipped += 1
+            return False
+        self.requested = signature
+        return True
+
+    def mark_drawn(self, signature: typing.Hashable) -> None:
+        """Record the signature of the state the draw callback just drew"""
+        self.drawn = signature
+        self.requested = None
+
+    def invalidate(self) -> None:
+        """Forget the drawn state, e.g. when a draw callback bailed out early"""
+        self.drawn = None
+        self.requested = None
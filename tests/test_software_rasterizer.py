@@ -0,0 +1,90 @@
+"""
+Rasterizes puck-style frames with the NumPy backend; runs without Blender.
+
+Run with `python -m pytest tests` from the add-on root.
+"""
+import numpy
+
+from src.renderer.circle_outline_command import CircleOutlineCommand
+from src.renderer.draw_order import LAYER_OVERLAY
+from src.renderer.frame_log import FrameLogReader, FrameLogWriter, replay_frame
+from src.renderer.rect_outline_command import RectOutlineCommand
+from src.renderer.software_rasterizer import SoftwareBatch
+
+BUTTON_FILL = (0.2, 0.4, 0.8, 1.0)
+BUTTON_OUTLINE = (1.0, 1.0, 1.0, 1.0)
+RING_COLOR = (1.0, 0.5, 0.0, 1.0)
+MENU_FILL = (0.1, 0.1, 0.1, 1.0)
+
+
+def queue_puck_frame(batch: SoftwareBatch) -> None:
+    """Two buttons, the puck ring and a menu background drawn over them"""
+    batch.add_rect_instance((10.0, 10.0, 30.0, 30.0), BUTTON_FILL, BUTTON_OUTLINE, outline_width=2.0, corner_radius=4.0)
+    batch.add_rect_instance((60.0, 10.0, 30.0, 30.0), BUTTON_FILL, BUTTON_OUTLINE, outline_width=2.0)
+    batch.add(CircleOutlineCommand((50.0, 70.0), 20.0, RING_COLOR, width=4.0))
+    batch.add(RectOutlineCommand((60.0, 50.0, 30.0, 30.0), BUTTON_OUTLINE, MENU_FILL, 1.0), LAYER_OVERLAY)
+    batch.add(RectOutlineCommand((200.0, 200.0, 10.0, 10.0)))
+
+
+def pixel(batch: SoftwareBatch, x: int, y: int) -> numpy.ndarray:
+    return batch.framebuffer.pixels[y, x]
+
+
+def test_puck_frame_pixels_and_stats():
+    batch = SoftwareBatch(100, 100)
+    batch.update_clip_rect()
+    queue_puck_frame(batch)
+    batch.draw()
+
+    numpy.testing.assert_allclose(pixel(batch, 25, 25), BUTTON_FILL, atol=1e-5)
+    numpy.testing.assert_allclose(pixel(batch, 75, 25), BUTTON_FILL, atol=1e-5)
+    numpy.testing.assert_allclose(pixel(batch, 10, 25), BUTTON_OUTLINE, atol=1e-5)
+    numpy.testing.assert_allclose(pixel(batch, 50, 88), RING_COLOR, atol=1e-5)
+    assert pixel(batch, 50, 70)[3] == 0.0
+    assert pixel(batch, 50, 95)[3] == 0.0
+    # The overlay layer draws over the ring where they overlap
+    numpy.testing.assert_allclose(pixel(batch, 68, 65), MENU_FILL, atol=1e-5)
+
+    assert batch.stats.commands == 3
+    assert batch.stats.fragments > 0
+    assert batch.cull_stats.submitted == 4
+    assert batch.cull_stats.culled == 1
+    assert batch.is_empty()
+
+
+def test_frame_log_replays_the_same_pixels(tmp_path):
+    path = str(tmp_path / "puck.npfl")
+    batch = SoftwareBatch(100, 100)
+    batch.update_clip_rect()
+    batch.frame_log = FrameLogWriter(path)
+    queue_puck_frame(batch)
+    batch.draw()
+    batch.frame_log.close()
+
+    reader = FrameLogReader(path)
+    frames = list(reader.frames())
+    assert len(frames) == 1
+
+    replayed = SoftwareBatch(100, 100)
+    replay_frame(frames[0], replayed)
+    numpy.testing.assert_allclose(replayed.framebuffer.pixels, batch.framebuffer.pixels, atol=1e-5)
+    # Records view the mapping, so they go before the reader closes it
+    frames.clear()
+    reader.close()
+
+
+def test_frame_log_skips_a_truncated_final_frame(tmp_path):
+    path = str(tmp_path / "puck.npfl")
+    batch = SoftwareBatch(100, 100)
+    batch.frame_log = FrameLogWriter(path)
+    for _ in range(2):
+        queue_puck_frame(batch)
+        batch.draw()
+    batch.frame_log.close()
+    batch.frame_log.close()
+
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 8)
+    reader = FrameLogReader(path)
+    assert [frame.index for frame in reader.frames()] == [0]
+    reader.close()